@@ -29,6 +29,7 @@ def ATOMModel(
     acronym: str = None,
     fullname: str = None,
     needs_scaling: bool = False,
+    accepts_sparse: bool = False,
 ):
     """Convert an estimator to a model that can be ingested by ATOM.
 
@@ -52,6 +53,11 @@ def ATOMModel(
         Whether the model needs scaled features. Can not be True for
         deep learning datasets.
 
+    accepts_sparse: bool, optional (default=False)
+        Whether the estimator accepts sparse matrices. If False,
+        sparse data sets are converted to dense ones before being
+        passed to the estimator.
+
     Returns
     -------
     estimator: sklearn estimator
@@ -65,6 +71,7 @@ def ATOMModel(
     if fullname:
         estimator.fullname = fullname
     estimator.needs_scaling = needs_scaling
+    estimator.accepts_sparse = accepts_sparse
 
     return estimator
 
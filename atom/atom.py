@@ -14,6 +14,7 @@ import pandas as pd
 from scipy import stats
 from copy import deepcopy
 from inspect import signature
+from collections.abc import Iterator
 from joblib.memory import Memory
 from typeguard import typechecked
 from typing import Union, Optional, Any, Dict
@@ -44,6 +45,8 @@ from .feature_engineering import (
 from .training import (
     DirectClassifier,
     DirectRegressor,
+    HyperbandClassifier,
+    HyperbandRegressor,
     SuccessiveHalvingClassifier,
     SuccessiveHalvingRegressor,
     TrainSizingClassifier,
@@ -55,8 +58,8 @@ from .utils import (
     SCALAR, SEQUENCE_TYPES, X_TYPES, Y_TYPES, DISTRIBUTIONS, flt,
     lst, divide, infer_task, check_dim, check_scaling, is_multidim,
     get_pl_name, names_from_estimator, check_is_fitted, variable_return,
-    fit_one, delete, custom_transform, method_to_log, composed, crash,
-    Table, CustomDict,
+    fit_one, delete, merge, custom_transform, stream_chunks, method_to_log,
+    composed, crash, Table, CustomDict,
 )
 
 
@@ -705,19 +708,24 @@ class ATOM(BasePredictor, ATOMPlotter):
     @composed(crash, method_to_log, typechecked)
     def transform(
         self,
-        X: X_TYPES,
+        X: Union[str, X_TYPES],
         y: Optional[Y_TYPES] = None,
         verbose: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        filename: Optional[str] = None,
     ):
         """Transform new data through the branch.
 
         Transformers that are only applied on the training set are
-        skipped.
+        skipped. Large datasets can be streamed through the branch
+        in chunks.
 
         Parameters
         ----------
-        X: dataframe-like
-            Feature set with shape=(n_samples, n_features).
+        X: str, dataframe-like or iterator
+            Feature set with shape=(n_samples, n_features). If the
+            data is streamed, also the path to a csv or parquet file
+            or an iterator of feature sets.
 
         y: int, str, sequence or None, optional (default=None)
             - If None: y is ignored in the transformers.
@@ -731,6 +739,18 @@ class ATOM(BasePredictor, ATOMPlotter):
             Verbosity level for the transformers. If None, it uses the
             estimator's own verbosity.
 
+        chunksize: int or None, optional (default=None)
+            Number of rows per chunk to stream the data through the
+            branch. If not None, X can also be the path to a csv or
+            parquet file and y can only be None or a column in X.
+            Iterators of chunks in X are always streamed. Up to
+            n_jobs chunks are transformed in parallel.
+
+        filename: str or None, optional (default=None)
+            Name of the csv or parquet file to write the streamed
+            data to. If None, a generator with the transformed data
+            per chunk is returned. Only if the data is streamed.
+
         Returns
         -------
         X: pd.DataFrame
@@ -740,11 +760,33 @@ class ATOM(BasePredictor, ATOMPlotter):
             Transformed target column. Only returned if provided.
 
         """
-        for transformer in self.pipeline:
-            if not transformer._train_only:
-                X, y = custom_transform(transformer, self.branch, (X, y), verbose)
 
-        return variable_return(X, y)
+        def transform_data(X, y):
+            """Transform the data (or a chunk) through the branch."""
+            for transformer in self.pipeline:
+                if not transformer._train_only:
+                    X, y = custom_transform(transformer, self.branch, (X, y), verbose)
+
+            return X, y
+
+        if chunksize is not None or isinstance(X, Iterator):
+            if y is not None and not isinstance(y, (int, str)):
+                raise ValueError(
+                    "Invalid value for the y parameter. When streaming the data, "
+                    f"y should be None or a column in X, got {type(y).__name__}."
+                )
+
+            def transform_chunk(chunk):
+                """Transform a chunk. Function for parallelization."""
+                X_chunk, y_chunk = transform_data(*self._prepare_input(chunk, y))
+                if filename is None:
+                    return variable_return(X_chunk, y_chunk)
+                else:
+                    return X_chunk if y_chunk is None else merge(X_chunk, y_chunk)
+
+            return stream_chunks(transform_chunk, X, chunksize, filename, self.n_jobs)
+
+        return variable_return(*transform_data(X, y))
 
     # Base transformers ============================================ >>
 
@@ -1072,6 +1114,7 @@ class ATOM(BasePredictor, ATOMPlotter):
         max_onehot: Optional[int] = 10,
         ordinal: Optional[Dict[Union[int, str], SEQUENCE_TYPES]] = None,
         frac_to_other: Optional[SCALAR] = None,
+        return_sparse: bool = False,
         **kwargs,
     ):
         """Perform encoding of categorical features.
@@ -1099,6 +1142,7 @@ class ATOM(BasePredictor, ATOMPlotter):
             max_onehot=max_onehot,
             ordinal=ordinal,
             frac_to_other=frac_to_other,
+            return_sparse=return_sparse,
             **kwargs,
         )
 
@@ -1272,6 +1316,7 @@ class ATOM(BasePredictor, ATOMPlotter):
         custom_stopwords: Optional[SEQUENCE_TYPES] = None,
         stem: Union[bool, str] = False,
         lemmatize: bool = True,
+        cache_size: Optional[int] = 100000,
         **kwargs,
     ):
         """Normalize the corpus.
@@ -1291,13 +1336,19 @@ class ATOM(BasePredictor, ATOMPlotter):
             custom_stopwords=custom_stopwords,
             stem=stem,
             lemmatize=lemmatize,
+            cache_size=cache_size,
             **kwargs,
         )
 
         self._add_transformer(normalizer)
 
     @composed(crash, method_to_log, typechecked)
-    def vectorize(self, strategy: str = "BOW", **kwargs):
+    def vectorize(
+        self,
+        strategy: str = "BOW",
+        return_sparse: bool = False,
+        **kwargs,
+    ):
         """Vectorize the corpus.
 
         Transform the corpus into meaningful vectors of numbers. The
@@ -1309,7 +1360,11 @@ class ATOM(BasePredictor, ATOMPlotter):
         """
         check_dim(self, "normalize")
         kwargs = self._prepare_kwargs(kwargs, Vectorizer().get_params())
-        vectorizer = Vectorizer(strategy=strategy, **kwargs)
+        vectorizer = Vectorizer(
+            strategy=strategy,
+            return_sparse=return_sparse,
+            **kwargs,
+        )
 
         self._add_transformer(vectorizer)
 
@@ -1546,6 +1601,8 @@ class ATOM(BasePredictor, ATOMPlotter):
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         **kwargs,
     ):
         """Fit the models in a direct fashion.
@@ -1561,7 +1618,8 @@ class ATOM(BasePredictor, ATOMPlotter):
 
         params = (
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
+            n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+            parallel,
         )
 
         kwargs = self._prepare_kwargs(kwargs)
@@ -1581,11 +1639,15 @@ class ATOM(BasePredictor, ATOMPlotter):
         needs_proba: Union[bool, SEQUENCE_TYPES] = False,
         needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
         skip_runs: int = 0,
+        warm_start: bool = False,
+        resource: str = "samples",
         n_calls: Union[int, SEQUENCE_TYPES] = 0,
         n_initial_points: Union[int, SEQUENCE_TYPES] = 5,
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         **kwargs,
     ):
         """Fit the models in a successive halving fashion.
@@ -1598,7 +1660,8 @@ class ATOM(BasePredictor, ATOMPlotter):
         performance can depend greatly on the amount of data on which
         it is trained. For this reason, it is recommended to only use
         this technique with similar models, e.g. only using tree-based
-        models.
+        models. Instead of the fraction of the data, the budget can also
+        be the number of iterations the models are trained for.
 
         See the basetrainer.py module for a description of the parameters.
 
@@ -1607,7 +1670,8 @@ class ATOM(BasePredictor, ATOMPlotter):
 
         params = (
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            skip_runs, n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
+            skip_runs, warm_start, resource, n_calls, n_initial_points, est_params,
+            bo_params, n_bootstrap, oob_score, parallel,
         )
 
         kwargs = self._prepare_kwargs(kwargs)
@@ -1618,6 +1682,52 @@ class ATOM(BasePredictor, ATOMPlotter):
 
         self._run(trainer)
 
+    @composed(crash, method_to_log, typechecked)
+    def hyperband(
+        self,
+        models: Union[str, callable, SEQUENCE_TYPES],
+        metric: Optional[Union[str, callable, SEQUENCE_TYPES]] = None,
+        greater_is_better: Union[bool, SEQUENCE_TYPES] = True,
+        needs_proba: Union[bool, SEQUENCE_TYPES] = False,
+        needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
+        eta: int = 3,
+        min_resource: float = 0.1,
+        resource: str = "samples",
+        sampler: str = "random",
+        est_params: Optional[dict] = None,
+        bo_params: Optional[dict] = None,
+        n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
+        **kwargs,
+    ):
+        """Tune and fit the models with the hyperband algorithm.
+
+        The hyperparameters of every model are tuned running several
+        brackets of successive halving over configurations sampled
+        from the model's hyperparameter space, at random or from a
+        density model (BOHB). Every model is then fitted on the
+        complete training set with the best configuration found.
+
+        See the basetrainer.py module for a description of the parameters.
+
+        """
+        metric = self._check(metric, greater_is_better, needs_proba, needs_threshold)
+
+        params = (
+            models, metric, greater_is_better, needs_proba, needs_threshold,
+            eta, min_resource, resource, sampler, est_params, bo_params, n_bootstrap,
+            oob_score, parallel,
+        )
+
+        kwargs = self._prepare_kwargs(kwargs)
+        if self.goal == "class":
+            trainer = HyperbandClassifier(*params, **kwargs)
+        else:
+            trainer = HyperbandRegressor(*params, **kwargs)
+
+        self._run(trainer)
+
     @composed(crash, method_to_log, typechecked)
     def train_sizing(
         self,
@@ -1627,11 +1737,14 @@ class ATOM(BasePredictor, ATOMPlotter):
         needs_proba: Union[bool, SEQUENCE_TYPES] = False,
         needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
         train_sizes: Union[int, SEQUENCE_TYPES] = 5,
+        warm_start: bool = False,
         n_calls: Union[int, SEQUENCE_TYPES] = 0,
         n_initial_points: Union[int, SEQUENCE_TYPES] = 5,
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         **kwargs,
     ):
         """Fit the models in a train sizing fashion.
@@ -1651,7 +1764,8 @@ class ATOM(BasePredictor, ATOMPlotter):
 
         params = (
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            train_sizes, n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
+            train_sizes, warm_start, n_calls, n_initial_points, est_params, bo_params,
+            n_bootstrap, oob_score, parallel,
         )
 
         kwargs = self._prepare_kwargs(kwargs)
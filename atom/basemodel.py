@@ -16,6 +16,9 @@ import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from copy import deepcopy
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from inspect import signature
 from datetime import datetime
 from pickle import PickleError
@@ -23,18 +26,24 @@ from typeguard import typechecked
 from typing import Optional, Union
 from joblib import Parallel, delayed
 from joblib.memory import Memory
+from joblib.externals.loky import get_reusable_executor
 from mlflow.tracking import MlflowClient
 
 # Sklearn
 from sklearn.base import clone
-from sklearn.utils import resample
+from sklearn.utils import resample, check_random_state
 from sklearn.model_selection import KFold, StratifiedKFold
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.model_selection import StratifiedShuffleSplit, ShuffleSplit
 
 # Others
-from skopt.utils import use_named_args
+from skopt.space import Space
+from skopt.callbacks import check_callback
+from skopt.utils import (
+    use_named_args, cook_estimator, normalize_dimensions, eval_callbacks,
+)
 from skopt.optimizer import (
+    Optimizer,
     base_minimize,
     gp_minimize,
     forest_minimize,
@@ -46,25 +55,32 @@ from .data_cleaning import Scaler
 from .pipeline import Pipeline
 from .plots import BaseModelPlotter
 from .utils import (
-    SEQUENCE_TYPES, X_TYPES, Y_TYPES, DF_ATTRS, flt, lst, it, arr,
-    merge, time_to_str, get_best_score, get_custom_scorer, get_pl_name,
+    SEQUENCE_TYPES, X_TYPES, Y_TYPES, DF_ATTRS, flt, lst, it, arr, is_sparse,
+    merge, time_to_str, get_best_score, get_custom_scorer, get_scores,
+    get_pl_name, stream_chunks,
     variable_return, custom_transform, composed, crash, method_to_log,
-    score_decorator, Table, ShapExplanation, CustomDict,
+    score_decorator, Table, TrialRecord, ShapExplanation, CustomDict,
+    CompiledPredictor,
 )
 
 
 class BaseModel(BaseModelPlotter):
     """Base class for all models."""
 
+    resource = None  # Parameter that sets the number of iterations
+    accepts_sparse = False  # Whether the estimator accepts sparse matrices
+
     def __init__(self, *args):
         self.T = args[0]  # Trainer instance
         self.name = self.acronym if len(args) == 1 else args[1]
         self.scaler = None
         self.estimator = None
+        self.cache_scaled = True
 
         self._run = None  # mlflow run (if experiment is active)
         self._group = self.name  # sh and ts models belong to the same group
         self._pred = [None] * 15
+        self._scaled = {}  # Cached scaled data sets
         self._scores = CustomDict(
             train=CustomDict(),
             test=CustomDict(),
@@ -78,9 +94,8 @@ class BaseModel(BaseModelPlotter):
         self._stopped = ("---", "---")
         self._early_stopping = None
         self._dimensions = []
-        self.bo = pd.DataFrame(
-            columns=["call", "params", "model", "score", "time", "total_time"],
-        )
+        self._trials = TrialRecord()
+        self._warm_start = None  # Model of the previous run (sh and ts)
 
         # Parameter attributes
         self._n_calls = 0
@@ -97,6 +112,9 @@ class BaseModel(BaseModelPlotter):
         self.metric_bootstrap = None
         self.mean_bootstrap = None
         self.std_bootstrap = None
+        self.metric_oob = None
+        self.mean_oob = None
+        self.std_oob = None
         self.time_bootstrap = None
         self.time = None
 
@@ -104,8 +122,11 @@ class BaseModel(BaseModelPlotter):
         if hasattr(self.T, "_branches"):
             self.branch = self.T.branch
             self._train_idx = len(self.branch.idx[0])  # Can change for sh and ts
+            self._n_models = 1  # Number of models in the sh run
+            # Centering sparse data would make it dense
             if getattr(self, "needs_scaling", None) and not self.T.scaled:
-                self.scaler = Scaler().fit(self.X_train)
+                if not is_sparse(self.branch._X):
+                    self.scaler = Scaler().fit(self._X_train)
 
     def __repr__(self):
         out_1 = f"{self.fullname}\n --> Estimator: {self.estimator.__class__.__name__}"
@@ -139,6 +160,10 @@ class BaseModel(BaseModelPlotter):
                 "only subscriptable with types str or list."
             )
 
+    def _arr(self, df):
+        """Convert a dataframe to the input format of the estimator."""
+        return arr(df, self.accepts_sparse)
+
     def _check_est_params(self):
         """Make sure the parameters are valid keyword argument for the estimator."""
         signature_init = signature(self.est_class.__init__).parameters
@@ -192,94 +217,275 @@ class BaseModel(BaseModelPlotter):
         """Return the default values of the model's hyperparameters."""
         return [value[0] for value in self.params.values()]
 
+    def get_warm_start(self, est, n_prev, n):
+        """Return an estimator that continues training from a fitted one.
+
+        Default implementation for estimators with a warm_start
+        parameter, where the resource is the total number of
+        iterations. The fitted estimator is copied, so it's not
+        altered.
+
+        Parameters
+        ----------
+        est: estimator
+            Fitted estimator of the previous run.
+
+        n_prev: int
+            Value of the resource parameter of est.
+
+        n: int
+            Value of the resource parameter for this run.
+
+        Returns
+        -------
+        estimator: estimator
+            Estimator to fit.
+
+        params: dict
+            Additional parameters for the fit method.
+
+        """
+        est = deepcopy(est)
+        est.set_params(warm_start=True, **{self.resource: n})
+        return est, {}
+
+    def _get_fold(self, train_idx, val_idx):
+        """Get the transformed (sub)train and validation set.
+
+        The sets are created from the original dataset to avoid
+        data leakage since the training set is transformed using
+        the pipeline fitted on the same set. If `fixed_splits`,
+        the transformed sets are stored in the trainer's fold
+        cache, to be reused by the next calls and models.
+
+        Parameters
+        ----------
+        train_idx: list
+            Indices for the subtrain set.
+
+        val_idx: list
+            Indices for the validation set.
+
+        Returns
+        -------
+        fold: tuple
+            Subtrain features, subtrain target, validation features
+            and validation target.
+
+        """
+        cache = self.T._fold_cache
+        key = (
+            self.branch.name,
+            len(self.branch.pipeline),
+            bool(self.scaler),
+            np.asarray(train_idx).tobytes(),
+            np.asarray(val_idx).tobytes(),
+        )
+        if self.T._bo["fixed_splits"] and key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        # Define subsets from original dataset
+        X_subtrain = self.T.og.dataset.iloc[train_idx, :-1]
+        y_subtrain = self.T.og.dataset.iloc[train_idx, -1]
+        X_val = self.T.og.dataset.iloc[val_idx, :-1]
+        y_val = self.T.og.dataset.iloc[val_idx, -1]
+
+        # Transform subsets if there is a pipeline
+        pl = self.export_pipeline(verbose=0)
+        if len(pl) > 1:
+            pl = pl[:-1]  # Drop the estimator
+            X_subtrain, y_subtrain = pl.fit_transform(X_subtrain, y_subtrain)
+            X_val, y_val = pl.transform(X_val, y_val)
+
+        fold = (X_subtrain, y_subtrain, X_val, y_val)
+        if self.T._bo["fixed_splits"]:
+            cache[key] = fold
+            if len(cache) > self.T._bo["cache_size"]:
+                cache.popitem(last=False)  # Drop the least recently used
+
+        return fold
+
     def bayesian_optimization(self):
         """Run the bayesian optimization algorithm.
 
         Search for the best combination of hyperparameters. The
         function to optimize is evaluated either with a K-fold
         cross-validation on the training set or using a different
-        split for train and validation set every iteration.
+        split for train and validation set every iteration. If
+        `batch_size>1`, multiple points are evaluated asynchronously
+        and every result is told to the optimizer as it completes.
 
         """
 
-        def optimize(**params):
-            """Optimization function for the BO.
+        def fit_model(est, train_idx, val_idx, fold=None):
+            """Fit the model. Function for parallelization.
+
+            Fit the model on custom_fit if exists, else normally.
+            Return the score on the validation set.
 
             Parameters
             ----------
-            params: dict
-               Model's hyperparameters used in this call of the BO.
+            est: estimator
+                Estimator instance to fit.
+
+            train_idx: list
+                Indices for the subtrain set.
+
+            val_idx: list
+                Indices for the validation set.
+
+            fold: tuple or None, optional (default=None)
+                Transformed (sub)train and validation set. If None,
+                the sets are created with `get_fold`.
 
             Returns
             -------
             score: float
-                Score achieved by the model.
+                Score of the fitted model on the validation set.
 
             """
+            X_subtrain, y_subtrain, X_val, y_val = (
+                fold or self._get_fold(train_idx, val_idx)
+            )
 
-            def fit_model(train_idx, val_idx):
-                """Fit the model. Function for parallelization.
-
-                Divide the training set in a (sub) train and validation
-                set for this fit. The sets are created from the original
-                dataset to avoid data leakage since the training set is
-                transformed using the pipeline fitted on the same set.
-                Fit the model on custom_fit if exists, else normally.
-                Return the score on the validation set.
-
-                Parameters
-                ----------
-                train_idx: list
-                    Indices for the subtrain set.
-
-                val_idx: list
-                    Indices for the validation set.
-
-                Returns
-                -------
-                score: float
-                    Score of the fitted model on the validation set.
-
-                """
-                # Define subsets from original dataset
-                X_subtrain = self.T.og.dataset.iloc[train_idx, :-1]
-                y_subtrain = self.T.og.dataset.iloc[train_idx, -1]
-                X_val = self.T.og.dataset.iloc[val_idx, :-1]
-                y_val = self.T.og.dataset.iloc[val_idx, -1]
-
-                # Transform subsets if there is a pipeline
-                pl = self.export_pipeline(verbose=0)
-                if len(pl) > 1:
-                    pl = pl[:-1]  # Drop the estimator
-                    X_subtrain, y_subtrain = pl.fit_transform(X_subtrain, y_subtrain)
-                    X_val, y_val = pl.transform(X_val, y_val)
-
-                # Match the sample_weights with the length of the subtrain set
-                # Make copy of est_params to not alter the mutable variable
-                est_copy = self._est_params_fit.copy()
-                if "sample_weight" in est_copy:
-                    est_copy["sample_weight"] = [
-                        self._est_params_fit["sample_weight"][i] for i in train_idx
-                    ]
-
-                if hasattr(self, "custom_fit"):
-                    self.custom_fit(
-                        est=est,
-                        train=(X_subtrain, y_subtrain),
-                        validation=(X_val, y_val),
-                        params=est_copy,
-                    )
+            # Match the sample_weights with the length of the subtrain set
+            # Make copy of est_params to not alter the mutable variable
+            est_copy = self._est_params_fit.copy()
+            if "sample_weight" in est_copy:
+                est_copy["sample_weight"] = [
+                    self._est_params_fit["sample_weight"][i] for i in train_idx
+                ]
+
+            if hasattr(self, "custom_fit"):
+                self.custom_fit(
+                    est=est,
+                    train=(self._arr(X_subtrain), y_subtrain),
+                    validation=(self._arr(X_val), y_val),
+                    params=est_copy,
+                )
+            else:
+                est.fit(self._arr(X_subtrain), y_subtrain, **est_copy)
+
+            # Calculate metrics on the validation set
+            return [m(est, self._arr(X_val), y_val) for m in self.T._metric.values()]
+
+        def get_folds():
+            """Get the (sub)train and validation indices for this call.
+
+            Returns
+            -------
+            folds: list of tuples
+                Indices of the (sub)train and validation set per fold.
+
+            """
+            # Same splits per model, but different per call (if not fixed)
+            rs = 0 if self.T._bo["fixed_splits"] else self._iter
+            if self.T.random_state is not None:
+                rs += self.T.random_state
+
+            if self.T._bo["cv"] == 1:
+                if self.T.goal == "class":
+                    split = StratifiedShuffleSplit  # Keep % of samples per class
                 else:
-                    est.fit(arr(X_subtrain), y_subtrain, **est_copy)
+                    split = ShuffleSplit
 
-                # Calculate metrics on the validation set
-                return [m(est, arr(X_val), y_val) for m in self.T._metric.values()]
+                # Get the ShuffleSplit cross-validator object
+                fold = split(
+                    n_splits=1,
+                    test_size=len(self.test) / self.shape[0],
+                    random_state=rs,
+                )
+
+            else:  # Use cross validation to get the score
+                if self.T.goal == "class":
+                    k_fold = StratifiedKFold  # Keep % of samples per class
+                else:
+                    k_fold = KFold
 
-            # Start iteration ====================================== >>
+                # Get the K-fold cross-validator object
+                fold = k_fold(self.T._bo["cv"], shuffle=True, random_state=rs)
 
-            t_iter = datetime.now()  # Get current time for start of the iteration
+            return list(fold.split(self._X_train, self._y_train))
 
-            # Start printing the information table
+        def fit_folds(jobs):
+            """Fit every (estimator, fold) combination on the workers.
+
+            Parameters
+            ----------
+            jobs: list of tuples
+                Estimator, subtrain and validation indices per fit.
+                With fixed splits, the folds are transformed in this
+                process, so they end up in the fold cache.
+
+            Returns
+            -------
+            scores: list
+                Scores on the validation set per fit.
+
+            """
+            if self.T._bo["fixed_splits"]:
+                jobs = [(est, i, j, self._get_fold(i, j)) for est, i, j in jobs]
+
+            try:
+                return Parallel(self.T.n_jobs)(delayed(fit_model)(*job) for job in jobs)
+            except PickleError:
+                raise PickleError(
+                    f"Could not pickle the {self.acronym} model to send "
+                    "it to the workers. Try using one of the predefined "
+                    "models or use n_jobs=1 or bo_params={'cv': 1}."
+                )
+
+        def fit_folds_in_order(est, folds):
+            """Fit the folds one after another, pruning if needed.
+
+            After every fold, the intermediate score (mean score on
+            the first metric over the folds evaluated so far) is sent
+            to the pruner, together with the intermediate scores of
+            the previous calls at the same fold.
+
+            Parameters
+            ----------
+            est: estimator
+                Estimator instance to fit.
+
+            folds: list of tuples
+                Indices of the (sub)train and validation set per fold.
+
+            Returns
+            -------
+            score: list
+                Mean score per metric over the evaluated folds.
+
+            pruned: bool
+                Whether the call was pruned.
+
+            """
+            scores, steps, pruned = [], [], False
+            for step, (i, j) in enumerate(folds):
+                scores.append(fit_model(est, i, j))
+                steps.append(float(np.mean([s[0] for s in scores])))
+
+                history = [call[step] for call in intermediate if len(call) > step]
+                if step < len(folds) - 1 and self.T._bo["pruner"](
+                    step=step, score=steps[-1], history=history
+                ):
+                    pruned = True
+                    break
+
+            intermediate.append(steps)
+
+            return list(np.mean(scores, axis=0)), pruned
+
+        def start_call():
+            """Start a new call of the BO.
+
+            Returns
+            -------
+            call: str
+                Name of the call.
+
+            """
             self._iter += 1
             if self._iter > self._n_initial_points:
                 call = f"Iteration {self._iter}"
@@ -289,73 +495,64 @@ class BaseModel(BaseModelPlotter):
             if pbar:
                 pbar.set_description(call)
 
-            est = self.get_estimator({**self._est_params, **params})
+            return call
 
-            # Skip if the eval function has already been evaluated at this point
-            if params not in self.bo["params"].values:
-                # Same splits per model, but different per call
-                rs = self._iter
-                if self.T.random_state is not None:
-                    rs += self.T.random_state
+        def end_call(call, x, params, est, score, pruned, t_iter):
+            """Store and print the results of a call of the BO.
 
-                if self.T._bo["cv"] == 1:
-                    if self.T.goal == "class":
-                        split = StratifiedShuffleSplit  # Keep % of samples per class
-                    else:
-                        split = ShuffleSplit
+            Parameters
+            ----------
+            call: str
+                Name of the call.
 
-                    # Get the ShuffleSplit cross-validator object
-                    fold = split(
-                        n_splits=1,
-                        test_size=len(self.test) / self.shape[0],
-                        random_state=rs,
-                    )
+            x: list
+                Point in the hyperparameter space proposed by the BO.
 
-                    # Fit model just on the one fold
-                    score = fit_model(*next(fold.split(self.X_train, self.y_train)))
+            params: dict
+               Model's hyperparameters used in this call of the BO.
 
-                else:  # Use cross validation to get the score
-                    if self.T.goal == "class":
-                        fold = StratifiedKFold  # Keep % of samples per class
-                    else:
-                        fold = KFold
+            est: estimator
+                Estimator instance used in this call.
 
-                    # Get the K-fold cross-validator object
-                    k_fold = fold(self.T._bo["cv"], shuffle=True, random_state=rs)
+            score: list
+                Score per metric achieved by the model.
 
-                    try:
-                        # Parallel loop over fit_model
-                        jobs = Parallel(self.T.n_jobs)(
-                            delayed(fit_model)(i, j)
-                            for i, j in k_fold.split(self.X_train, self.y_train)
-                        )
-                        score = list(np.mean(jobs, axis=0))
-                    except PickleError:
-                        raise PickleError(
-                            f"Could not pickle the {self.acronym} model to send "
-                            "it to the workers. Try using one of the predefined "
-                            "models or use n_jobs=1 or bo_params={'cv': 1}."
-                        )
-            else:
-                # Get same score as previous evaluation
-                score = lst(self.bo.loc[self.bo["params"] == params, "score"].values[0])
-                self._stopped = ("---", "---")
+            pruned: bool
+                Whether the call was pruned.
+
+            t_iter: datetime
+                Start time of the call.
 
-            # Append row to the bo attribute
+            """
+            # Add the call to the record
             t = time_to_str(t_iter)
             t_tot = time_to_str(init_bo)
-            self.bo = self.bo.append(
-                {
-                    "call": call,
-                    "params": params,
-                    "estimator": est,
-                    "score": flt(score),
-                    "time": t,
-                    "total_time": t_tot,
-                },
-                ignore_index=True,
+            self._trials.append(
+                call=call,
+                x=x,
+                params=params,
+                estimator=est,
+                score=flt(score),
+                pruned=pruned,
+                time=t,
+                total_time=t_tot,
             )
 
+            # Persist the call so the BO can be resumed
+            if self.T._bo["storage"]:
+                self.T._bo["storage"].save(
+                    model=self.name,
+                    branch=self.branch.name,
+                    fingerprint=fingerprint,
+                    call=call,
+                    x=x,
+                    params=params,
+                    score=score,
+                    pruned=pruned,
+                    time=t,
+                    total_time=t_tot,
+                )
+
             # Save BO calls to experiment as nested runs
             if self.T.log_bo:
                 with mlflow.start_run(run_name=f"{self.name} - {call}", nested=True):
@@ -374,18 +571,290 @@ class BaseModel(BaseModelPlotter):
                 sequence.update(
                     {
                         m.name: score[i],
-                        f"best_{m.name}": max([lst(s)[i] for s in self.bo.score]),
+                        f"best_{m.name}": self._trials.best[i],
                     }
                 )
             if self._early_stopping and self.T._bo["cv"] == 1:
                 sequence.update(
                     {"early_stopping": f"{self._stopped[0]}/{self._stopped[1]}"}
                 )
+            if self.T._bo["pruner"]:
+                sequence.update({"pruned": pruned})
             sequence.update({"time": t, "total_time": t_tot})
             self.T.log(table.print(sequence), 2)
 
+        def optimize(x):
+            """Optimization function for the BO.
+
+            Parameters
+            ----------
+            x: list
+               Point in the hyperparameter space proposed by the BO.
+
+            Returns
+            -------
+            score: float
+                Score achieved by the model.
+
+            """
+            t_iter = datetime.now()  # Get current time for start of the iteration
+
+            call = start_call()
+            params = get_params(x)
+            est = self.get_estimator({**self._est_params, **params})
+
+            # Skip if the eval function has already been evaluated at this point
+            pruned = False
+            if params not in self._trials:
+                folds = get_folds()
+                if len(folds) == 1:
+                    # Fit model just on the one fold
+                    score = fit_model(est, *folds[0])
+                elif self.T._bo["pruner"]:
+                    score, pruned = fit_folds_in_order(est, folds)
+                else:
+                    # Parallel loop over fit_model
+                    jobs = fit_folds([(est, i, j) for i, j in folds])
+                    score = list(np.mean(jobs, axis=0))
+            else:
+                # Get same score as previous evaluation
+                trial = self._trials.get(params)
+                score, pruned = lst(trial["score"]), trial["pruned"]
+                self._stopped = ("---", "---")
+
+            end_call(call, x, params, est, score, pruned, t_iter)
+
+            # The score of a pruned call is incomplete. The optimizer gets
+            # the worst score of the completed calls instead (if any), so
+            # it steers away from the pruned region without overrating it
+            if pruned and self._trials.worst is not None:
+                return -self._trials.worst[0]
+
+            return -score[0]  # Negative since skopt tries to minimize
+
+        def submit_point(x, executor, running):
+            """Start the evaluation of a point on the workers.
+
+            Every fold of the point is submitted as a separate job.
+            Points that have already been evaluated aren't fitted
+            again, and points that are still being evaluated share
+            the jobs of the running call.
+
+            Parameters
+            ----------
+            x: list
+               Point in the hyperparameter space proposed by the BO.
+
+            executor: Executor
+                Executor that runs the jobs.
+
+            running: list of dict
+                Calls that are being evaluated. The new call is
+                appended to this list.
+
+            """
+            params = get_params(x)
+            call = dict(
+                name=start_call(),
+                x=x,
+                params=params,
+                est=self.get_estimator({**self._est_params, **params}),
+                jobs=[],
+                t_iter=datetime.now(),  # Current time for start of the call
+            )
+            if params not in self._trials:
+                same = [c for c in running if c["params"] == params]
+                if same:
+                    call["jobs"] = same[0]["jobs"]
+                else:
+                    for i, j in get_folds():
+                        # With fixed splits, the folds are transformed in
+                        # this process, so they end up in the fold cache
+                        fold = None
+                        if self.T._bo["fixed_splits"]:
+                            fold = self._get_fold(i, j)
+
+                        job = executor.submit(fit_model, call["est"], i, j, fold)
+                        call["jobs"].append(job)
+
+            running.append(call)
+
+        def finish_call(call):
+            """Store the results of an evaluated point.
+
+            Parameters
+            ----------
+            call: dict
+                Call of which all jobs are done.
+
+            Returns
+            -------
+            score: float
+                Score achieved by the model.
+
+            """
+            if call["jobs"]:
+                try:
+                    scores = [job.result() for job in call["jobs"]]
+                except PickleError:
+                    raise PickleError(
+                        f"Could not pickle the {self.acronym} model to send "
+                        "it to the workers. Try using one of the predefined "
+                        "models or use n_jobs=1 or bo_params={'cv': 1}."
+                    )
+                score = list(np.mean(scores, axis=0))
+            else:
+                # Get same score as previous evaluation
+                score = lst(self._trials.get(call["params"])["score"])
+
+            end_call(
+                call["name"],
+                call["x"],
+                call["params"],
+                call["est"],
+                score,
+                False,
+                call["t_iter"],
+            )
+
             return -score[0]  # Negative since skopt tries to minimize
 
+        def ask_point(optimizer, running):
+            """Ask the optimizer for a new point.
+
+            The optimizer is told a constant lie for the points that
+            are still being evaluated, so that it doesn't propose
+            them again. The lies are told to a copy of the optimizer.
+
+            Parameters
+            ----------
+            optimizer: Optimizer
+                Optimizer with the evaluated points.
+
+            running: list of dict
+                Calls that are being evaluated.
+
+            Returns
+            -------
+            x: list
+                Point in the hyperparameter space.
+
+            """
+            if not running:
+                return optimizer.ask()
+
+            opt = optimizer.copy(
+                random_state=optimizer.rng.randint(0, np.iinfo(np.int32).max)
+            )
+
+            lie = 0
+            if optimizer.yi:
+                strategies = dict(cl_min=np.min, cl_mean=np.mean, cl_max=np.max)
+                lie = strategies[self.T._bo["strategy"]](optimizer.yi)
+            opt.tell([c["x"] for c in running], [lie] * len(running))
+
+            return opt.ask()
+
+        def batch_minimize(dimensions, n_calls, n_initial_points, x0,
+                           callback, n_jobs, random_state, **kwargs):
+            """Minimize the optimization function asynchronously.
+
+            Replaces skopt's minimize functions when `batch_size>1`.
+            Up to `batch_size` points are evaluated concurrently. As
+            soon as a point is evaluated, its result is told to the
+            optimizer, which proposes a new point using the constant
+            liar strategy for the points that are still running.
+
+            Returns
+            -------
+            result: OptimizeResult
+                Optimization result after the last evaluated point.
+
+            """
+            rng = check_random_state(random_state)
+
+            # Convert the minimize functions' kwargs to the optimizer's
+            kwargs.pop("verbose", None)
+            acq_func_kwargs = {k: kwargs.pop(k) for k in ("xi", "kappa") if k in kwargs}
+            acq_optimizer_kwargs = {
+                k: kwargs.pop(k)
+                for k in ("n_points", "n_restarts_optimizer")
+                if k in kwargs
+            }
+
+            base_estimator = self.T._bo["base_estimator"]
+            if isinstance(base_estimator, str):
+                if base_estimator.lower() == "gp":
+                    dimensions = normalize_dimensions(dimensions)
+                    base_estimator = cook_estimator(
+                        base_estimator="GP",
+                        space=dimensions,
+                        random_state=rng.randint(0, np.iinfo(np.int32).max),
+                        noise=kwargs.pop("noise", "gaussian"),
+                    )
+                else:
+                    kwargs.setdefault("acq_func", "EI")
+                    base_estimator = base_estimator.upper()
+
+            # Points provided by the user are evaluated before the BO
+            y0 = kwargs.pop("y0", None)
+            x0 = [] if x0 is None else x0
+            if x0 and not isinstance(x0[0], (list, tuple)):
+                x0 = [x0]
+
+            optimizer = Optimizer(
+                dimensions=dimensions,
+                base_estimator=base_estimator,
+                n_initial_points=n_initial_points + len(x0),
+                n_jobs=n_jobs,
+                random_state=rng,
+                acq_func_kwargs=acq_func_kwargs,
+                acq_optimizer_kwargs=acq_optimizer_kwargs,
+                **kwargs,
+            )
+
+            result = None
+            callbacks = check_callback(callback)
+            if x0 and y0 is not None:
+                result = optimizer.tell(x0, lst(y0))
+                if eval_callbacks(callbacks, result):
+                    return result
+
+            queue = x0 if y0 is None else []
+            if self.T.n_jobs == 1:
+                executor = ThreadPoolExecutor(max_workers=1)
+            else:
+                executor = get_reusable_executor(max_workers=self.T.n_jobs)
+
+            running, stop = [], False
+            batch_size = self.T._bo["batch_size"]
+            try:
+                while True:
+                    # Fill the free slots with the user's or new points
+                    while not stop and n_calls > 0 and len(running) < batch_size:
+                        x = queue.pop(0) if queue else ask_point(optimizer, running)
+                        submit_point(x, executor, running)
+                        n_calls -= 1
+
+                    if not running:
+                        break
+
+                    jobs = [job for call in running for job in call["jobs"]]
+                    wait(jobs, return_when=FIRST_COMPLETED)
+
+                    # Tell the results of the finished calls
+                    finished = [c for c in running if all(j.done() for j in c["jobs"])]
+                    for call in finished:
+                        running.remove(call)
+                        result = optimizer.tell(call["x"], finish_call(call))
+                        if eval_callbacks(callbacks, result):
+                            stop = True  # Let the running calls finish
+            finally:
+                if isinstance(executor, ThreadPoolExecutor):
+                    executor.shutdown()
+
+            return result
+
         # Running optimization ===================================== >>
 
         if self._n_calls < self._n_initial_points:
@@ -400,6 +869,9 @@ class BaseModel(BaseModelPlotter):
 
         self.T.log(f"\n\nRunning BO for {self.fullname}...", 1)
 
+        self._trials = TrialRecord()  # Not shared with shallow copies (sh and ts)
+        intermediate = []  # Intermediate scores per call (for the pruner)
+
         pbar = None
         if self.T.verbose == 1:
             pbar = tqdm(total=self._n_calls, desc="Initial point 1")
@@ -409,103 +881,194 @@ class BaseModel(BaseModelPlotter):
             if param in self.params:
                 self.params.pop(param)
 
-        # Specify model dimensions
-        def pre_defined_hyperparameters(x):
-            return optimize(**self.get_params(x))
-
         # Get custom dimensions (if provided)
         if self._dimensions:
-            @use_named_args(self._dimensions)
-            def custom_hyperparameters(**x):
-                return optimize(**x)
-
             dimensions = self._dimensions
-            func = custom_hyperparameters  # Use custom hyperparameters
+
+            # Return from skopt wrapper to get dict of custom hyperparameter space
+            @use_named_args(dimensions)
+            def get_params(**x):
+                return x
 
         else:  # If there were no custom dimensions, use the default
             dimensions = self.get_dimensions()
-            func = pre_defined_hyperparameters  # Default optimization func
+            get_params = self.get_params
 
         # If no hyperparameters left to optimize, skip BO
         if not dimensions:
             self.T.log(" --> Skipping BO. No hyperparameters found to optimize.", 2)
             return
 
+        # Load the calls stored for this model, branch and data
+        x0, y0 = None, None
+        n_calls, n_initial_points = self._n_calls, self._n_initial_points
+        if self.T._bo["storage"]:
+            fingerprint = self.T._bo["storage"].fingerprint(
+                self._X_train,
+                self._y_train,
+                list(self.T._metric),
+                self.T._bo["cv"],
+                self._est_params,
+            )
+            space = Space(dimensions)
+            trials = [
+                trial
+                for trial in self.T._bo["storage"].load(
+                    model=self.name,
+                    branch=self.branch.name,
+                    fingerprint=fingerprint,
+                )
+                if len(trial["x"]) == len(dimensions) and trial["x"] in space
+            ][:n_calls]  # Never resume with more calls than requested
+
+            if trials:
+                self.T.log(f" --> Resuming from {len(trials)} stored calls.", 2)
+                for t in trials:
+                    self._trials.append(
+                        call=t["call"],
+                        x=t["x"],
+                        params=t["params"],
+                        score=flt(t["score"]),
+                        pruned=t["pruned"],
+                        time=t["time"],
+                        total_time=t["total_time"],
+                    )
+                self._iter = len(trials)
+                if pbar:
+                    pbar.update(len(trials))
+
+                # Warm-start the optimizer with the stored calls. Like in
+                # optimize, pruned calls get the worst completed score
+                x0 = [t["x"] for t in trials]
+                y0 = []
+                for t in trials:
+                    if t["pruned"] and self._trials.worst is not None:
+                        y0.append(-self._trials.worst[0])
+                    else:
+                        y0.append(-lst(t["score"])[0])
+                n_calls = max(0, n_calls - len(trials))
+                n_initial_points = max(0, n_initial_points - len(trials))
+
+        # Warm-start the optimizer with the calls of the previous run
+        # Their scores were achieved on a smaller budget, so they only
+        # guide the optimizer and don't count towards n_calls
+        if x0 is None and self._warm_start is not None:
+            space = Space(dimensions)
+            points = [
+                (x, score)
+                for x, score in self._warm_start._trials.points
+                if len(x) == len(dimensions) and x in space
+            ]
+
+            if points:
+                self.T.log(f" --> Warm-starting from {len(points)} previous calls.", 2)
+                x0 = [x for x, _ in points]
+                y0 = [-lst(score)[0] for _, score in points]
+                n_initial_points = max(0, n_initial_points - len(points))
+
         # Start with the table output
         sequence = [("call", "left")] + [dim.name for dim in dimensions]
         for m in self.T._metric.values():
             sequence.extend([m.name, "best_" + m.name])
         if self._early_stopping and self.T._bo["cv"] == 1:
             sequence.append("early_stopping")
+        if self.T._bo["pruner"]:
+            sequence.append("pruned")
         sequence.extend(["time", "total_time"])
         table = Table(sequence, [max(7, len(str(text))) for text in sequence])
         self.T.log(table.print_header(), 2)
         self.T.log(table.print_line(), 2)
 
         # If only 1 initial point, use the model's default parameters
-        x0 = None
-        if self._n_initial_points == 1 and hasattr(self, "get_init_values"):
-            x0 = self.get_init_values()
+        if x0 is None and self._n_initial_points == 1:
+            if hasattr(self, "get_init_values"):
+                x0 = self.get_init_values()
 
         # Prepare keyword arguments for the optimizer
         bo_kwargs = self.T._bo.copy()  # Don't pop params from trainer
         kwargs = dict(
-            func=func,
             dimensions=dimensions,
-            n_calls=self._n_calls,
-            n_initial_points=self._n_initial_points,
+            n_calls=n_calls,
+            n_initial_points=n_initial_points,
             x0=bo_kwargs.pop("x0", x0),
             callback=self.T._bo["callback"],
             n_jobs=bo_kwargs.pop("n_jobs", self.T.n_jobs),
             random_state=bo_kwargs.pop("random_state", self.T.random_state),
             **bo_kwargs["kwargs"],
         )
+        if y0:
+            kwargs["y0"] = y0
 
-        if isinstance(self.T._bo["base_estimator"], str):
-            if self.T._bo["base_estimator"].lower() == "gp":
-                optimizer = gp_minimize(**kwargs)
-            elif self.T._bo["base_estimator"].lower() == "et":
-                optimizer = forest_minimize(base_estimator="ET", **kwargs)
-            elif self.T._bo["base_estimator"].lower() == "rf":
-                optimizer = forest_minimize(base_estimator="RF", **kwargs)
-            elif self.T._bo["base_estimator"].lower() == "gbrt":
-                optimizer = gbrt_minimize(**kwargs)
+        if not n_calls:
+            self.T.log(" --> Skipping BO. All calls were found in storage.", 2)
+        elif self.T._bo["batch_size"] > 1:
+            batch_minimize(**kwargs)
         else:
-            optimizer = base_minimize(
-                base_estimator=self.T._bo["base_estimator"],
-                **kwargs,
-            )
+            kwargs["func"] = optimize
+            if isinstance(self.T._bo["base_estimator"], str):
+                if self.T._bo["base_estimator"].lower() == "gp":
+                    gp_minimize(**kwargs)
+                elif self.T._bo["base_estimator"].lower() == "et":
+                    forest_minimize(base_estimator="ET", **kwargs)
+                elif self.T._bo["base_estimator"].lower() == "rf":
+                    forest_minimize(base_estimator="RF", **kwargs)
+                elif self.T._bo["base_estimator"].lower() == "gbrt":
+                    gbrt_minimize(**kwargs)
+            else:
+                base_minimize(
+                    base_estimator=self.T._bo["base_estimator"],
+                    **kwargs,
+                )
 
         if pbar:
             pbar.close()
 
-        # Optimal parameters found by the BO
-        # Return from skopt wrapper to get dict of custom hyperparameter space
-        if func is pre_defined_hyperparameters:
-            self.best_params = self.get_params(optimizer.x)
-        else:
+        self._select_best_call(init_bo, "Bayesian Optimization")
 
-            @use_named_args(dimensions)
-            def get_custom_params(**x):
-                return x
+    def _get_max_resource(self):
+        """Get the maximum value of the model's resource parameter."""
+        return self._est_params.get(
+            self.resource, self.params.get(self.resource, [None])[0]
+        ) or self.get_estimator().get_params()[self.resource]
+
+    def _select_best_call(self, t_init, name):
+        """Select the best call of the hyperparameter tuning.
+
+        Pruned calls don't count since their score is incomplete.
+        Sets the best parameters, score and (unfitted) estimator.
 
-            self.best_params = get_custom_params(optimizer.x)
+        Parameters
+        ----------
+        t_init: datetime
+            Start time of the hyperparameter tuning.
+
+        name: str
+            Name of the tuning algorithm (for the output).
+
+        """
+        # Select from the calls that weren't pruned and, for
+        # Hyperband, that were evaluated with the complete budget
+        completed = self._bo[~self._bo["pruned"].astype(bool)]
+        if "budget" in completed:
+            completed = completed[completed["budget"] == 1]
+        if completed.empty:
+            completed = self._bo
 
-        # Optimal call and score found by the BO
         # Drop duplicates in case the best value is repeated through calls
-        best = self.bo["score"].apply(lambda x: lst(x)[0]).drop_duplicates().idxmax()
-        best_call = self.bo.loc[best, "call"]
-        self.metric_bo = self.bo.loc[best, "score"]
+        best = completed["score"].apply(lambda x: lst(x)[0]).drop_duplicates().idxmax()
+        best_call = self._bo.loc[best, "call"]
+        self.best_params = self._bo.loc[best, "params"]
+        self.metric_bo = self._bo.loc[best, "score"]
 
         # Save best model (not yet fitted)
         self.estimator = self.get_estimator({**self._est_params, **self.best_params})
 
-        # Get the BO duration
-        self.time_bo = time_to_str(init_bo)
+        # Get the tuning's duration
+        self.time_bo = time_to_str(t_init)
 
         # Print results
         self.T.log(f"\nResults for {self.fullname}:{' ':9s}", 1)
-        self.T.log(f"Bayesian Optimization {'-' * 27}", 1)
+        self.T.log(f"{name} {'-' * (48 - len(name))}", 1)
         self.T.log(f"Best call --> {best_call}", 1)
         self.T.log(f"Best parameters --> {self.best_params}", 1)
         out = [
@@ -515,11 +1078,275 @@ class BaseModel(BaseModelPlotter):
         self.T.log(f"Best evaluation --> {'   '.join(out)}", 1)
         self.T.log(f"Time elapsed: {self.time_bo}", 1)
 
+    def hyperband(self):
+        """Run the hyperband algorithm.
+
+        Search for the best combination of hyperparameters running
+        several brackets of successive halving over configurations
+        sampled from the hyperparameter space. Every bracket evaluates
+        its configurations on a small budget, after which the best
+        1/eta continue to the next rung with eta times the budget.
+        Brackets with more configurations start on a smaller budget.
+        The configurations are sampled at random or, if sampler="bohb",
+        from a density model of the best configurations evaluated so
+        far. All calls are evaluated on the same validation set.
+
+        """
+
+        def fit_config(est, budget):
+            """Fit and score a configuration. Function for parallelization.
+
+            Parameters
+            ----------
+            est: estimator
+                Estimator instance to fit.
+
+            budget: float
+                Fraction of the subtrain set to fit the estimator on.
+
+            Returns
+            -------
+            score: list
+                Score per metric on the validation set.
+
+            """
+            n_rows = max(1, int(budget * len(y_subtrain)))
+            X, y = X_subtrain.iloc[:n_rows], y_subtrain.iloc[:n_rows]
+
+            # Match the sample_weights with the rows of the subtrain set
+            est_copy = self._est_params_fit.copy()
+            if "sample_weight" in est_copy:
+                est_copy["sample_weight"] = [
+                    self._est_params_fit["sample_weight"][i]
+                    for i in train_idx[:n_rows]
+                ]
+
+            if hasattr(self, "custom_fit"):
+                self.custom_fit(
+                    est=est,
+                    train=(self._arr(X), y),
+                    validation=(self._arr(X_val), y_val),
+                    params=est_copy,
+                )
+            else:
+                est.fit(self._arr(X), y, **est_copy)
+
+            return get_scores(
+                est, self._arr(X_val), y_val, list(self.T._metric.values())
+            )
+
+        def kde(data, points, bw):
+            """Gaussian kernel density of points given data."""
+            diff = (points[:, None, :] - data[None, :, :]) / bw
+            density = np.exp(-0.5 * np.sum(diff ** 2, axis=2)) / np.prod(bw)
+            return np.mean(density, axis=1)
+
+        def sample(n):
+            """Sample configurations from the hyperparameter space.
+
+            With sampler="bohb", the observations at the largest budget
+            with enough calls are split in good and bad configurations.
+            Every configuration is the candidate with the highest ratio
+            between the densities of the good and the bad ones. A third
+            of the configurations is still sampled at random.
+
+            Parameters
+            ----------
+            n: int
+                Number of configurations to sample.
+
+            Returns
+            -------
+            points: list
+                Points in the hyperparameter space.
+
+            """
+            points = []
+            for _ in range(n):
+                budgets = [b for b, obs in observations.items() if len(obs) > n_min]
+                if self.T.sampler == "random" or not budgets or rs.rand() < 1 / 3:
+                    points.append(space.rvs(random_state=rs)[0])
+                    continue
+
+                obs = sorted(observations[max(budgets)], key=lambda o: -o[1])
+                data = np.array(space.transform([x for x, _ in obs]), dtype=float)
+                n_good = max(n_min, int(np.ceil(0.15 * len(obs))))
+                good, bad = data[:n_good], data[n_good:]
+
+                # Bandwidths with Scott's rule
+                bw_good = np.std(good, axis=0) * len(good) ** (-1 / (data.shape[1] + 4))
+                bw_good = np.maximum(bw_good, 1e-3)
+                bw_bad = np.std(bad, axis=0) * len(bad) ** (-1 / (data.shape[1] + 4))
+                bw_bad = np.maximum(bw_bad, 1e-3)
+
+                # Draw candidates around the good configurations
+                noise = rs.normal(scale=3 * bw_good, size=(64, len(bw_good)))
+                candidates = np.clip(good[rs.randint(len(good), size=64)] + noise, 0, 1)
+
+                l_x = kde(good, candidates, bw_good)
+                g_x = kde(bad, candidates, bw_bad) + 1e-32
+                best = candidates[np.argmax(l_x / g_x)]
+                points.append(space.inverse_transform([best])[0])
+
+            return points
+
+        self._check_est_params()  # Check validity of parameters
+
+        init_hb = datetime.now()  # Track the duration
+
+        self.T.log(f"\n\nRunning Hyperband for {self.fullname}...", 1)
+
+        # The resource is set by the budget of every call
+        max_resource = None
+        if self.T.resource == "iterations":
+            max_resource = self._get_max_resource()
+            self.params.pop(self.resource, None)
+
+        # Drop dimensions if already in est_params
+        for param in self._est_params:
+            if param in self.params:
+                self.params.pop(param)
+
+        # Get custom dimensions (if provided)
+        if self._dimensions:
+            dimensions = [d for d in self._dimensions if d.name != self.resource]
+
+            # Return from skopt wrapper to get dict of custom hyperparameter space
+            @use_named_args(dimensions)
+            def get_params(**x):
+                return x
+
+        else:  # If there were no custom dimensions, use the default
+            dimensions = self.get_dimensions()
+            get_params = self.get_params
+
+        # If no hyperparameters left to optimize, skip hyperband
+        if not dimensions:
+            self.T.log(
+                " --> Skipping Hyperband. No hyperparameters found to optimize.", 2
+            )
+            return
+
+        # Brackets of successive halving: (bracket, n_configs per rung)
+        eta = self.T.eta
+        s_max = int(np.floor(np.log(1 / self.T.min_resource) / np.log(eta) + 1e-6))
+        brackets = []
+        for s in reversed(range(s_max + 1)):
+            rungs = [int(np.ceil((s_max + 1) / (s + 1) * eta ** s))]
+            for _ in range(s):
+                rungs.append(max(1, rungs[-1] // eta))
+            brackets.append((s, rungs))
+
+        # Same validation set for all calls and models
+        if self.T.goal == "class":
+            split = StratifiedShuffleSplit  # Keep % of samples per class
+        else:
+            split = ShuffleSplit
+
+        train_idx, val_idx = next(
+            split(
+                n_splits=1,
+                test_size=len(self.test) / self.shape[0],
+                random_state=self.T.random_state,
+            ).split(self._X_train, self._y_train)
+        )
+        X_subtrain, y_subtrain, X_val, y_val = self._get_fold(train_idx, val_idx)
+
+        # Hyperparameter space scaled to [0, 1] for the density model
+        space = Space(deepcopy(dimensions))
+        space.set_transformer("normalize")
+        n_min = len(dimensions) + 1  # Minimum good observations for the model
+        observations = defaultdict(list)  # Budget -> (point, score)
+        rs = check_random_state(self.T.random_state)
+
+        # The record gets the budget of every call
+        self._trials = TrialRecord(["call", "budget", *TrialRecord.columns[1:]])
+
+        pbar = None
+        if self.T.verbose == 1:
+            pbar = tqdm(total=sum(sum(rungs) for _, rungs in brackets))
+
+        # Start with the table output
+        sequence = [("call", "left"), "budget"] + [dim.name for dim in dimensions]
+        for m in self.T._metric.values():
+            sequence.extend([m.name, "best_" + m.name])
+        sequence.extend(["time", "total_time"])
+        table = Table(sequence, [max(7, len(str(text))) for text in sequence])
+        self.T.log(table.print_header(), 2)
+        self.T.log(table.print_line(), 2)
+
+        for s, rungs in brackets:
+            configs = sample(rungs[0])
+            for i in range(len(rungs)):
+                t_iter = datetime.now()
+                call = f"Bracket {s}, rung {i}"
+                budget = eta ** (i - s)
+                if pbar:
+                    pbar.set_description(call)
+
+                # With resource="iterations", the whole subtrain set is used
+                ests, params = [], []
+                for x in configs:
+                    params.append(get_params(x))
+                    if max_resource:
+                        n_iter = max(1, int(round(budget * max_resource)))
+                        params[-1][self.resource] = n_iter
+                    ests.append(self.get_estimator({**self._est_params, **params[-1]}))
+
+                try:
+                    scores = Parallel(self.T.n_jobs)(
+                        delayed(fit_config)(est, 1 if max_resource else budget)
+                        for est in ests
+                    )
+                except PickleError:
+                    raise PickleError(
+                        f"Could not pickle the {self.acronym} model to send "
+                        "it to the workers. Try using one of the predefined "
+                        "models or use n_jobs=1."
+                    )
+
+                t = time_to_str(t_iter)
+                for x, p, est, score in zip(configs, params, ests, scores):
+                    observations[budget].append((x, score[0]))
+                    self._trials.append(
+                        call=call,
+                        x=x,
+                        budget=budget,
+                        params=p,
+                        estimator=est,
+                        score=flt(score),
+                        pruned=False,
+                        time=t,
+                        total_time=time_to_str(init_hb),
+                    )
+
+                    # Print output of the call
+                    sequence = {"call": call, "budget": budget, **p}
+                    for j, m in enumerate(self.T._metric.values()):
+                        sequence.update(
+                            {m.name: score[j], f"best_{m.name}": self._trials.best[j]}
+                        )
+                    sequence.update({"time": t, "total_time": time_to_str(init_hb)})
+                    self.T.log(table.print(sequence), 2)
+
+                if pbar:
+                    pbar.update(len(configs))
+
+                # Promote the best configurations to the next rung
+                if i < len(rungs) - 1:
+                    best = np.argsort([-score[0] for score in scores], kind="stable")
+                    configs = [configs[j] for j in best[:rungs[i + 1]]]
+
+        if pbar:
+            pbar.close()
+
+        self._select_best_call(init_hb, "Hyperband")
+
     def fit(self):
         """Fit and validate the model."""
         t_init = datetime.now()
 
-        if self.bo.empty:
+        if self._bo.empty:
             self.T.log(f"Results for {self.fullname}:", 1)
         self.T.log(f"Fit {'-' * 45}", 1)
 
@@ -528,16 +1355,49 @@ class BaseModel(BaseModelPlotter):
             self._check_est_params()
             self.estimator = self.get_estimator(self._est_params)
 
+        # Continue training the estimator of the previous run if only
+        # its resource increased since (sh with resource="iterations")
+        # or, with partial_fit, only its number of rows (ts)
+        params, n, rows = self._est_params_fit, None, None
+        prev = self._warm_start
+        if prev is not None and prev.best_params == self.best_params:
+            n_prev = prev.estimator.get_params().get(self.resource)
+            n = self.estimator.get_params().get(self.resource)
+            if n_prev and n and n > n_prev:
+                self.T.log(f" --> Warm-starting from {self.resource}={n_prev}.", 2)
+                self.estimator, params = self.get_warm_start(prev.estimator, n_prev, n)
+                params = {**self._est_params_fit, **params}
+            else:
+                n = None
+                if (
+                    hasattr(prev.estimator, "partial_fit")
+                    and not hasattr(self, "custom_fit")
+                    and not self._est_params_fit
+                    and prev._train_idx < self._train_idx
+                ):
+                    self.T.log(f" --> Warm-starting from {prev._train_idx} rows.", 2)
+                    self.estimator = deepcopy(prev.estimator)
+                    rows = slice(prev._train_idx, self._train_idx)
+
         # Fit the selected model on the complete training set
-        if hasattr(self, "custom_fit"):
+        if rows:
+            X, y = self._X_train.iloc[rows], self._y_train.iloc[rows]
+            self.estimator.partial_fit(self._arr(X), y)
+        elif hasattr(self, "custom_fit"):
             self.custom_fit(
                 est=self.estimator,
-                train=(self.X_train, self.y_train),
-                validation=(self.X_test, self.y_test),
-                params=self._est_params_fit,
+                train=(self._arr(self._X_train), self._y_train),
+                validation=(self._arr(self._X_test), self._y_test),
+                params=params,
             )
         else:
-            self.estimator.fit(arr(self.X_train), self.y_train, **self._est_params_fit)
+            self.estimator.fit(self._arr(self._X_train), self._y_train, **params)
+
+        # Restore the estimator's parameters to those of a cold start
+        if n:
+            self.estimator.set_params(**{self.resource: n})
+            if "warm_start" in self.estimator.get_params():
+                self.estimator.set_params(warm_start=False)
 
         # Save metric scores on complete training and test set
         for metric in self.T._metric.values():
@@ -576,58 +1436,162 @@ class BaseModel(BaseModelPlotter):
 
         Take bootstrapped samples from the training set and test them
         on the test set to get a distribution of the model's results.
+        If the trainer's oob_score is True, every estimator is also
+        scored on the out-of-bag rows of its sample. The samples are
+        fitted in parallel. Only the indices of every sample are drawn
+        in the workers, while the data sets are sent once and shared
+        between them (as memory maps for large arrays). Every scorer
+        uses the same prediction pass of the estimator.
 
         """
-        t_init = datetime.now()
 
-        self.metric_bootstrap = []
-        for i in range(self._n_bootstrap):
-            # Same splits per model, but different for every iteration
-            rs = i
-            if self.T.random_state is not None:
-                rs += self.T.random_state
+        def fit_bootstrap(
+            estimator,
+            custom_fit,
+            params,
+            metrics,
+            X,
+            y,
+            X_test,
+            y_test,
+            rs,
+            oob,
+            accept_sparse,
+        ):
+            """Fit and score an estimator on a bootstrapped sample.
+
+            Function for parallelization. Everything is passed as an
+            argument (no reference to the model), so the model isn't
+            pickled unless it has a custom fit method.
 
-            # Create stratified samples with replacement
-            sample_x, sample_y = resample(
-                self.X_train,
-                self.y_train,
+            Parameters
+            ----------
+            estimator: estimator
+                Unfitted estimator instance.
+
+            custom_fit: callable or None
+                Model's custom fit method. If None, the estimator's
+                fit method is used.
+
+            params: dict
+                Additional parameters for the fit method.
+
+            metrics: list
+                Scorers to evaluate the estimator with.
+
+            X: pd.DataFrame
+                Features of the training set.
+
+            y: pd.Series
+                Target column of the training set.
+
+            X_test: np.array or pd.DataFrame
+                Features of the test set.
+
+            y_test: pd.Series
+                Target column of the test set.
+
+            rs: int
+                Random state for the sample.
+
+            oob: bool
+                Whether to score the estimator on the out-of-bag rows.
+
+            accept_sparse: bool
+                Whether the estimator accepts sparse data.
+
+            Returns
+            -------
+            score: float or list
+                Score of the fitted estimator per metric.
+
+            score_oob: float, list or None
+                Out-of-bag score of the fitted estimator per metric.
+                None if oob=False.
+
+            """
+            # Create stratified sample indices with replacement
+            idx = resample(
+                np.arange(len(y)),
                 replace=True,
                 random_state=rs,
-                stratify=self.y_train,
+                stratify=np.asarray(y),
             )
 
-            # Clone to not overwrite when fitting
-            estimator = clone(self.estimator)
-
-            # Fit on bootstrapped set and predict on the independent test set
-            if hasattr(self, "custom_fit"):
-                self.custom_fit(
+            if custom_fit:
+                custom_fit(
                     est=estimator,
-                    train=(sample_x, sample_y),
+                    train=(arr(X.iloc[idx], accept_sparse), y.iloc[idx]),
                     validation=None,
-                    params=self._est_params_fit,
+                    params=params,
                 )
             else:
-                estimator.fit(arr(sample_x), sample_y, **self._est_params_fit)
-
-            self.metric_bootstrap.append(
-                flt(
-                    [
-                        metric(estimator, arr(self.X_test), self.y_test)
-                        for metric in self.T._metric.values()
-                    ]
+                estimator.fit(arr(X.iloc[idx], accept_sparse), y.iloc[idx], **params)
+
+            score = flt(get_scores(estimator, X_test, y_test, metrics))
+
+            score_oob = None
+            if oob:
+                # Rows that were never drawn in the sample
+                rows = np.setdiff1d(np.arange(len(y)), idx)
+                X_oob, y_oob = arr(X.iloc[rows], accept_sparse), y.iloc[rows]
+                score_oob = flt(get_scores(estimator, X_oob, y_oob, metrics))
+
+            return score, score_oob
+
+        t_init = datetime.now()
+
+        # Custom fit methods need the model
+        custom_fit = getattr(self, "custom_fit", None)
+        X, y = self._X_train, self._y_train
+        X_test, y_test = self._arr(self._X_test), self._y_test
+
+        # Same splits per model, but different for every iteration
+        rs = 0 if self.T.random_state is None else self.T.random_state
+        oob = getattr(self.T, "oob_score", False)
+
+        try:
+            results = Parallel(n_jobs=self.T.n_jobs, mmap_mode="r")(
+                delayed(fit_bootstrap)(
+                    estimator=clone(self.estimator),
+                    custom_fit=custom_fit,
+                    params=self._est_params_fit,
+                    metrics=list(self.T._metric.values()),
+                    X=X,
+                    y=y,
+                    X_test=X_test,
+                    y_test=y_test,
+                    rs=rs + i,
+                    oob=oob,
+                    accept_sparse=self.accepts_sparse,
                 )
+                for i in range(self._n_bootstrap)
+            )
+        except PickleError:
+            raise PickleError(
+                f"Could not pickle the {self.acronym} model to send "
+                "it to the workers. Try using one of the predefined "
+                "models or use n_jobs=1."
             )
 
         # Separate for multi-metric, transform numpy types to python types
+        scores, scores_oob = zip(*results)
         if len(self.T._metric) == 1:
-            self.metric_bootstrap = np.array(self.metric_bootstrap)
+            self.metric_bootstrap = np.array(scores)
             self.mean_bootstrap = np.mean(self.metric_bootstrap, axis=0).item()
             self.std_bootstrap = np.std(self.metric_bootstrap, axis=0).item()
+            if oob:
+                self.metric_oob = np.array(scores_oob)
+                self.mean_oob = np.mean(self.metric_oob, axis=0).item()
+                self.std_oob = np.std(self.metric_oob, axis=0).item()
         else:
-            self.metric_bootstrap = np.array(self.metric_bootstrap).T
+            self.metric_bootstrap = np.array(scores).T
             self.mean_bootstrap = np.mean(self.metric_bootstrap, axis=1).tolist()
             self.std_bootstrap = np.std(self.metric_bootstrap, axis=1).tolist()
+            if oob:
+                self.metric_oob = np.array(scores_oob).T
+                self.mean_oob = np.mean(self.metric_oob, axis=1).tolist()
+                self.std_oob = np.std(self.metric_oob, axis=1).tolist()
 
         self.T.log(f"Bootstrap {'-' * 39}", 1)
         out = [
@@ -636,12 +1600,33 @@ class BaseModel(BaseModelPlotter):
             for i, m in enumerate(self.T._metric.values())
         ]
         self.T.log(f"Evaluation --> {'   '.join(out)}", 1)
+        if oob:
+            out = [
+                f"{m.name}: {round(lst(self.mean_oob)[i], 4)}"
+                f" \u00B1 {round(lst(self.std_oob)[i], 4)}"
+                for i, m in enumerate(self.T._metric.values())
+            ]
+            self.T.log(f"Out-of-bag --> {'   '.join(out)}", 1)
 
         self.time_bootstrap = time_to_str(t_init)
         self.T.log(f"Time elapsed: {self.time_bootstrap}", 1)
 
     # Utility properties =========================================== >>
 
+    @property
+    def bo(self):
+        """Information of every call of the BO."""
+        return self._trials.to_df().copy()
+
+    @bo.setter
+    def bo(self, value):
+        self._trials = TrialRecord.from_df(value)
+
+    @property
+    def _bo(self):
+        """Cached `bo` dataframe for internal use. Must not be modified."""
+        return self._trials.to_df()
+
     @property
     def results(self):
         """Overview of the training results."""
@@ -654,12 +1639,21 @@ class BaseModel(BaseModelPlotter):
                 "time_fit": getattr(self, "time_fit", None),
                 "mean_bootstrap": getattr(self, "mean_bootstrap", None),
                 "std_bootstrap": getattr(self, "std_bootstrap", None),
+                "mean_oob": getattr(self, "mean_oob", None),
+                "std_oob": getattr(self, "std_oob", None),
                 "time_bootstrap": getattr(self, "time_bootstrap", None),
                 "time": getattr(self, "time", None),
             },
             name=self.name,
         )
 
+    @property
+    def scaled_nbytes(self):
+        """Memory used by the cached scaled data sets (in bytes)."""
+        return int(
+            sum(X.memory_usage(deep=True).sum() for *_, X in self._scaled.values())
+        )
+
     @property
     def metric_train(self):
         """Metric scores on the training set."""
@@ -672,12 +1666,108 @@ class BaseModel(BaseModelPlotter):
 
     # Prediction methods =========================================== >>
 
+    def _transform_new(self, X, y=None, verbose=None):
+        """Transform new data through the pipeline and the scaler.
+
+        Parameters
+        ----------
+        X: dataframe-like
+            Feature set with shape=(n_samples, n_features).
+
+        y: int, str, sequence or None, optional (default=None)
+            - If None: y is ignored.
+            - If int: Index of the target column in X.
+            - If str: Name of the target column in X.
+            - Else: Target column with shape=(n_samples,).
+
+        verbose: int or None, optional (default=None)
+            Verbosity level for the transformers. If None, it uses the
+            estimator's own verbosity.
+
+        Returns
+        -------
+        X: pd.DataFrame
+            Transformed feature set.
+
+        y: pd.Series or None
+            Transformed target column.
+
+        """
+        for transformer in self.pipeline:
+            if not transformer._train_only:
+                X, y = custom_transform(transformer, self.branch, (X, y), verbose)
+
+        # Scale the data if needed
+        if self.scaler:
+            X = self.scaler.transform(X)
+
+        return X, y
+
+    def _prediction_chunks(self, X, chunksize, filename, verbose, method):
+        """Get predictions on new data chunk by chunk.
+
+        The chunks are transformed and predicted independently, so
+        the complete dataset is never held in memory. Up to n_jobs
+        chunks are processed in parallel.
+
+        Parameters
+        ----------
+        X: str, dataframe-like or iterator
+            Path to a csv or parquet file, feature set with
+            shape=(n_samples, n_features) or iterator of such
+            feature sets.
+
+        chunksize: int or None
+            Maximum number of rows per chunk. If None, the chunks of
+            an iterator are used as they are.
+
+        filename: str or None
+            Name of the csv or parquet file to write the predictions
+            to. If None, the predictions are yielded per chunk.
+
+        verbose: int or None
+            Verbosity level for the transformers.
+
+        method: str
+            Prediction method to be applied to the estimator.
+
+        Returns
+        -------
+        pred: generator or None
+            Predictions per chunk. None if the predictions are
+            written to a file.
+
+        """
+
+        def predict_chunk(chunk):
+            """Predict a chunk. Function for parallelization."""
+            X_chunk, _ = self._transform_new(chunk, verbose=verbose)
+            pred = getattr(self.estimator, method)(self._arr(X_chunk))
+            if filename is None:
+                return pred
+
+            # Keep the chunk's index in the file
+            if pred.ndim == 1:
+                return pd.DataFrame({method: pred}, index=X_chunk.index)
+            else:
+                columns = getattr(self.estimator, "classes_", range(pred.shape[1]))
+                columns = [f"{method}_{col}" for col in columns]
+                return pd.DataFrame(pred, index=X_chunk.index, columns=columns)
+
+        pred = stream_chunks(predict_chunk, X, chunksize, filename, self.T.n_jobs)
+        if filename is not None:
+            self.T.log(f"Predictions of {self.fullname} saved to {filename}.", 1)
+
+        return pred
+
     def _prediction(
         self,
         X,
         y=None,
         metric=None,
         sample_weight=None,
+        chunksize=None,
+        filename=None,
         verbose=None,
         method="predict"
     ):
@@ -707,6 +1797,17 @@ class BaseModel(BaseModelPlotter):
         sample_weight: sequence or None, optional (default=None)
             Sample weights for the score method.
 
+        chunksize: int or None, optional (default=None)
+            Number of rows per chunk to stream new data through the
+            pipeline. If not None, X can also be the path to a csv or
+            parquet file. Iterators of chunks in X are always streamed.
+            Not available for method="score".
+
+        filename: str or None, optional (default=None)
+            Name of the csv or parquet file to write the streamed
+            predictions to. If None, a generator with the predictions
+            per chunk is returned. Only if the data is streamed.
+
         verbose: int or None, optional (default=None)
             Verbosity level for the transformers. If None, it uses the
             estimator's own verbosity.
@@ -716,8 +1817,10 @@ class BaseModel(BaseModelPlotter):
 
         Returns
         -------
-        pred: float or np.array
-            Prediction from the new data or row(s).
+        pred: float, np.array, generator or None
+            Prediction from the new data or row(s). A generator with
+            the predictions per chunk if the data is streamed, or None
+            if they are written to a file.
 
         """
         if not hasattr(self.estimator, method):
@@ -725,36 +1828,40 @@ class BaseModel(BaseModelPlotter):
                 f"{self.estimator.__class__.__name__} doesn't have a {method} method!"
             )
 
+        if method != "score" and (chunksize is not None or isinstance(X, Iterator)):
+            return self._prediction_chunks(X, chunksize, filename, verbose, method)
+
         try:  # Return from prediction attributes
             # Raises ValueError if X doesn't select indices
             rows = self.T._get_rows(X, branch=self.branch)
 
-            indices = list(self.dataset.index)
             pred = np.concatenate(
                 [getattr(self, f"{method}_train"), getattr(self, f"{method}_test")]
             )
 
-            # If there is a holdout set, add its indices and predictions
-            if self.holdout is not None:
-                indices += list(self.holdout.index)
+            # If there is a holdout set, add its predictions
+            if self.branch.holdout is not None:
                 pred = np.concatenate([pred, getattr(self, f"{method}_holdout")])
 
             # Since the pred attrs don't have an index, we need
             # to know the index positions of the requested rows
-            return flt(pred[[indices.index(i) for i in rows]])
+            positions = self.branch._get_positions(rows)
+
+            # The model can be trained on a subset of the training set (sh
+            # and ts), in which case the positions after it are shifted
+            n_train = len(self.branch.idx[0])
+            if np.any((positions >= self._train_idx) & (positions < n_train)):
+                raise ValueError("Rows not used by the model.")
+            positions[positions >= n_train] -= n_train - self._train_idx
+
+            return flt(pred[positions])
 
         except ValueError:  # Calculate new predictions
             # When there is a pipeline, apply transformations first
-            for transformer in self.pipeline:
-                if not transformer._train_only:
-                    X, y = custom_transform(transformer, self.branch, (X, y), verbose)
-
-            # Scale the data if needed
-            if self.scaler:
-                X = self.scaler.transform(X)
+            X, y = self._transform_new(X, y, verbose)
 
             if y is None:
-                return getattr(self.estimator, method)(X)
+                return getattr(self.estimator, method)(self._arr(X))
             else:
                 if metric is None:
                     if self.T.goal == "class":
@@ -768,43 +1875,75 @@ class BaseModel(BaseModelPlotter):
                 if sample_weight is not None:
                     kwargs["sample_weight"] = sample_weight
 
-                return metric(self.estimator, X, y, **kwargs)
+                return metric(self.estimator, self._arr(X), y, **kwargs)
 
     @composed(crash, method_to_log, typechecked)
     def predict(
         self,
         X: Union[slice, X_TYPES, Y_TYPES],
         verbose: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        filename: Optional[str] = None,
     ):
         """Get predictions on new data."""
-        return self._prediction(X, verbose=verbose, method="predict")
+        return self._prediction(
+            X=X,
+            chunksize=chunksize,
+            filename=filename,
+            verbose=verbose,
+            method="predict",
+        )
 
     @composed(crash, method_to_log, typechecked)
     def predict_proba(
         self,
         X: Union[slice, X_TYPES, Y_TYPES],
         verbose: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        filename: Optional[str] = None,
     ):
         """Get probability predictions on new data."""
-        return self._prediction(X, verbose=verbose, method="predict_proba")
+        return self._prediction(
+            X=X,
+            chunksize=chunksize,
+            filename=filename,
+            verbose=verbose,
+            method="predict_proba",
+        )
 
     @composed(crash, method_to_log, typechecked)
     def predict_log_proba(
         self,
         X: Union[slice, X_TYPES, Y_TYPES],
         verbose: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        filename: Optional[str] = None,
     ):
         """Get log probability predictions on new data."""
-        return self._prediction(X, verbose=verbose, method="predict_log_proba")
+        return self._prediction(
+            X=X,
+            chunksize=chunksize,
+            filename=filename,
+            verbose=verbose,
+            method="predict_log_proba",
+        )
 
     @composed(crash, method_to_log, typechecked)
     def decision_function(
         self,
         X: Union[slice, X_TYPES, Y_TYPES],
         verbose: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        filename: Optional[str] = None,
     ):
         """Get the decision function on new data."""
-        return self._prediction(X, verbose=verbose, method="decision_function")
+        return self._prediction(
+            X=X,
+            chunksize=chunksize,
+            filename=filename,
+            verbose=verbose,
+            method="decision_function",
+        )
 
     @composed(crash, method_to_log, typechecked)
     def score(
@@ -830,91 +1969,97 @@ class BaseModel(BaseModelPlotter):
     @property
     def predict_train(self):
         if self._pred[0] is None:
-            self._pred[0] = self.estimator.predict(arr(self.X_train))
+            self._pred[0] = self.estimator.predict(self._arr(self._X_train))
         return self._pred[0]
 
     @property
     def predict_test(self):
         if self._pred[1] is None:
-            self._pred[1] = self.estimator.predict(arr(self.X_test))
+            self._pred[1] = self.estimator.predict(self._arr(self._X_test))
         return self._pred[1]
 
     @property
     def predict_holdout(self):
         if self.T.holdout is not None and self._pred[2] is None:
-            self._pred[2] = self.estimator.predict(arr(self.X_holdout))
+            self._pred[2] = self.estimator.predict(self._arr(self._X_holdout))
         return self._pred[2]
 
     @property
     def predict_proba_train(self):
         if self._pred[3] is None:
-            self._pred[3] = self.estimator.predict_proba(arr(self.X_train))
+            self._pred[3] = self.estimator.predict_proba(self._arr(self._X_train))
         return self._pred[3]
 
     @property
     def predict_proba_test(self):
         if self._pred[4] is None:
-            self._pred[4] = self.estimator.predict_proba(arr(self.X_test))
+            self._pred[4] = self.estimator.predict_proba(self._arr(self._X_test))
         return self._pred[4]
 
     @property
     def predict_proba_holdout(self):
         if self.T.holdout is not None and self._pred[5] is None:
-            self._pred[5] = self.estimator.predict_proba(arr(self.X_holdout))
+            self._pred[5] = self.estimator.predict_proba(self._arr(self._X_holdout))
         return self._pred[5]
 
     @property
     def predict_log_proba_train(self):
         if self._pred[6] is None:
-            self._pred[6] = self.estimator.predict_log_proba(arr(self.X_train))
+            self._pred[6] = self.estimator.predict_log_proba(self._arr(self._X_train))
         return self._pred[6]
 
     @property
     def predict_log_proba_test(self):
         if self._pred[7] is None:
-            self._pred[7] = self.estimator.predict_log_proba(arr(self.X_test))
+            self._pred[7] = self.estimator.predict_log_proba(self._arr(self._X_test))
         return self._pred[7]
 
     @property
     def predict_log_proba_holdout(self):
         if self.T.holdout is not None and self._pred[8] is None:
-            self._pred[8] = self.estimator.predict_log_proba(arr(self.X_holdout))
+            self._pred[8] = self.estimator.predict_log_proba(self._arr(self._X_holdout))
         return self._pred[8]
 
     @property
     def decision_function_train(self):
         if self._pred[9] is None:
-            self._pred[9] = self.estimator.decision_function(arr(self.X_train))
+            self._pred[9] = self.estimator.decision_function(self._arr(self._X_train))
         return self._pred[9]
 
     @property
     def decision_function_test(self):
         if self._pred[10] is None:
-            self._pred[10] = self.estimator.decision_function(arr(self.X_test))
+            self._pred[10] = self.estimator.decision_function(self._arr(self._X_test))
         return self._pred[10]
 
     @property
     def decision_function_holdout(self):
         if self.T.holdout is not None and self._pred[11] is None:
-            self._pred[11] = self.estimator.decision_function(arr(self.X_holdout))
+            self._pred[11] = self.estimator.decision_function(
+                self._arr(self._X_holdout)
+            )
         return self._pred[11]
 
     @property
     def score_train(self):
         if self._pred[12] is None:
-            self._pred[12] = self.estimator.score(arr(self.X_train), self.y_train)
+            self._pred[12] = self.estimator.score(
+                self._arr(self._X_train), self._y_train
+            )
         return self._pred[12]
 
     @property
     def score_test(self):
         if self._pred[13] is None:
-            self._pred[13] = self.estimator.score(arr(self.X_test), self.y_test)
+            self._pred[13] = self.estimator.score(self._arr(self._X_test), self._y_test)
         return self._pred[13]
 
     @property
     def score_holdout(self):
         if self.T.holdout is not None and self._pred[14] is None:
-            self._pred[14] = self.estimator.score(arr(self.X_holdout), self.y_holdout)
+            self._pred[14] = self.estimator.score(
+                self._arr(self._X_holdout), self.y_holdout
+            )
         return self._pred[14]
 
     # Data Properties ============================================== >>
@@ -925,18 +2070,18 @@ class BaseModel(BaseModelPlotter):
 
     @property
     def train(self):
-        return merge(self.X_train, self.y_train)
+        return merge(self._X_train, self._y_train)
 
     @property
     def test(self):
-        return merge(self.X_test, self.y_test)
+        return merge(self._X_test, self._y_test)
 
     @property
     def holdout(self):
         if self.branch.holdout is not None:
             if self.scaler:
                 return merge(
-                    self.scaler.transform(self.branch.holdout.iloc[:, :-1]),
+                    self._get_scaled("holdout"),
                     self.branch.holdout.iloc[:, -1],
                 )
             else:
@@ -944,30 +2089,67 @@ class BaseModel(BaseModelPlotter):
 
     @property
     def X(self):
-        return pd.concat([self.X_train, self.X_test])
+        return pd.concat([self._X_train, self._X_test])
 
     @property
     def y(self):
-        return pd.concat([self.y_train, self.y_test])
+        return pd.concat([self._y_train, self._y_test])
 
     @property
     def X_train(self):
         if self.scaler:
-            return self.scaler.transform(self.branch.X_train[:self._train_idx])
+            return self._get_scaled("train").copy()
         else:
             return self.branch.X_train[:self._train_idx]
 
     @property
     def X_test(self):
         if self.scaler:
-            return self.scaler.transform(self.branch.X_test)
+            return self._get_scaled("test").copy()
         else:
             return self.branch.X_test
 
     @property
     def X_holdout(self):
         if self.branch.holdout is not None:
-            return self.holdout.iloc[:, :-1]
+            if self.scaler:
+                return self._get_scaled("holdout").copy()
+            else:
+                return self.branch.holdout.iloc[:, :-1]
+
+    # The properties below return the cached scaled sets and the views
+    # of the branch's data without copying them. They are for internal
+    # use only and must never be modified
+
+    @property
+    def _X_train(self):
+        if self.scaler:
+            return self._get_scaled("train")
+        else:
+            return self.branch._X_train[:self._train_idx]
+
+    @property
+    def _X_test(self):
+        if self.scaler:
+            return self._get_scaled("test")
+        else:
+            return self.branch._X_test
+
+    @property
+    def _X_holdout(self):
+        if self.branch.holdout is not None:
+            if self.scaler:
+                return self._get_scaled("holdout")
+            else:
+                return self.branch.holdout.iloc[:, :-1]
+
+    @property
+    def _y_train(self):
+        return self.branch._y_train[:self._train_idx]
+
+    @property
+    def _y_test(self):
+        return self.branch._y_test
 
     @property
     def y_train(self):
@@ -980,6 +2162,45 @@ class BaseModel(BaseModelPlotter):
 
     # Utility methods ============================================== >>
 
+    def _get_scaled(self, dataset):
+        """Get the scaled features of a data set.
+
+        Scaling the data on every call to a data attribute is expensive,
+        so the scaled sets are cached if `cache_scaled=True`. A cached
+        set is only used if it was created from the current data in the
+        branch and with the current size of the training set.
+
+        Parameters
+        ----------
+        dataset: str
+            Data set to scale. Choose from: train, test or holdout.
+
+        Returns
+        -------
+        X: pd.DataFrame
+            Scaled feature set.
+
+        """
+        data = self.branch.holdout if dataset == "holdout" else self.branch.data
+        n_rows = self._train_idx if dataset == "train" else None
+        if dataset in self._scaled:
+            cached_data, cached_rows, X = self._scaled[dataset]
+            if cached_data is data and cached_rows == n_rows:
+                return X
+
+        if dataset == "train":
+            X = self.branch._X_train[:self._train_idx]
+        elif dataset == "test":
+            X = self.branch._X_test
+        else:
+            X = data.iloc[:, :-1]
+
+        X = self.scaler.transform(X)
+        if self.cache_scaled:
+            self._scaled[dataset] = (data, n_rows, X)
+
+        return X
+
     def _final_output(self):
         """Returns the model's final output as a string."""
         # If bootstrap was used, we use a different format
@@ -1097,9 +2318,9 @@ class BaseModel(BaseModelPlotter):
 
         calibrator = CalibratedClassifierCV(self.estimator, **kwargs)
         if kwargs.get("cv") != "prefit":
-            self.estimator = calibrator.fit(self.X_train, self.y_train)
+            self.estimator = calibrator.fit(self._arr(self._X_train), self._y_train)
         else:
-            self.estimator = calibrator.fit(self.X_test, self.y_test)
+            self.estimator = calibrator.fit(self._arr(self._X_test), self._y_test)
 
         self.clear()  # Clear model since we have a new estimator
 
@@ -1127,9 +2348,11 @@ class BaseModel(BaseModelPlotter):
             - Prediction attributes.
             - Metrics scores.
             - Shap values.
+            - Cached scaled data sets.
 
         """
         self._pred = [None] * 15
+        self._scaled = {}
         self._scores = CustomDict(
             train=CustomDict(),
             test=CustomDict(),
@@ -1137,6 +2360,52 @@ class BaseModel(BaseModelPlotter):
         )
         self._shap = ShapExplanation(self)
 
+    @composed(crash, typechecked)
+    def compile_predictor(self, method: str = "predict"):
+        """Compile the model's pipeline for low-latency predictions.
+
+        Freeze the transformers in the branch (except those applied
+        only on the training set), the scaler and the estimator in a
+        callable that makes predictions on new data. The columns used
+        by every transformer are resolved beforehand, and the input
+        validation and logging of the prediction methods are skipped.
+        Use it to serve predictions on single rows.
+
+        Parameters
+        ----------
+        method: str, optional (default="predict")
+            Prediction method to be applied to the estimator. Choose
+            from: predict, predict_proba, predict_log_proba or
+            decision_function.
+
+        Returns
+        -------
+        predictor: CompiledPredictor
+            Callable that accepts a single row (sequence or dict), a
+            (numpy record) array or a dataframe with the features in
+            their original format, and returns the predictions.
+
+        """
+        methods = ("predict", "predict_proba", "predict_log_proba", "decision_function")
+        if method not in methods:
+            raise ValueError(
+                "Invalid value for the method parameter. Choose from: "
+                f"{', '.join(methods)}, got {method}."
+            )
+        elif not hasattr(self.estimator, method):
+            raise AttributeError(
+                f"{self.estimator.__class__.__name__} doesn't have a {method} method!"
+            )
+
+        # Resolve the columns on a sample of the original dataset
+        return CompiledPredictor(
+            transformers=[t for t in self.pipeline if not t._train_only],
+            scaler=self.scaler,
+            estimator=self.estimator,
+            X=self.T._branches["og"].X.head(100),
+            method=method,
+        )
+
     @composed(crash, method_to_log)
     def cross_validate(self, **kwargs):
         """Evaluate the model using cross-validation.
@@ -1474,11 +2743,11 @@ class BaseModel(BaseModelPlotter):
         if hasattr(self, "custom_fit"):
             self.custom_fit(
                 est=self.estimator,
-                train=(X, y),
+                train=(self._arr(X), y),
                 params=self._est_params_fit,
             )
         else:
-            self.estimator.fit(arr(X), y, **self._est_params_fit)
+            self.estimator.fit(self._arr(X), y, **self._est_params_fit)
 
         self.clear()  # Clear model since we have a new estimator
 
@@ -1554,15 +2823,18 @@ class BaseModel(BaseModelPlotter):
     @composed(crash, method_to_log, typechecked)
     def transform(
         self,
-        X: X_TYPES,
+        X: Union[str, X_TYPES],
         y: Optional[Y_TYPES] = None,
         verbose: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        filename: Optional[str] = None,
     ):
         """Transform new data through the model's branch.
 
         Transformers that are only applied on the training set are
         skipped. If the model used feature scaling, the data is also
-        scaled.
+        scaled. Large datasets can be streamed through the branch in
+        chunks.
 
         Parameters
         ----------
@@ -1581,6 +2853,17 @@ class BaseModel(BaseModelPlotter):
             Verbosity level for the transformers. If None, it uses the
             estimator's own verbosity.
 
+        chunksize: int or None, optional (default=None)
+            Number of rows per chunk to stream the data through the
+            branch. If not None, X can also be the path to a csv or
+            parquet file and y can only be None or a column in X.
+            Iterators of chunks in X are always streamed.
+
+        filename: str or None, optional (default=None)
+            Name of the csv or parquet file to write the streamed
+            data to. If None, a generator with the transformed data
+            per chunk is returned. Only if the data is streamed.
+
         Returns
         -------
         X: pd.DataFrame
@@ -1590,11 +2873,22 @@ class BaseModel(BaseModelPlotter):
             Transformed target column. Only returned if provided.
 
         """
-        for transformer in self.pipeline:
-            if not transformer._train_only:
-                X, y = custom_transform(transformer, self.branch, (X, y), verbose)
+        if chunksize is not None or isinstance(X, Iterator):
+            if y is not None and not isinstance(y, (int, str)):
+                raise ValueError(
+                    "Invalid value for the y parameter. When streaming the data, "
+                    f"y should be None or a column in X, got {type(y).__name__}."
+                )
 
-        if self.scaler:
-            X = self.scaler.transform(X)
+            def transform_chunk(chunk):
+                """Transform a chunk. Function for parallelization."""
+                X_chunk, y_chunk = self.T._prepare_input(chunk, y)
+                X_chunk, y_chunk = self._transform_new(X_chunk, y_chunk, verbose)
+                if filename is None:
+                    return variable_return(X_chunk, y_chunk)
+                else:
+                    return X_chunk if y_chunk is None else merge(X_chunk, y_chunk)
+
+            return stream_chunks(transform_chunk, X, chunksize, filename, self.T.n_jobs)
 
-        return variable_return(X, y)
+        return variable_return(*self._transform_new(X, y, verbose))
@@ -191,11 +191,11 @@ class BasePredictor:
 
         def frac(m):
             """Return the fraction of the train set used for the model."""
-            n_models = len(m.branch.train) / m._train_idx
+            n_models = len(m.branch._train) / m._train_idx
             if n_models == int(n_models):
                 return round(1.0 / n_models, 2)
             else:
-                return round(m._train_idx / len(m.branch.train), 2)
+                return round(m._train_idx / len(m.branch._train), 2)
 
         df = pd.DataFrame(
             data=[m.results for m in self._models.values()],
@@ -204,7 +204,7 @@ class BasePredictor:
         ).dropna(axis=1, how="all")
 
         # For sh and ts runs, include the fraction of training set
-        if any(m._train_idx != len(m.branch.train) for m in self._models.values()):
+        if any(m._train_idx != len(m.branch._train) for m in self._models.values()):
             df = df.set_index(
                 pd.MultiIndex.from_arrays(
                     [[frac(m) for m in self._models.values()], self.models],
@@ -281,22 +281,20 @@ class BasePredictor:
         if not branch:
             branch = self.branch
 
-        indices = list(branch.dataset.index)
-        if branch.holdout is not None:
-            indices += list(branch.holdout.index)
-
         if index is None:
-            inc = list(branch.idx[1]) if return_test else list(branch.X.index)
+            inc = list(branch.idx[1]) if return_test else list(branch._X.index)
         elif isinstance(index, slice):
-            inc = indices[index]
+            inc = list(branch._get_index()[index])
         else:
-            inc = []
-            for idx in lst(index):
-                if idx in indices:
-                    inc.append(idx)
-                elif isinstance(idx, int):
-                    if -len(indices) <= idx <= len(indices):
-                        inc.append(indices[idx])
+            indices = branch._get_index()
+            rows = list(index) if isinstance(index, range) else lst(index)
+
+            # Names are looked up first, the rest are positions
+            positions = branch._get_positions(rows)
+            for i in np.flatnonzero(positions < 0):
+                if isinstance(rows[i], int):
+                    if -len(indices) <= rows[i] < len(indices):
+                        positions[i] = rows[i] % len(indices)
                     else:
                         raise ValueError(
                             f"Invalid value for the index parameter. Value {index} is "
@@ -305,9 +303,11 @@ class BasePredictor:
                 else:
                     raise ValueError(
                         "Invalid value for the index parameter. "
-                        f"Value {idx} not found in the dataset."
+                        f"Value {rows[i]} not found in the dataset."
                     )
 
+            inc = list(indices[positions])
+
         if not inc:
             raise ValueError(
                 "Invalid value for the index parameter, got "
@@ -364,7 +364,7 @@ class BasePredictor:
             branch = self.branch
 
         # Select dataframe from which to get the columns
-        df = branch.dataset if include_target else branch.X
+        df = branch.dataset if include_target else branch._X
 
         inc, exc = [], []
         if columns is None:
@@ -526,6 +526,7 @@ class BasePredictor:
             - Prediction attributes.
             - Metrics scores.
             - Shap values.
+            - Cached scaled data sets.
 
         """
         for model in self._models.values():
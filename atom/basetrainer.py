@@ -11,7 +11,10 @@ Description: Module containing the parent class for the trainers.
 import mlflow
 import importlib
 import traceback
+from copy import copy
+from collections import OrderedDict
 from datetime import datetime
+from joblib import Parallel, delayed
 import matplotlib.pyplot as plt
 from skopt.callbacks import DeadlineStopper, DeltaXStopper, DeltaYStopper
 
@@ -23,7 +26,7 @@ from .data_cleaning import BaseTransformer
 from .utils import (
     SEQUENCE, OPTIONAL_PACKAGES, lst, time_to_str, is_multidim,
     get_custom_scorer, get_best_score, check_scaling, delete, PlotCallback,
-    CustomDict,
+    MedianPruner, SuccessiveHalvingPruner, TrialStorage, CustomDict,
 )
 
 
@@ -113,6 +116,55 @@ class BaseTrainer(BaseTransformer, BasePredictor):
                 Number of folds for the cross-validation. If 1, the
                 training set is randomly split in a (sub)train and
                 validation set.
+            - batch_size: int, optional (default=1)
+                Maximum number of points that are evaluated at the
+                same time. If >1, the points (times the folds) are
+                evaluated asynchronously, using `n_jobs` workers.
+                As soon as a point is evaluated, its result is told
+                to the optimizer, which proposes a new point.
+            - strategy: str, optional (default="cl_min")
+                Constant liar strategy used to propose new points
+                while other points are still being evaluated. Choose
+                from: "cl_min", "cl_mean" or "cl_max". Only if
+                `batch_size>1`.
+            - pruner: str, callable or None, optional (default=None)
+                Strategy to stop unpromising calls of the BO before
+                all folds are evaluated. If not None, the folds are
+                fitted in order and the call is abandoned when the
+                pruner says so. Pruned calls are flagged in the `bo`
+                attribute and don't count towards the best score.
+                Since their score is incomplete, the optimizer is
+                told the worst score of the completed calls instead
+                (or their partial score if no call completed yet).
+                Only for `cv>1` and `batch_size=1`.
+                Choose from:
+                    - None: Don't prune any calls.
+                    - "median": Prune if worse than the median of the
+                                previous calls at the same fold.
+                    - "sh" or "asha": Asynchronous successive halving.
+                    - callable: Function with signature
+                                `pruner(step, score, history)` that
+                                returns whether to prune the call,
+                                where step is the fold's index,
+                                score the call's mean score so far
+                                and history the scores of previous
+                                calls at the same step.
+            - fixed_splits: bool, optional (default=False)
+                Whether to use the same cross-validation splits for
+                every call of the BO and for every model in the
+                branch. The folds transformed by the pipeline are
+                cached, so the pipeline is only fitted once per fold.
+            - cache_size: int, optional (default=10)
+                Maximum number of transformed folds in the cache.
+                Only if `fixed_splits=True`.
+            - storage: str or None, optional (default=None)
+                Path to a SQLite database where every call of the BO
+                is stored as soon as it's evaluated. The calls stored
+                for the same model, branch, data and metric are used
+                to warm-start the optimizer, and count towards
+                `n_calls`, so an interrupted run resumes where it
+                stopped. Stored calls are never evaluated again. If
+                None, the calls are not persisted.
             - callback: callable or list of callables, optional (default=None)
                 Callbacks for the BO.
             - dimensions: dict, sequence or None, optional (default=None)
@@ -132,6 +184,21 @@ class BaseTrainer(BaseTransformer, BasePredictor):
         use in the bootstrap algorithm. If 0, no bootstrap is performed.
         If sequence, the n-th value will apply to the n-th model.
 
+    oob_score: bool, optional (default=False)
+        Whether to also score every bootstrapped estimator on the rows
+        of the training set that were left out of its sample (out-of-
+        bag). The scores are stored in the model's `metric_oob`,
+        `mean_oob` and `std_oob` attributes. Only if `n_bootstrap>0`.
+
+    parallel: bool, optional (default=False)
+        Whether to train the models in parallel. If True, the models
+        are distributed over a pool of min(`n_jobs`, n_models) worker
+        processes, and the remaining cores are divided among the
+        estimators, e.g. with n_jobs=8 and 4 models, every model is
+        trained on 2 cores. The output of every model is buffered and
+        printed in order once all models are finished. This option is
+        not compatible with the `plot` parameter in `bo_params`.
+
     n_jobs: int, optional (default=1)
         Number of cores to use for parallel processing.
             - If >0: Number of cores to use.
@@ -174,8 +241,8 @@ class BaseTrainer(BaseTransformer, BasePredictor):
 
     def __init__(
         self, models, metric, greater_is_better, needs_proba, needs_threshold,
-        n_calls, n_initial_points, est_params, bo_params, n_bootstrap, n_jobs,
-        verbose, warnings, logger, experiment, random_state,
+        n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+        parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
     ):
         super().__init__(
             n_jobs=n_jobs,
@@ -197,6 +264,8 @@ class BaseTrainer(BaseTransformer, BasePredictor):
         self.est_params = est_params
         self.bo_params = bo_params
         self.n_bootstrap = n_bootstrap
+        self.oob_score = oob_score
+        self.parallel = parallel
 
         # Branching attributes
         self.index = True
@@ -207,8 +276,20 @@ class BaseTrainer(BaseTransformer, BasePredictor):
         # Training attributes
         self.task = None
         self.scaled = None
-        self._bo = {"base_estimator": "GP", "cv": 1, "callback": [], "kwargs": {}}
+        self._bo = {
+            "base_estimator": "GP",
+            "cv": 1,
+            "batch_size": 1,
+            "strategy": "cl_min",
+            "fixed_splits": False,
+            "cache_size": 10,
+            "pruner": None,
+            "storage": None,
+            "callback": [],
+            "kwargs": {},
+        }
         self._errors = CustomDict()
+        self._fold_cache = OrderedDict()
 
     def _check_parameters(self):
         """Check the validity of the input parameters."""
@@ -398,6 +479,11 @@ class BaseTrainer(BaseTransformer, BasePredictor):
                 self._bo["callback"].append(delta_y_callback)
 
             if self.bo_params.get("plot"):
+                if self.parallel:
+                    raise ValueError(
+                        "Invalid value for the plot parameter. Plotting the "
+                        "BO's progress is not possible when parallel=True."
+                    )
                 self._bo["callback"].append(PlotCallback(self))
 
             if "cv" in self.bo_params:
@@ -408,6 +494,63 @@ class BaseTrainer(BaseTransformer, BasePredictor):
                     )
                 self._bo["cv"] = self.bo_params["cv"]
 
+            if "batch_size" in self.bo_params:
+                if self.bo_params["batch_size"] <= 0:
+                    raise ValueError(
+                        "Invalid value for the batch_size parameter. Value "
+                        f"should be >0, got {self.bo_params['batch_size']}."
+                    )
+                self._bo["batch_size"] = self.bo_params["batch_size"]
+
+            if "strategy" in self.bo_params:
+                strategies = ["cl_min", "cl_mean", "cl_max"]
+                if self.bo_params["strategy"].lower() not in strategies:
+                    raise ValueError(
+                        "Invalid value for the strategy parameter, got "
+                        f"{self.bo_params['strategy']}. Choose from: "
+                        f"{', '.join(strategies)}."
+                    )
+                self._bo["strategy"] = self.bo_params["strategy"].lower()
+
+            if self.bo_params.get("pruner"):
+                pruners = dict(
+                    median=MedianPruner,
+                    sh=SuccessiveHalvingPruner,
+                    asha=SuccessiveHalvingPruner,
+                )
+
+                self._bo["pruner"] = self.bo_params["pruner"]
+                if isinstance(self._bo["pruner"], str):
+                    if self._bo["pruner"].lower() not in pruners:
+                        raise ValueError(
+                            "Invalid value for the pruner parameter, got "
+                            f"{self.bo_params['pruner']}. Choose from: "
+                            f"{', '.join(pruners)}."
+                        )
+                    self._bo["pruner"] = pruners[self._bo["pruner"].lower()]()
+
+                if self._bo["batch_size"] > 1:
+                    raise ValueError(
+                        "Invalid value for the pruner parameter. Pruning the "
+                        "BO's calls is not possible when batch_size>1."
+                    )
+
+            if self.bo_params.get("fixed_splits"):
+                self._bo["fixed_splits"] = True
+
+            if "cache_size" in self.bo_params:
+                if self.bo_params["cache_size"] <= 0:
+                    raise ValueError(
+                        "Invalid value for the cache_size parameter. Value "
+                        f"should be >0, got {self.bo_params['cache_size']}."
+                    )
+                self._bo["cache_size"] = self.bo_params["cache_size"]
+
+            if self.bo_params.get("storage"):
+                self._bo["storage"] = self.bo_params["storage"]
+                if not isinstance(self._bo["storage"], TrialStorage):
+                    self._bo["storage"] = TrialStorage(self._bo["storage"])
+
             if "early_stopping" in self.bo_params:
                 if self.bo_params["early_stopping"] <= 0:
                     raise ValueError(
@@ -459,6 +602,79 @@ class BaseTrainer(BaseTransformer, BasePredictor):
 
         return metric_dict
 
+    def _run_model(self, m):
+        """Run the BO, fit and bootstrap of a single model.
+
+        Parameters
+        ----------
+        m: Model
+            Model subclass to run.
+
+        Returns
+        -------
+        ex: Exception or None
+            Exception raised while running the model, if any.
+
+        """
+        model_time = datetime.now()
+
+        try:  # If an error occurs, skip the model
+            if self.experiment:  # Start mlflow run
+                m._run = mlflow.start_run(run_name=m.name)
+
+            # If it has predefined or custom dimensions, tune the model
+            if m._dimensions or hasattr(m, "get_dimensions"):
+                if self.__class__.__name__.startswith("Hyperband"):
+                    m.hyperband()
+                elif m._n_calls > 0:
+                    m.bayesian_optimization()
+
+            m.fit()
+
+            if m._n_bootstrap:
+                m.bootstrap()
+
+            # Get the total time spend on this model
+            setattr(m, "time", time_to_str(model_time))
+            self.log("-" * 49 + f"\nTotal time: {m.time}\n\n", 1)
+
+        except Exception as ex:
+            self.log(
+                "\nException encountered while running the "
+                f"{m.name} model. Removing model from pipeline. ", 1
+            )
+            self.log("".join(traceback.format_tb(ex.__traceback__))[:-1], 3)
+            self.log(f"{type(ex).__name__}: {ex}", 1)
+
+            if self.bo_params and self.bo_params.get("plot"):
+                PlotCallback.c += 1  # Next model
+                plt.close()  # Close the crashed plot
+
+            return ex
+
+        finally:
+            mlflow.end_run()  # Ends the current run (if any)
+
+    def _run_model_in_worker(self, m):
+        """Run a model in a parallel worker.
+
+        The trainer is a copy of the original, whose output is
+        buffered to be printed once all models are finished.
+
+        Returns
+        -------
+        m: Model
+            Model subclass after running.
+
+        ex: Exception or None
+            Exception raised while running the model, if any.
+
+        """
+        if self.experiment:  # Workers don't share the parent's experiment
+            mlflow.set_experiment(self.experiment)
+
+        return m, self._run_model(m)
+
     def _core_iteration(self):
         """Fit and evaluate the models in the pipeline."""
         t_init = datetime.now()  # Measure the time the whole pipeline takes
@@ -469,46 +685,42 @@ class BaseTrainer(BaseTransformer, BasePredictor):
         self.log(f"Metric: {', '.join(lst(self.metric))}\n", 1)
 
         to_remove = []
-        for i, m in enumerate(self._models.values()):
-            model_time = datetime.now()
-
-            try:  # If an error occurs, skip the model
-                if self.experiment:  # Start mlflow run
-                    m._run = mlflow.start_run(run_name=m.name)
-
-                # If it has predefined or custom dimensions, run the BO
-                if (m._dimensions or hasattr(m, "get_dimensions")) and m._n_calls > 0:
-                    m.bayesian_optimization()
-
-                m.fit()
-
-                if m._n_bootstrap:
-                    m.bootstrap()
-
-                # Get the total time spend on this model
-                setattr(m, "time", time_to_str(model_time))
-                self.log("-" * 49 + f"\nTotal time: {m.time}\n\n", 1)
-
-            except Exception as ex:
-                self.log(
-                    "\nException encountered while running the "
-                    f"{m.name} model. Removing model from pipeline. ", 1
-                )
-                self.log("".join(traceback.format_tb(ex.__traceback__))[:-1], 3)
-                self.log(f"{type(ex).__name__}: {ex}", 1)
+        if self.parallel and len(self._models) > 1:
+            # Divide the cores over the models and their estimators
+            n_models = min(self.n_jobs, len(self._models))
+            for m in self._models.values():
+                m.T = copy(self)
+                m.T._n_jobs = max(1, self.n_jobs // n_models)
+                m.T._log_buffer = []
+
+            results = Parallel(n_jobs=n_models)(
+                delayed(m.T._run_model_in_worker)(m) for m in self._models.values()
+            )
 
-                # Append exception to errors dictionary
-                self._errors[m.name] = ex
+            for m, ex in results:
+                # Print the output of every model in order
+                for msg, level in m.T._log_buffer:
+                    self.log(msg, level)
 
-                # Add model to "garbage collector"
-                # Cannot remove immediately to maintain the iteration order
-                to_remove.append(m.name)
+                # The model returns from the worker with copies of
+                # the trainer and branch, attach it to the originals
+                m.T = self
+                m.branch = self.branch
+                self._models[m.name] = m
 
-                if self.bo_params and self.bo_params.get("plot"):
-                    PlotCallback.c += 1  # Next model
-                    plt.close()  # Close the crashed plot
-            finally:
-                mlflow.end_run()  # Ends the current run (if any)
+                if ex is not None:
+                    self._errors[m.name] = ex
+                    to_remove.append(m.name)
+        else:
+            for m in self._models.values():
+                ex = self._run_model(m)
+                if ex is not None:
+                    # Append exception to errors dictionary
+                    self._errors[m.name] = ex
+
+                    # Add model to "garbage collector"
+                    # Cannot remove immediately to maintain the iteration order
+                    to_remove.append(m.name)
 
         delete(self, to_remove)  # Remove faulty models
 
@@ -494,6 +494,11 @@ class BaseTransformer:
             If 42, don't save to log.
 
         """
+        # Postpone the output when the model runs in a parallel worker
+        if self.__dict__.get("_log_buffer") is not None:
+            self._log_buffer.append((msg, level))
+            return
+
         if self.verbose >= level:
             print(msg)
 
@@ -8,6 +8,7 @@ Description: Module containing the Branch class.
 """
 
 # Standard packages
+import numpy as np
 import pandas as pd
 from inspect import signature
 from copy import copy
@@ -57,6 +58,8 @@ class Branch:
     def __init__(self, *args, parent=None):
         self.T, self.name = args[0], args[1]
         self._holdout = None  # Always reset holdout calculation
+        self._index = None  # Cached positions of the rows
+        self._split = None  # Cached size of the training set
         if not parent:
             self.pipeline = pd.Series(data=[], name=self.name, dtype="object")
             for attr in ("data", "idx", "mapping", "feature_importance"):
@@ -95,14 +98,96 @@ class Branch:
         """Get properties and attributes to call from parent."""
         attrs = []
         for p in dir(self):
-            if (
-                p in vars(self) and p not in ("T", "name", "data", "idx", "_holdout")
+            if not p.startswith("_") and (
+                p in vars(self) and p not in ("T", "name", "data", "idx")
                 or isinstance(getattr(Branch, p, None), property)
             ):
                 attrs.append(p)
 
         return attrs
 
+    def _get_index(self):
+        """Get the names of all rows in the branch.
+
+        The names of the rows in the dataset and holdout set are
+        cached together with a lookup table from name to position.
+        The cache is rebuilt only when the index of the data changes.
+
+        Returns
+        -------
+        index: pd.Index
+            Names of the rows in the dataset followed by the holdout set.
+
+        """
+        holdout = self.holdout
+        key = (self.data.index, holdout.index if holdout is not None else None)
+        if self._index is None or any(a is not b for a, b in zip(key, self._index[0])):
+            index = self.data.index
+            if holdout is not None:
+                index = index.append(holdout.index)
+
+            # Keep the first position of every name for the lookup
+            first = ~index.duplicated()
+            self._index = (key, index, index[first], np.flatnonzero(first))
+
+        return self._index[1]
+
+    def _get_positions(self, rows):
+        """Get the positions of rows in the dataset and holdout set.
+
+        Parameters
+        ----------
+        rows: sequence
+            Names of the rows.
+
+        Returns
+        -------
+        positions: np.ndarray
+            Position of (the first row with) every name in the
+            dataset followed by the holdout set. -1 if the name
+            is not found.
+
+        """
+        self._get_index()  # Refresh the cache if needed
+        _, _, unique, first = self._index
+
+        try:
+            positions = unique.get_indexer(pd.Index(rows, dtype="object"))
+        except TypeError:  # Unhashable rows (e.g. arrays) can't be names
+            return np.full(len(rows), -1)
+
+        return np.where(positions >= 0, first[positions], -1)
+
+    def _get_split(self):
+        """Get the position in the dataset where the test set starts.
+
+        The dataset contains the rows of the training set followed by
+        the rows of the test set. When that's the case, the data sets
+        are selected with positional slices, which return views of the
+        data instead of copies. The position is cached and only
+        recalculated when the data or the indices of the sets change.
+
+        Returns
+        -------
+        n_train: int or None
+            Number of rows in the training set. None if the rows of
+            the dataset aren't ordered as train + test.
+
+        """
+        key = (self.data.index, self.idx[0], self.idx[1])
+        if self._split is None or any(a is not b for a, b in zip(key, self._split[0])):
+            n_train, index = len(self.idx[0]), self.data.index
+            if (
+                len(index) == n_train + len(self.idx[1])
+                and index[:n_train].equals(pd.Index(self.idx[0]))
+                and index[n_train:].equals(pd.Index(self.idx[1]))
+            ):
+                self._split = (key, n_train)
+            else:
+                self._split = (key, None)
+
+        return self._split[1]
+
     def _get_depending_models(self):
         """Return the models that are dependent on this branch."""
         return [m.name for m in self.T._models.values() if m.branch is self]
@@ -276,25 +361,25 @@ class Branch:
     @property
     def train(self):
         """Training set."""
-        return self.data.loc[self.idx[0], :]
+        return self._train.copy()
 
     @train.setter
     @typechecked
     def train(self, value: X_TYPES):
         df = self._check_setter("train", value)
-        self.data = self.T._set_index(pd.concat([df, self.test]))
+        self.data = self.T._set_index(pd.concat([df, self._test]))
         self.idx[0] = self.data.index[:len(df)]
 
     @property
     def test(self):
         """Test set."""
-        return self.data.loc[self.idx[1], :]
+        return self._test.copy()
 
     @test.setter
     @typechecked
     def test(self, value: X_TYPES):
         df = self._check_setter("test", value)
-        self.data = self.T._set_index(pd.concat([self.train, df]))
+        self.data = self.T._set_index(pd.concat([self._train, df]))
         self.idx[1] = self.data.index[-len(df):]
 
     @property
@@ -313,7 +398,7 @@ class Branch:
     @property
     def X(self):
         """Feature set."""
-        return self.data.drop(self.target, axis=1)
+        return self._X.copy()
 
     @X.setter
     @typechecked
@@ -335,46 +420,93 @@ class Branch:
     @property
     def X_train(self):
         """Features of the training set."""
-        return self.train.drop(self.target, axis=1)
+        return self._X_train.copy()
 
     @X_train.setter
     @typechecked
     def X_train(self, value: X_TYPES):
         df = self._check_setter("X_train", value)
-        self.data = pd.concat([merge(df, self.train[self.target]), self.test])
+        self.data = pd.concat([merge(df, self._y_train), self._test])
 
     @property
     def X_test(self):
         """Features of the test set."""
-        return self.test.drop(self.target, axis=1)
+        return self._X_test.copy()
 
     @X_test.setter
     @typechecked
     def X_test(self, value: X_TYPES):
         df = self._check_setter("X_test", value)
-        self.data = pd.concat([self.train, merge(df, self.test[self.target])])
+        self.data = pd.concat([self._train, merge(df, self._y_test)])
 
     @property
     def y_train(self):
         """Target column of the training set."""
-        return self.train[self.target]
+        return self._y_train.copy()
 
     @y_train.setter
     @typechecked
     def y_train(self, value: SEQUENCE_TYPES):
         series = self._check_setter("y_train", value)
-        self.data = pd.concat([merge(self.X_train, series), self.test])
+        self.data = pd.concat([merge(self._X_train, series), self._test])
 
     @property
     def y_test(self):
         """Target column of the test set."""
-        return self.test[self.target]
+        return self._y_test.copy()
 
     @y_test.setter
     @typechecked
     def y_test(self, value: SEQUENCE_TYPES):
         series = self._check_setter("y_test", value)
-        self.data = pd.concat([self.train, merge(self.X_test, series)])
+        self.data = pd.concat([self._train, merge(self._X_test, series)])
+
+    # The properties below return the data sets as views of the data
+    # when the rows are ordered, instead of copying them. They are for
+    # internal use only and must never be modified in place
+
+    @property
+    def _train(self):
+        """Training set (view)."""
+        n_train = self._get_split()
+        if n_train is None:
+            return self.data.loc[self.idx[0], :]
+        else:
+            return self.data.iloc[:n_train]
+
+    @property
+    def _test(self):
+        """Test set (view)."""
+        n_train = self._get_split()
+        if n_train is None:
+            return self.data.loc[self.idx[1], :]
+        else:
+            return self.data.iloc[n_train:]
+
+    @property
+    def _X(self):
+        """Feature set (view)."""
+        return self.data.iloc[:, :-1]
+
+    @property
+    def _X_train(self):
+        """Features of the training set (view)."""
+        return self._train.iloc[:, :-1]
+
+    @property
+    def _X_test(self):
+        """Features of the test set (view)."""
+        return self._test.iloc[:, :-1]
+
+    @property
+    def _y_train(self):
+        """Target column of the training set (view)."""
+        return self._train[self.target]
+
+    @property
+    def _y_test(self):
+        """Target column of the test set (view)."""
+        return self._test[self.target]
 
     @property
     def shape(self):
@@ -9,11 +9,14 @@ Description: Module containing the data cleaning estimators.
 
 # Standard packages
 import numpy as np
+import pandas as pd
 from inspect import signature
+from scipy import sparse
 from scipy.stats import zscore
 from typeguard import typechecked
 from collections import defaultdict
 from typing import Union, Optional, Dict, Any
+from joblib import Parallel, delayed
 from sklearn.base import BaseEstimator, clone
 from sklearn.impute import SimpleImputer, KNNImputer
 from sklearn.preprocessing import (
@@ -34,6 +37,407 @@ from .utils import (
 )
 
 
+# Functions ======================================================== >>
+
+def clean_column(
+    column,
+    drop_types,
+    strip_categorical,
+    drop_max_cardinality,
+    drop_min_cardinality,
+):
+    """Apply the data cleaning steps on a single column.
+
+    Parameters
+    ----------
+    column: pd.Series
+        Column to clean.
+
+    drop_types: str, sequence or None
+        Data types of the columns to drop.
+
+    strip_categorical: bool
+        Whether to strip spaces from the categorical columns.
+
+    drop_max_cardinality: bool
+        Whether to drop categorical columns with maximum cardinality.
+
+    drop_min_cardinality: bool
+        Whether to drop columns with minimum cardinality.
+
+    Returns
+    -------
+    column: pd.Series or None
+        Cleaned column. None if the column is dropped.
+
+    message: tuple or None
+        Message and verbosity level to log (if any).
+
+    """
+    # Count occurrences in the column
+    n_unique = column.nunique(dropna=True)
+
+    # Drop features with invalid data type
+    if column.dtype.name in lst(drop_types):
+        return None, (
+            f" --> Dropping feature {column.name} for having a "
+            f"prohibited type: {column.dtype.name}.", 2
+        )
+
+    elif column.dtype.name in ("object", "category"):
+        if strip_categorical:
+            # Strip strings from blank spaces
+            column = column.apply(
+                lambda val: val.strip() if isinstance(val, str) else val
+            )
+
+        # Drop features where all values are different
+        if drop_max_cardinality and n_unique == len(column):
+            return None, (
+                f" --> Dropping feature {column.name} due to maximum cardinality.", 2
+            )
+
+    # Drop features with minimum cardinality (all values are the same)
+    if drop_min_cardinality:
+        all_nan = column.isna().sum() == len(column)
+        if n_unique == 1 or all_nan:
+            return None, (
+                f" --> Dropping feature {column.name} due to minimum "
+                f"cardinality. Contains only 1 class: "
+                f"{'NaN' if all_nan else column.unique()[0]}.", 0
+            )
+
+    return column, None
+
+
+def fit_imputer(X, strategy):
+    """Fit an imputer on a single column.
+
+    Parameters
+    ----------
+    X: pd.DataFrame
+        Dataframe with the column to fit the imputer on.
+
+    strategy: str
+        Imputing strategy. Choose from: mean, median, knn or
+        most_frequent.
+
+    Returns
+    -------
+    imputer: SimpleImputer or KNNImputer
+        Fitted imputer.
+
+    """
+    if strategy == "knn":
+        return KNNImputer().fit(X)
+    elif strategy == "most_frequent":
+        return SimpleImputer(
+            strategy="constant",
+            fill_value=X.iloc[:, 0].mode()[0],
+        ).fit(X)
+    else:
+        return SimpleImputer(strategy=strategy).fit(X)
+
+
+def impute_column(X, imputer):
+    """Impute the missing values of a single column.
+
+    Parameters
+    ----------
+    X: pd.DataFrame
+        Dataframe with the column to impute.
+
+    imputer: imputer, int, float or str
+        Fitted imputer or value with which to impute.
+
+    Returns
+    -------
+    column: pd.Series
+        Imputed column.
+
+    """
+    if hasattr(imputer, "transform"):
+        values = imputer.transform(X)[:, 0]
+        return pd.Series(values, index=X.index, name=X.columns[0])
+    else:
+        return X.iloc[:, 0].replace(np.NaN, imputer)
+
+
+def fit_encoder(X, y, estimator, max_onehot, ordinal=None, frac_to_other=None):
+    """Fit an encoder on a single categorical column.
+
+    Parameters
+    ----------
+    X: pd.DataFrame
+        Dataframe with the column to fit the encoder on.
+
+    y: pd.Series or None
+        Target column corresponding to X.
+
+    estimator: estimator
+        Unfitted encoder for high cardinality columns.
+
+    max_onehot: int
+        Maximum number of unique values to perform one-hot encoding.
+
+    ordinal: sequence or None, optional (default=None)
+        Order of the classes if the feature is ordinal.
+
+    frac_to_other: int or None, optional (default=None)
+        Classes with less or equal occurrences are replaced with
+        `other`.
+
+    Returns
+    -------
+    to_other: list
+        Classes that are replaced with `other`.
+
+    categories: list
+        Unique classes in the column.
+
+    encoder: estimator
+        Fitted encoder.
+
+    layout: dict or None
+        Lookup table of the encoder (see `encoder_layout`). None for
+        custom estimators that aren't part of category-encoders.
+
+    """
+    col = X.columns[0]
+
+    # Group uncommon classes into "other"
+    to_other = []
+    if frac_to_other:
+        counts = X[col].value_counts()
+        to_other = counts[counts <= frac_to_other].index.tolist()
+        if to_other:
+            X = X.replace({col: {category: "other" for category in to_other}})
+
+    # Get the unique categories before fitting
+    categories = X[col].unique().tolist()
+
+    # Perform encoding type dependent on number of unique values
+    if ordinal is not None or len(categories) == 2:
+        # Create a custom mapping: 0 to N - 1
+        order = X[col].unique() if ordinal is None else ordinal
+        mapping = {v: i for i, v in enumerate(order)}
+        if np.NaN not in mapping:  # Encoder always needs mapping of NaN value
+            mapping[np.NaN] = -1
+
+        encoder = OrdinalEncoder(
+            mapping=[{"col": col, "mapping": mapping}],
+            handle_missing="return_nan",
+            handle_unknown="value",
+        ).fit(X)
+
+    elif 2 < len(categories) <= max_onehot:
+        encoder = OneHotEncoder(
+            use_cat_names=True,
+            handle_missing="return_nan",
+            handle_unknown="value",
+        ).fit(X)
+
+    else:
+        args = [X]
+        if "y" in signature(estimator.fit).parameters:
+            args.append(y)
+        encoder = clone(estimator).fit(*args)
+
+    # Only category-encoders' estimators are guaranteed to map every
+    # class to a fixed output, custom estimators keep their transform
+    layout = None
+    if encoder.__class__.__module__.startswith("category_encoders"):
+        known = categories + [c for c in ordinal or [] if c not in categories]
+        layout = encoder_layout(encoder, col, known, to_other)
+
+    return to_other, categories, encoder, layout
+
+
+def encoder_layout(encoder, col, categories, to_other):
+    """Precompute the output of a fitted encoder for every class.
+
+    The encoder transforms every known class once, together with a
+    missing value and a class unseen during fit. The rows of the
+    resulting table can then be gathered with the integer codes of
+    a column, which avoids calling the encoder on every transform.
+
+    Parameters
+    ----------
+    encoder: estimator
+        Fitted encoder.
+
+    col: str
+        Name of the column the encoder was fitted on.
+
+    categories: list
+        Classes known by the encoder.
+
+    to_other: list
+        Classes that are replaced with `other`.
+
+    Returns
+    -------
+    layout: dict or None
+        Lookup table of the encoder with keys:
+            - categories: Classes (without missing values) to code.
+            - rows: Row of the table for every code, followed by the
+                    row of unknown classes (selected by code -1).
+            - table: Encoded values per row. The last row contains
+                     the encoding of missing values.
+            - columns: Names of the encoded columns.
+            - dtypes: Data type of every encoded column when
+                      there are no missing values.
+            - fixed_unknown: Whether all unknown classes share the
+                             same encoding. If False, the encoder
+                             is called on the rows with unknown
+                             classes.
+        Returns None if the encoder doesn't encode the column.
+
+    """
+    known = [c for c in categories if not pd.isna(c)]
+    other = [c for c in to_other if c not in known]
+
+    # Make sure the placeholder for unknown classes is really unknown
+    unknown = "unknown"
+    while unknown in known + other:
+        unknown += "_"
+
+    probe = pd.DataFrame({col: pd.Series(known + [unknown, np.NaN], dtype=object)})
+    encoded = encoder.transform(probe)
+
+    # Drop _nan columns (missing values are propagated)
+    encoded = encoded[[c for c in encoded if not str(c).endswith("_nan")]]
+
+    # Columns the encoder doesn't recognize are returned untouched
+    if not all(dtype.kind in "biuf" for dtype in encoded.dtypes):
+        return None
+
+    rows = list(range(len(known)))
+    if other:
+        rows += [known.index("other")] * len(other)
+
+    return dict(
+        categories=known + other,
+        rows=np.array(rows + [len(known)]),
+        table=encoded.to_numpy(dtype=float),
+        columns=list(encoded.columns),
+        dtypes=list(encoded.iloc[:-1].infer_objects().dtypes),
+        fixed_unknown=(
+            getattr(encoder, "handle_unknown", None) == "value"
+            and encoder.__class__.__name__ != "HashingEncoder"
+        ),
+    )
+
+
+def encode_column(X, encoder, to_other, categories, layout=None, return_sparse=False):
+    """Encode a single categorical column.
+
+    Parameters
+    ----------
+    X: pd.DataFrame
+        Dataframe with the column to encode.
+
+    encoder: estimator
+        Fitted encoder.
+
+    to_other: list
+        Classes to replace with `other` before encoding.
+
+    categories: list
+        Classes seen during fit.
+
+    layout: dict or None, optional (default=None)
+        Lookup table of the encoder. If provided, the column is
+        encoded with a single coding pass instead of calling the
+        encoder's transform method.
+
+    return_sparse: bool, optional (default=False)
+        Whether to return the encoded columns with a sparse dtype.
+        Only if `layout` is provided.
+
+    Returns
+    -------
+    new_cols: pd.DataFrame
+        Encoded column(s).
+
+    n_classes: int
+        Number of classes in the column.
+
+    n_nans: int
+        Number of missing values in the column.
+
+    n_unknown: int
+        Number of classes not seen during fit.
+
+    """
+    col = X.columns[0]
+
+    if layout is not None:
+        codes = pd.Categorical(X[col], categories=layout["categories"]).codes
+        nans = X[col].isna().to_numpy()
+        unknown = (codes == -1) & ~nans
+
+        # Unknown classes have code -1, which selects the last row
+        idx = layout["rows"][codes]
+        idx[nans] = len(layout["table"]) - 1
+
+        # The encoding of unknown classes can depend on their value
+        data = None
+        if unknown.any() and not layout["fixed_unknown"]:
+            data = layout["table"][idx]
+            encoded = encoder.transform(X[unknown])
+            data[unknown] = encoded[layout["columns"]].to_numpy(dtype=float)
+
+        if return_sparse:
+            if data is None:
+                data = sparse.csr_matrix(layout["table"])[idx]
+            new_cols = pd.DataFrame.sparse.from_spmatrix(
+                data=sparse.csr_matrix(data),
+                index=X.index,
+                columns=layout["columns"],
+            )
+        else:
+            new_cols = pd.DataFrame(
+                data=layout["table"][idx] if data is None else data,
+                index=X.index,
+                columns=layout["columns"],
+            )
+
+        # Columns without propagated missing values keep their dtype
+        missing = np.isnan(layout["table"][-1]) & nans.any()
+        dtypes = {}
+        for c, dtype, m in zip(new_cols, layout["dtypes"], missing):
+            if not m:
+                dtype = pd.SparseDtype(dtype, 0) if return_sparse else dtype
+                if dtype != new_cols[c].dtype:
+                    dtypes[c] = dtype
+        if dtypes:
+            new_cols = new_cols.astype(dtypes)
+
+        n_nans = int(nans.sum())
+        n_unknown = X[col][unknown].nunique()
+        n_classes = len(np.unique(idx[~nans & ~unknown])) + n_unknown + bool(n_nans)
+
+        return new_cols, n_classes, n_nans, n_unknown
+
+    if to_other:
+        X = X.replace({col: {category: "other" for category in to_other}})
+
+    unique = X[col].unique()
+    n_nans = X[col].isna().sum()
+    n_unknown = len([i for i in unique if i not in categories])
+
+    # Get the new encoded columns
+    new_cols = encoder.transform(X)
+
+    # Drop _nan columns (missing values are propagated)
+    new_cols = new_cols[[c for c in new_cols if not str(c).endswith("_nan")]]
+
+    return new_cols, len(unique), n_nans, n_unknown
+
+
+# Classes ========================================================== >>
+
 class TransformerMixin:
     """Mixin class for all transformers in ATOM.
 
@@ -460,6 +864,12 @@ class Cleaner(BaseEstimator, TransformerMixin, BaseTransformer):
         Whether to Label-encode the target column. This parameter is
         ignored if `y` is not provided.
 
+    n_jobs: int, optional (default=1)
+        Number of cores to use for parallel processing.
+            - If >0: Number of cores to use.
+            - If -1: Use all available cores.
+            - If <-1: Use number of cores - 1 - value.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -495,10 +905,11 @@ class Cleaner(BaseEstimator, TransformerMixin, BaseTransformer):
         drop_duplicates: bool = False,
         drop_missing_target: bool = True,
         encode_target: bool = True,
+        n_jobs: int = 1,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
     ):
-        super().__init__(verbose=verbose, logger=logger)
+        super().__init__(n_jobs=n_jobs, verbose=verbose, logger=logger)
         self.drop_types = drop_types
         self.strip_categorical = strip_categorical
         self.drop_max_cardinality = drop_max_cardinality
@@ -542,44 +953,23 @@ class Cleaner(BaseEstimator, TransformerMixin, BaseTransformer):
         # Replace all missing values with NaN
         X = X.replace(self.missing + [np.inf, -np.inf], np.NaN)
 
-        for col in X:
-            # Count occurrences in the column
-            n_unique = X[col].nunique(dropna=True)
-
-            # Drop features with invalid data type
-            if X[col].dtype.name in lst(self.drop_types):
-                self.log(
-                    f" --> Dropping feature {col} for having a "
-                    f"prohibited type: {X[col].dtype.name}.", 2
-                )
-                X = X.drop(col, axis=1)
-                continue
-
-            elif X[col].dtype.name in ("object", "category"):
-                if self.strip_categorical:
-                    # Strip strings from blank spaces
-                    X[col] = X[col].apply(
-                        lambda val: val.strip() if isinstance(val, str) else val
-                    )
+        # Clean the columns in parallel and assemble them at once
+        columns = Parallel(n_jobs=self.n_jobs)(
+            delayed(clean_column)(
+                column=X[col],
+                drop_types=self.drop_types,
+                strip_categorical=self.strip_categorical,
+                drop_max_cardinality=self.drop_max_cardinality,
+                drop_min_cardinality=self.drop_min_cardinality,
+            ) for col in X
+        )
 
-                # Drop features where all values are different
-                if self.drop_max_cardinality and n_unique == len(X):
-                    self.log(
-                        f" --> Dropping feature {col} due to maximum cardinality.", 2
-                    )
-                    X = X.drop(col, axis=1)
-                    continue
+        for _, message in columns:
+            if message:
+                self.log(*message)
 
-            # Drop features with minimum cardinality (all values are the same)
-            if self.drop_min_cardinality:
-                all_nan = X[col].isna().sum() == len(X)
-                if n_unique == 1 or all_nan:
-                    self.log(
-                        f" --> Dropping feature {col} due to minimum "
-                        f"cardinality. Contains only 1 class: "
-                        f"{'NaN' if all_nan else X[col].unique()[0]}."
-                    )
-                    X = X.drop(col, axis=1)
+        columns = [column for column, _ in columns if column is not None]
+        X = pd.concat(columns, axis=1) if columns else X.iloc[:, :0]
 
         # Drop duplicate samples
         if self.drop_duplicates:
@@ -644,6 +1034,12 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
         Maximum number or fraction of missing values in a column
         (if more, the column is removed). If None, ignore this step.
 
+    n_jobs: int, optional (default=1)
+        Number of cores to use for parallel processing.
+            - If >0: Number of cores to use.
+            - If -1: Use all available cores.
+            - If <-1: Use number of cores - 1 - value.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -672,10 +1068,11 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
         strat_cat: str = "drop",
         max_nan_rows: Optional[SCALAR] = None,
         max_nan_cols: Optional[Union[float]] = None,
+        n_jobs: int = 1,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
     ):
-        super().__init__(verbose=verbose, logger=logger)
+        super().__init__(n_jobs=n_jobs, verbose=verbose, logger=logger)
         self.strat_num = strat_num
         self.strat_cat = strat_cat
         self.max_nan_rows = max_nan_rows
@@ -748,36 +1145,26 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
         if self._max_nan_rows:
             X = X.dropna(axis=0, thresh=self._max_nan_rows)
 
-        for col in X:
-            # Remember columns with too many missing values
-            if self._max_nan_cols and X[col].isna().sum() > self._max_nan_cols:
-                self._drop_cols.append(col)
-                continue  # Skip to side column
+        # Remember columns with too many missing values
+        self._drop_cols = []
+        if self._max_nan_cols:
+            nans = X.isna().sum()
+            self._drop_cols = list(nans[nans > self._max_nan_cols].index)
 
-            # Column is numerical
+        strategies = {}
+        for col in (c for c in X if c not in self._drop_cols):
             if col in self._num_cols:
-                if isinstance(self.strat_num, str):
-                    if self.strat_num.lower() == "knn":
-                        self._imputers[col] = KNNImputer().fit(X[[col]])
-
-                    elif self.strat_num.lower() == "most_frequent":
-                        self._imputers[col] = SimpleImputer(
-                            strategy="constant",
-                            fill_value=X[col].mode()[0],
-                        ).fit(X[[col]])
-
-                    # Strategies mean or median
-                    elif self.strat_num.lower() != "drop":
-                        self._imputers[col] = SimpleImputer(
-                            strategy=self.strat_num.lower()
-                        ).fit(X[[col]])
-
-            # Column is categorical
+                if isinstance(self.strat_num, str) and self.strat_num.lower() != "drop":
+                    strategies[col] = self.strat_num.lower()
             elif self.strat_cat.lower() == "most_frequent":
-                self._imputers[col] = SimpleImputer(
-                    strategy="constant",
-                    fill_value=X[col].mode()[0],
-                ).fit(X[[col]])
+                strategies[col] = "most_frequent"
+
+        # Fit an imputer per column in parallel
+        imputers = Parallel(n_jobs=self.n_jobs)(
+            delayed(fit_imputer)(X[[col]], strategy)
+            for col, strategy in strategies.items()
+        )
+        self._imputers = dict(zip(strategies, imputers))
 
         self._is_fitted = True
         return self
@@ -831,16 +1218,22 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
                     f"than {self._max_nan_rows} missing values.", 2
                 )
 
+        # Decide per column what to do with the missing values. Rows
+        # are dropped through a mask, so the counts of every column
+        # exclude the rows dropped by the columns before it
+        isna = X.isna()
+        mask = np.ones(len(X), dtype=bool)
+        drop_cols, imputers = [], {}
         for col in X:
-            nans = X[col].isna().sum()
+            nans = isna[col].values[mask].sum()
 
             # Drop columns with too many missing values
             if col in self._drop_cols:
                 self.log(
                     f" --> Dropping feature {col}. Contains {nans} "
-                    f"({nans * 100 // len(X)}%) missing values.", 2
+                    f"({nans * 100 // mask.sum()}%) missing values.", 2
                 )
-                X = X.drop(col, axis=1)
+                drop_cols.append(col)
                 continue
 
             # Apply only if column is numerical and contains missing values
@@ -850,12 +1243,10 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
                         f" --> Imputing {nans} missing values with number "
                         f"{str(self.strat_num)} in feature {col}.", 2
                     )
-                    X[col] = X[col].replace(np.NaN, self.strat_num)
+                    imputers[col] = self.strat_num
 
                 elif self.strat_num.lower() == "drop":
-                    X = X.dropna(subset=[col], axis=0)
-                    if y is not None:
-                        y = y[y.index.isin(X.index)]
+                    mask &= ~isna[col].values
                     self.log(
                         f" --> Dropping {nans} samples due to missing "
                         f"values in feature {col}.", 2
@@ -866,7 +1257,7 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
                         f" --> Imputing {nans} missing values using "
                         f"the KNN imputer in feature {col}.", 2
                     )
-                    X[col] = self._imputers[col].transform(X[[col]])
+                    imputers[col] = self._imputers[col]
 
                 else:  # Strategies mean, median or most_frequent
                     mode = round(self._imputers[col].statistics_[0], 2)
@@ -874,7 +1265,7 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
                         f" --> Imputing {nans} missing values with "
                         f"{self.strat_num.lower()} ({mode}) in feature {col}.", 2
                     )
-                    X[col] = self._imputers[col].transform(X[[col]])
+                    imputers[col] = self._imputers[col]
 
             # Column is categorical and contains missing values
             elif nans > 0:
@@ -883,12 +1274,10 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
                         f" --> Imputing {nans} missing values with "
                         f"{self.strat_cat} in feature {col}.", 2
                     )
-                    X[col] = X[col].replace(np.NaN, self.strat_cat)
+                    imputers[col] = self.strat_cat
 
                 elif self.strat_cat.lower() == "drop":
-                    X = X.dropna(subset=[col], axis=0)
-                    if y is not None:
-                        y = y[y.index.isin(X.index)]
+                    mask &= ~isna[col].values
                     self.log(
                         f" --> Dropping {nans} samples due to missing "
                         f"values in feature {col}.", 2
@@ -900,7 +1289,20 @@ class Imputer(BaseEstimator, TransformerMixin, BaseTransformer):
                         f" --> Imputing {nans} missing values with "
                         f"most_frequent ({mode}) in feature {col}.", 2
                     )
-                    X[col] = self._imputers[col].transform(X[[col]])
+                    imputers[col] = self._imputers[col]
+
+        columns = [c for c in X if c not in drop_cols]
+        X = X.loc[mask, columns]
+        if y is not None:
+            y = y[y.index.isin(X.index)]
+
+        if imputers:
+            # Impute the columns in parallel and assemble them at once
+            imputed = Parallel(n_jobs=self.n_jobs)(
+                delayed(impute_column)(X[[col]], imputer)
+                for col, imputer in imputers.items()
+            )
+            X = pd.concat([X.drop(columns=list(imputers)), *imputed], axis=1)[columns]
 
         return variable_return(X, y)
 
@@ -917,7 +1319,8 @@ class Encoder(BaseEstimator, TransformerMixin, BaseTransformer):
     classes encountered during transforming are imputed according
     to the selected strategy. Classes with low occurrences can be
     replaced with the value `other` in order to prevent too high
-    cardinality.
+    cardinality. The encoding of every class is computed once during
+    fit, so transforming a column only takes a lookup of its classes.
 
     Two category-encoders estimators are unavailable:
         - OneHotEncoder: Use the `max_onehot` parameter.
@@ -946,6 +1349,18 @@ class Encoder(BaseEstimator, TransformerMixin, BaseTransformer):
         `other`. This transformation is done before the encoding of the
         column. If None, skip this step.
 
+    return_sparse: bool, optional (default=False)
+        Whether to return the one-hot encoded columns with a sparse
+        dtype. Sparse columns are stored in a compressed format and
+        are passed to the models as a sparse matrix (if the model
+        accepts them).
+
+    n_jobs: int, optional (default=1)
+        Number of cores to use for parallel processing.
+            - If >0: Number of cores to use.
+            - If -1: Use all available cores.
+            - If <-1: Use number of cores - 1 - value.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -969,15 +1384,18 @@ class Encoder(BaseEstimator, TransformerMixin, BaseTransformer):
         max_onehot: Optional[int] = 10,
         ordinal: Optional[Dict[str, SEQUENCE_TYPES]] = None,
         frac_to_other: Optional[SCALAR] = None,
+        return_sparse: bool = False,
+        n_jobs: int = 1,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
         **kwargs,
     ):
-        super().__init__(verbose=verbose, logger=logger)
+        super().__init__(n_jobs=n_jobs, verbose=verbose, logger=logger)
         self.strategy = strategy
         self.max_onehot = max_onehot
         self.ordinal = ordinal
         self.frac_to_other = frac_to_other
+        self.return_sparse = return_sparse
         self.kwargs = kwargs
 
         self._max_onehot = None
@@ -986,6 +1404,7 @@ class Encoder(BaseEstimator, TransformerMixin, BaseTransformer):
         self._to_other = defaultdict(list)
         self._encoders = {}
         self._categories = {}
+        self._layouts = {}
         self._cat_cols = None
         self._is_fitted = False
 
@@ -1067,44 +1486,25 @@ class Encoder(BaseEstimator, TransformerMixin, BaseTransformer):
 
         self.log("Fitting Encoder...", 1)
 
-        for col in (c for c in X if c in self._cat_cols):
-            # Group uncommon classes into "other"
-            if self._frac_to_other:
-                for category, count in X[col].value_counts().items():
-                    if count <= self._frac_to_other:
-                        self._to_other[col].append(category)
-                        X[col] = X[col].replace(category, "other")
-
-            # Get the unique categories before fitting
-            self._categories[col] = X[col].unique().tolist()
-
-            # Perform encoding type dependent on number of unique values
-            if col in self._ordinal or len(self._categories[col]) == 2:
-                unique = X[col].unique()
-
-                # Create a custom mapping: 0 to N - 1
-                mapping = {v: i for i, v in enumerate(self._ordinal.get(col, unique))}
-                if np.NaN not in mapping:  # Encoder always needs mapping of NaN value
-                    mapping[np.NaN] = -1
-
-                self._encoders[col] = OrdinalEncoder(
-                    mapping=[{"col": col, "mapping": mapping}],
-                    handle_missing="return_nan",
-                    handle_unknown="value",
-                ).fit(X[[col]])
-
-            elif 2 < len(self._categories[col]) <= self._max_onehot:
-                self._encoders[col] = OneHotEncoder(
-                    use_cat_names=True,
-                    handle_missing="return_nan",
-                    handle_unknown="value",
-                ).fit(X[[col]])
+        # Fit an encoder per column in parallel
+        cat_cols = [c for c in X if c in self._cat_cols]
+        encoders = Parallel(n_jobs=self.n_jobs)(
+            delayed(fit_encoder)(
+                X=X[[col]],
+                y=y,
+                estimator=estimator,
+                max_onehot=self._max_onehot,
+                ordinal=self._ordinal.get(col),
+                frac_to_other=self._frac_to_other,
+            ) for col in cat_cols
+        )
 
-            else:
-                args = [X[[col]]]
-                if "y" in signature(estimator.fit).parameters:
-                    args.append(y)
-                self._encoders[col] = clone(estimator).fit(*args)
+        for col, (to_other, categories, encoder, layout) in zip(cat_cols, encoders):
+            if to_other:
+                self._to_other[col] = to_other
+            self._categories[col] = categories
+            self._encoders[col] = encoder
+            self._layouts[col] = layout
 
         self._is_fitted = True
         return self
@@ -1132,43 +1532,42 @@ class Encoder(BaseEstimator, TransformerMixin, BaseTransformer):
 
         self.log("Encoding categorical columns...", 1)
 
-        for col in (c for c in X if c in self._cat_cols):
-            # Convert classes to "other"
-            X[col] = X[col].replace(self._to_other[col], "other")
+        # Encode the columns in parallel
+        cat_cols = [c for c in X if c in self._cat_cols]
+        encoded = Parallel(n_jobs=self.n_jobs)(
+            delayed(encode_column)(
+                X=X[[col]],
+                encoder=self._encoders[col],
+                to_other=self._to_other[col],
+                categories=self._categories[col],
+                layout=self._layouts[col],
+                return_sparse=(
+                    self.return_sparse
+                    and isinstance(self._encoders[col], OneHotEncoder)
+                ),
+            ) for col in cat_cols
+        )
 
-            n_classes = len(X[col].unique())
+        blocks = {}
+        for col, (new_cols, n_classes, n_nans, n_unknown) in zip(cat_cols, encoded):
             self.log(
                 f" --> {self._encoders[col].__class__.__name__[:-7]}-encoding "
                 f"feature {col}. Contains {n_classes} classes.", 2
             )
 
             # Count the propagated missing values
-            n_nans = X[col].isna().sum()
             if n_nans:
                 self.log(f"   >>> Propagating {n_nans} missing values.", 2)
 
-            # Get the new encoded columns
-            new_cols = self._encoders[col].transform(X[[col]])
+            # Check for unknown classes
+            if n_unknown:
+                self.log(f"   >>> Handling {n_unknown} unknown classes.", 2)
 
-            # Drop _nan columns (missing values are propagated)
-            new_cols = new_cols[[col for col in new_cols if not col.endswith("_nan")]]
+            blocks[col] = new_cols
 
-            # Check for unknown classes
-            uc = len([i for i in X[col].unique() if i not in self._categories[col]])
-            if uc:
-                self.log(f"   >>> Handling {uc} unknown classes.", 2)
-
-            # Insert the new columns at old location
-            for i, new_col in enumerate(new_cols):
-                if new_col in X:
-                    X[col] = new_cols[col]  # Replace existing column
-                else:
-                    # Drop the original column
-                    if col in X:
-                        idx = X.columns.get_loc(col)
-                        X = X.drop(col, axis=1)
-
-                    X.insert(idx + i, new_col, new_cols[new_col])
+        # Place the new columns at the location of the original ones
+        if blocks:
+            X = pd.concat([blocks.get(col, X[[col]]) for col in X], axis=1)
 
         return X
 
@@ -24,10 +24,20 @@ Description: Module containing all available models. All classes must
             Whether the model needs scaled features. Can not be
             True for datasets with more than two dimensions.
 
+        accepts_sparse: bool, optional
+            Whether the estimator accepts sparse matrices. Sparse
+            data sets are converted to dense ones for models that
+            don't. Defaults to False.
+
         goal: str
             If the model is only for classification ("class"),
             regression ("reg") or both ("both").
 
+        resource: str, optional
+            Name of the estimator's parameter that sets the number of
+            iterations (trees or epochs) it's trained for. Only for
+            models that can be budgeted and warm-started by resource.
+
 
         Instance attributes
         -------------------
@@ -76,6 +86,11 @@ Description: Module containing all available models. All classes must
             This method is called instead of directly running the
             estimator's fit method. Implement only to customize the fit.
 
+        get_warm_start(self, est, n_prev, n):
+            Return an estimator that continues training from a fitted
+            one. Don't implement if the method in BaseModel (for
+            estimators with a warm_start parameter) is sufficient.
+
         get_dimensions(self):
             Return a list of the bounds for the hyperparameters.
 
@@ -128,13 +143,14 @@ Additionally, ATOM implements two ensemble models:
 
 # Standard packages
 import numpy as np
-from copy import copy
+from copy import copy, deepcopy
 from random import randint
 from inspect import signature
 from scipy.spatial.distance import cdist
 from skopt.space.space import Real, Integer, Categorical
 
 # Sklearn estimators
+from sklearn.base import clone
 from sklearn.dummy import DummyClassifier, DummyRegressor
 from sklearn.gaussian_process import (
     GaussianProcessClassifier,
@@ -224,6 +240,7 @@ class CustomModel(BaseModel):
             self.acronym = create_acronym(self.fullname)
 
         self.needs_scaling = getattr(self.est, "needs_scaling", False)
+        self.accepts_sparse = getattr(self.est, "accepts_sparse", False)
         super().__init__(*args)
 
     @property
@@ -266,6 +283,7 @@ class Dummy(BaseModel):
 
     acronym = "Dummy"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -373,6 +391,7 @@ class MultinomialNaiveBayes(BaseModel):
     acronym = "MNB"
     fullname = "Multinomial Naive Bayes"
     needs_scaling = False
+    accepts_sparse = True
     goal = "class"
 
     def __init__(self, *args):
@@ -404,6 +423,7 @@ class BernoulliNaiveBayes(BaseModel):
     acronym = "BNB"
     fullname = "Bernoulli Naive Bayes"
     needs_scaling = False
+    accepts_sparse = True
     goal = "class"
 
     def __init__(self, *args):
@@ -466,6 +486,7 @@ class ComplementNaiveBayes(BaseModel):
     acronym = "CNB"
     fullname = "Complement Naive Bayes"
     needs_scaling = False
+    accepts_sparse = True
     goal = "class"
 
     def __init__(self, *args):
@@ -498,6 +519,7 @@ class OrdinaryLeastSquares(BaseModel):
     acronym = "OLS"
     fullname = "Ordinary Least Squares"
     needs_scaling = True
+    accepts_sparse = True
     goal = "reg"
 
     def __init__(self, *args):
@@ -519,6 +541,7 @@ class Ridge(BaseModel):
 
     acronym = "Ridge"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -562,6 +585,7 @@ class Lasso(BaseModel):
     acronym = "Lasso"
     fullname = "Lasso Regression"
     needs_scaling = True
+    accepts_sparse = True
     goal = "reg"
 
     def __init__(self, *args):
@@ -596,6 +620,7 @@ class ElasticNet(BaseModel):
     acronym = "EN"
     fullname = "ElasticNet Regression"
     needs_scaling = True
+    accepts_sparse = True
     goal = "reg"
 
     def __init__(self, *args):
@@ -715,6 +740,7 @@ class LogisticRegression(BaseModel):
     acronym = "LR"
     fullname = "Logistic Regression"
     needs_scaling = True
+    accepts_sparse = True
     goal = "class"
 
     def __init__(self, *args):
@@ -848,6 +874,7 @@ class KNearestNeighbors(BaseModel):
     acronym = "KNN"
     fullname = "K-Nearest Neighbors"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -894,6 +921,7 @@ class RadiusNearestNeighbors(BaseModel):
     acronym = "RNN"
     fullname = "Radius Nearest Neighbors"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -967,6 +995,7 @@ class DecisionTree(BaseModel):
     acronym = "Tree"
     fullname = "Decision Tree"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -1021,7 +1050,9 @@ class Bagging(BaseModel):
 
     acronym = "Bag"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1073,7 +1104,9 @@ class ExtraTrees(BaseModel):
     acronym = "ET"
     fullname = "Extra-Trees"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1142,7 +1175,9 @@ class RandomForest(BaseModel):
     acronym = "RF"
     fullname = "Random Forest"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1211,6 +1246,7 @@ class AdaBoost(BaseModel):
     acronym = "AdaB"
     fullname = "AdaBoost"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -1256,7 +1292,9 @@ class GradientBoostingMachine(BaseModel):
     acronym = "GBM"
     fullname = "Gradient Boosting Machine"
     needs_scaling = False
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1336,6 +1374,7 @@ class HistGBM(BaseModel):
     fullname = "HistGBM"
     needs_scaling = False
     goal = "both"
+    resource = "max_iter"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1388,7 +1427,9 @@ class XGBoost(BaseModel):
     acronym = "XGB"
     fullname = "XGBoost"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1461,6 +1502,11 @@ class XGBoost(BaseModel):
             }
             self._stopped = (len(self.evals["train"]), n_estimators)
 
+    def get_warm_start(self, est, n_prev, n):
+        """Return an estimator that continues boosting from est."""
+        estimator = clone(self.estimator).set_params(n_estimators=n - n_prev)
+        return estimator, {"xgb_model": est.get_booster()}
+
     def get_dimensions(self):
         """Return a list of the bounds for the hyperparameters."""
         dimensions = [
@@ -1483,7 +1529,9 @@ class LightGBM(BaseModel):
     acronym = "LGB"
     fullname = "LightGBM"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1550,6 +1598,11 @@ class LightGBM(BaseModel):
             }
             self._stopped = (len(self.evals["train"]), n_estimators)
 
+    def get_warm_start(self, est, n_prev, n):
+        """Return an estimator that continues boosting from est."""
+        estimator = clone(self.estimator).set_params(n_estimators=n - n_prev)
+        return estimator, {"init_model": est.booster_}
+
     def get_dimensions(self):
         """Return a list of the bounds for the hyperparameters."""
         dimensions = [
@@ -1573,7 +1626,9 @@ class CatBoost(BaseModel):
     acronym = "CatB"
     fullname = "CatBoost"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
+    resource = "n_estimators"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1634,6 +1689,11 @@ class CatBoost(BaseModel):
             }
             self._stopped = (len(self.evals["train"]), n_estimators)
 
+    def get_warm_start(self, est, n_prev, n):
+        """Return an estimator that continues boosting from est."""
+        estimator = clone(self.estimator).set_params(n_estimators=n - n_prev)
+        return estimator, {"init_model": est}
+
     def get_dimensions(self):
         """Return a list of the bounds for the hyperparameters."""
         # num_leaves and min_child_samples not available for CPU implementation
@@ -1654,6 +1714,7 @@ class LinearSVM(BaseModel):
     acronym = "lSVM"
     fullname = "Linear-SVM"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -1727,6 +1788,7 @@ class KernelSVM(BaseModel):
     acronym = "kSVM"
     fullname = "Kernel-SVM"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -1792,6 +1854,7 @@ class PassiveAggressive(BaseModel):
     acronym = "PA"
     fullname = "Passive Aggressive"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
 
     def __init__(self, *args):
@@ -1845,7 +1908,9 @@ class StochasticGradientDescent(BaseModel):
     acronym = "SGD"
     fullname = "Stochastic Gradient Descent"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
+    resource = "max_iter"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -1896,6 +1961,12 @@ class StochasticGradientDescent(BaseModel):
                 **params,
             )
 
+    def get_warm_start(self, est, n_prev, n):
+        """Return an estimator that continues training from est."""
+        est = deepcopy(est)
+        est.set_params(warm_start=True, max_iter=n - n_prev)  # Additional epochs
+        return est, {}
+
     def get_dimensions(self):
         """Return a list of the bounds for the hyperparameters."""
         loss = [
@@ -1931,7 +2002,9 @@ class MultilayerPerceptron(BaseModel):
     acronym = "MLP"
     fullname = "Multi-layer Perceptron"
     needs_scaling = True
+    accepts_sparse = True
     goal = "both"
+    resource = "max_iter"
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -2006,6 +2079,12 @@ class MultilayerPerceptron(BaseModel):
             **params,
         )
 
+    def get_warm_start(self, est, n_prev, n):
+        """Return an estimator that continues training from est."""
+        est = deepcopy(est)
+        est.set_params(warm_start=True, max_iter=n - n_prev)  # Additional epochs
+        return est, {}
+
     def get_dimensions(self):
         """Return a list of the bounds for the hyperparameters."""
         dimensions = [
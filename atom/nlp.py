@@ -10,11 +10,17 @@ Description: Module containing estimators for NLP.
 # Standard packages
 import re
 import nltk
+import threading
 import unicodedata
+import numpy as np
 import pandas as pd
+from functools import partial
+from itertools import islice
+from collections import Counter
 from string import punctuation
 from typeguard import typechecked
 from typing import Union, Optional
+from joblib import Parallel, delayed
 from sklearn.base import BaseEstimator
 from sklearn.feature_extraction.text import (
     CountVectorizer,
@@ -23,11 +29,6 @@ from sklearn.feature_extraction.text import (
 )
 from nltk.corpus import wordnet
 from nltk.stem import SnowballStemmer, WordNetLemmatizer
-from nltk.collocations import (
-    BigramCollocationFinder,
-    TrigramCollocationFinder,
-    QuadgramCollocationFinder,
-)
 
 # Own modules
 from .data_cleaning import TransformerMixin
@@ -38,6 +39,311 @@ from .utils import (
 )
 
 
+# Functions ======================================================== >>
+
+def split_documents(docs, n_chunks):
+    """Split a corpus in consecutive chunks of documents.
+
+    Parameters
+    ----------
+    docs: sequence
+        Documents to split.
+
+    n_chunks: int
+        Maximum number of chunks.
+
+    Returns
+    -------
+    chunks: list
+        Chunks of documents.
+
+    """
+    size = max(1, -(-len(docs) // n_chunks))  # Ceil division
+    return [docs[i:i + size] for i in range(0, len(docs), size)]
+
+
+def to_ascii(text):
+    """Convert unicode string to ascii."""
+    try:
+        text.encode("ASCII", errors="strict")  # Returns bytes object
+    except UnicodeEncodeError:
+        norm = unicodedata.normalize("NFKD", text)
+        return "".join([c for c in norm if not unicodedata.combining(c)])
+    else:
+        return text  # Return unchanged if encoding was successful
+
+
+def wordnet_pos(tag):
+    """Get wordnet's part of speech from a treebank tag."""
+    if tag in ("JJ", "JJR", "JJS"):
+        return wordnet.ADJ
+    elif tag in ("RB", "RBR", "RBS"):
+        return wordnet.ADV
+    elif tag in ("VB", "VBD", "VBG", "VBN", "VBP", "VBZ"):
+        return wordnet.VERB
+    else:  # "NN", "NNS", "NNP", "NNPS"
+        return wordnet.NOUN
+
+
+def clean_documents(docs, decode, lower_case, pattern, drop_punctuation):
+    """Apply the cleaning steps on a chunk of documents.
+
+    Every step is applied on one document at a time, in the same
+    order as the parameters are presented. All regex matches are
+    dropped in a single pass over the text.
+
+    Parameters
+    ----------
+    docs: list
+        Documents to clean. A document is a string or a sequence
+        of tokens.
+
+    decode: bool
+        Whether to decode unicode characters to their ascii
+        representations.
+
+    lower_case: bool
+        Whether to convert all characters to lower case.
+
+    pattern: re.Pattern or None
+        Alternation of the regex patterns to drop, every one in its
+        own named group. If None, no matches are dropped.
+
+    drop_punctuation: bool
+        Whether to drop punctuations from the text.
+
+    Returns
+    -------
+    docs: list
+        Cleaned documents.
+
+    positions: np.ndarray
+        Position in the chunk of the document of every dropped match.
+
+    groups: np.ndarray
+        Number of the pattern's group that matched.
+
+    matches: np.ndarray
+        Dropped matches.
+
+    """
+
+    def drop(match):
+        """Record a match and remove it from the text."""
+        positions.append(i)
+        groups.append(match.lastindex)
+        matches.append(match.group())
+        return ""
+
+    trans_table = str.maketrans("", "", punctuation)
+
+    cleaned, positions, groups, matches = [], [], [], []
+    for i, doc in enumerate(docs):
+        tokens = [doc] if isinstance(doc, str) else [str(w) for w in doc]
+
+        if decode:
+            tokens = [to_ascii(token) for token in tokens]
+
+        if lower_case:
+            tokens = [token.lower() for token in tokens]
+
+        if pattern is not None:
+            tokens = [pattern.sub(drop, token) for token in tokens]
+
+        if drop_punctuation:
+            tokens = [token.translate(trans_table) for token in tokens]
+
+        if isinstance(doc, str):
+            cleaned.append(tokens[0])
+        else:
+            cleaned.append([token for token in tokens if token])  # Drop empty
+
+    return (
+        cleaned,
+        np.array(positions, dtype=np.int64),
+        np.array(groups, dtype=np.int32),
+        np.array(matches, dtype="object"),
+    )
+
+
+def tokenize_documents(docs):
+    """Convert a chunk of documents into sequences of words."""
+    return [nltk.word_tokenize(doc) for doc in docs]
+
+
+def count_ngrams(docs, n):
+    """Count the n-grams in a chunk of documents.
+
+    N-grams are sequences of consecutive words in a document. They
+    never span more than one document.
+
+    Parameters
+    ----------
+    docs: list
+        Tokenized documents.
+
+    n: int
+        Number of words per n-gram.
+
+    Returns
+    -------
+    counts: collections.Counter
+        Frequency of every n-gram, in order of first occurrence.
+
+    """
+    counts = Counter()
+    for doc in docs:
+        counts.update(zip(*[doc[i:] for i in range(n)]))
+
+    return counts
+
+
+def replace_ngrams(docs, ngrams):
+    """Replace n-grams with one word unified by underscores.
+
+    Every document is scanned once from left to right. At every
+    position, the longest n-gram that starts there is replaced.
+
+    Parameters
+    ----------
+    docs: list
+        Tokenized documents.
+
+    ngrams: set
+        N-grams to replace, as tuples of words.
+
+    Returns
+    -------
+    docs: list
+        Tokenized documents with the n-grams replaced.
+
+    """
+    lengths = sorted({len(ngram) for ngram in ngrams}, reverse=True)
+
+    replaced = []
+    for doc in docs:
+        doc, words, i = list(doc), [], 0
+        while i < len(doc):
+            for n in lengths:
+                if tuple(doc[i:i + n]) in ngrams:
+                    words.append("_".join(doc[i:i + n]))
+                    i += n
+                    break
+            else:
+                words.append(doc[i])
+                i += 1
+
+        replaced.append(words)
+
+    return replaced
+
+
+def preprocess_tokens(doc, preprocessor):
+    """Apply a vectorizer's preprocessor on every token of a document."""
+    if isinstance(doc, str):
+        return preprocessor(doc)
+    else:
+        return [preprocessor(token) for token in doc]
+
+
+def split_tokens(doc):
+    """Get the words of a document, separating strings by spaces."""
+    return doc.split() if isinstance(doc, str) else doc
+
+
+def normalize_documents(docs, stopwords, stem, lemmatize, stems, lemmas):
+    """Apply the normalization steps on a chunk of documents.
+
+    Stems and lemmas are looked up in the caches before computing
+    them, so every distinct word is only processed once.
+
+    Parameters
+    ----------
+    docs: list
+        Documents to normalize. If a document is a string, the words
+        are separated by spaces.
+
+    stopwords: frozenset
+        Words to drop from the documents.
+
+    stem: str or None
+        Language of the stemmer. If None, skip stemming.
+
+    lemmatize: bool
+        Whether to apply lemmatization.
+
+    stems: dict
+        Snapshot of the previously computed stems, keyed by (word,).
+
+    lemmas: dict
+        Snapshot of the previously computed lemmas, keyed by
+        (word, pos).
+
+    Returns
+    -------
+    docs: list
+        Normalized documents.
+
+    new_stems: dict
+        Stems computed on this chunk.
+
+    new_lemmas: dict
+        Lemmas computed on this chunk.
+
+    hits: dict
+        Number of cache hits per cache.
+
+    """
+
+    def memoize(name, func, cache, new):
+        """Look up the result of a call in the caches first."""
+        def wrapper(*key):
+            for c in (cache, new):
+                value = c.get(key, missing)
+                if value is not missing:
+                    hits[name] += 1
+                    return value
+
+            new[key] = func(*key)
+            return new[key]
+
+        return wrapper
+
+    missing = object()  # Sentinel for words that aren't cached
+    new_stems, new_lemmas = {}, {}
+    hits = {"stem": 0, "lemma": 0}
+
+    if stem:
+        stem_word = memoize("stem", SnowballStemmer(stem).stem, stems, new_stems)
+    if lemmatize:
+        lemmatize_word = memoize(
+            "lemma", WordNetLemmatizer().lemmatize, lemmas, new_lemmas
+        )
+
+    normalized = []
+    for doc in docs:
+        if isinstance(doc, str):
+            doc = doc.split()
+
+        if stopwords:
+            doc = [word for word in doc if word not in stopwords]
+
+        if stem:
+            doc = [stem_word(word) for word in doc]
+
+        if lemmatize:
+            doc = [
+                lemmatize_word(word, wordnet_pos(tag))
+                for word, tag in nltk.pos_tag(doc)
+            ]
+
+        normalized.append(doc)
+
+    return normalized, new_stems, new_lemmas, hits
+
+
+# Classes ========================================================== >>
+
 class TextCleaner(BaseEstimator, TransformerMixin, BaseTransformer):
     """Applies standard text cleaning to the corpus.
 
@@ -45,7 +351,10 @@ class TextCleaner(BaseEstimator, TransformerMixin, BaseTransformer):
     noise from the text (emails, HTML tags, URLs, etc...). The
     transformations are applied on the column named `Corpus`, in
     the same order the parameters are presented. If there is no
-    column with that name, an exception is raised.
+    column with that name, an exception is raised. The regex
+    patterns are combined into a single expression, so the text is
+    scanned only once. If multiple patterns match at the same
+    position, the first one in the order of the parameters is used.
 
     Parameters
     ----------
@@ -97,6 +406,12 @@ class TextCleaner(BaseEstimator, TransformerMixin, BaseTransformer):
         Whether to drop punctuations from the text. Characters
         considered punctuation are `!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~`.
 
+    n_jobs: int, optional (default=1)
+        Number of cores to use for parallel processing.
+            - If >0: Number of cores to use.
+            - If -1: Use all available cores.
+            - If <-1: Use number of cores - 1 - value.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -132,10 +447,11 @@ class TextCleaner(BaseEstimator, TransformerMixin, BaseTransformer):
         drop_number: bool = True,
         regex_number: Optional[str] = None,
         drop_punctuation: bool = True,
+        n_jobs: int = 1,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
     ):
-        super().__init__(verbose=verbose, logger=logger)
+        super().__init__(n_jobs=n_jobs, verbose=verbose, logger=logger)
         self.decode = decode
         self.lower_case = lower_case
         self.drop_email = drop_email
@@ -150,8 +466,34 @@ class TextCleaner(BaseEstimator, TransformerMixin, BaseTransformer):
         self.regex_number = regex_number
         self.drop_punctuation = drop_punctuation
 
-        # Encountered regex occurrences
-        self.drops = pd.DataFrame()
+        # Encountered regex occurrences as (types, index, codes, matches)
+        self._drops = None
+
+    @property
+    def drops(self):
+        """Encountered regex matches per type of drop."""
+        if self._drops is None:
+            return pd.DataFrame()
+
+        types, index, codes, matches = self._drops
+
+        drops = []
+        for i, name in enumerate(types):
+            occurrences = {}
+            mask = codes == i
+            for label, match in zip(index[mask], matches[mask]):
+                occurrences.setdefault(label, []).append(match)
+
+            drops.append(
+                pd.Series(
+                    data=list(occurrences.values()),
+                    index=pd.Index(list(occurrences), name=index.name),
+                    name=name,
+                    dtype="object",
+                )
+            )
+
+        return pd.concat(drops, axis=1)
 
     @composed(crash, method_to_log, typechecked)
     def transform(self, X: X_TYPES, y: Optional[Y_TYPES] = None):
@@ -173,110 +515,90 @@ class TextCleaner(BaseEstimator, TransformerMixin, BaseTransformer):
             Transformed corpus.
 
         """
-
-        def to_ascii(row):
-            """Convert unicode string to ascii."""
-            try:
-                row.encode("ASCII", errors="strict")  # Returns bytes object
-            except UnicodeEncodeError:
-                norm = unicodedata.normalize("NFKD", row)
-                return "".join([c for c in norm if not unicodedata.combining(c)])
-            else:
-                return row  # Return unchanged if encoding was successful
-
-        def drop_regex(search):
-            """Find and remove a regex expression from the text."""
-            counts, docs = 0, 0
-            for i, row in enumerate(X[corpus]):
-                for j, elem in enumerate([row] if isinstance(row, str) else row):
-                    regex = getattr(self, f"regex_{search}")
-                    occurrences = re.compile(regex).findall(elem)
-                    if occurrences:
-                        docs += 1
-                        counts += len(occurrences)
-                        drops[search].loc[i] = occurrences
-                        for occ in occurrences:
-                            if row is elem:
-                                X[corpus][i] = X[corpus][i].replace(occ, "", 1)
-                            else:
-                                X[corpus][i][j] = X[corpus][i][j].replace(occ, "", 1)
-
-            return counts, docs
-
         X, y = self._prepare_input(X, y)
         corpus = get_corpus(X)
 
-        # Create a pd.Series for every type of drop
-        drops = {}
-        for elem in ("email", "url", "html", "emoji", "number"):
-            drops[elem] = pd.Series(name=elem, dtype="object")
-
         self.log("Filtering the corpus...", 1)
 
-        if self.decode:
-            if isinstance(X[corpus][0], str):
-                X[corpus] = X[corpus].apply(lambda row: to_ascii(row))
-            else:
-                X[corpus] = X[corpus].apply(lambda row: [to_ascii(str(w)) for w in row])
-        self.log(" --> Decoding unicode characters to ascii.", 2)
-
-        if self.lower_case:
-            if isinstance(X[corpus][0], str):
-                X[corpus] = X[corpus].str.lower()
-            else:
-                X[corpus] = X[corpus].apply(lambda row: [str(w).lower() for w in row])
-        self.log(" --> Converting text to lower case.", 2)
-
-        if self.drop_email:
-            if not self.regex_email:
-                self.regex_email = r"[\w.-]+@[\w-]+\.[\w.-]+"
-
-            counts, docs = drop_regex("email")
-            self.log(f" --> Dropping {counts} emails from {docs} documents.", 2)
-
-        if self.drop_url:
-            if not self.regex_url:
-                self.regex_url = r"https?://\S+|www\.\S+"
-
-            counts, docs = drop_regex("url")
-            self.log(f" --> Dropping {counts} URL links from {docs} documents.", 2)
-
-        if self.drop_html:
-            if not self.regex_html:
-                self.regex_html = r"<.*?>"
-
-            counts, docs = drop_regex("html")
-            self.log(f" --> Dropping {counts} HTML tags from {docs} documents.", 2)
+        # Default regex per type of drop
+        defaults = {
+            "email": r"[\w.-]+@[\w-]+\.[\w.-]+",
+            "url": r"https?://\S+|www\.\S+",
+            "html": r"<.*?>",
+            "emoji": r":[a-z_]+:",
+            "number": r"\b\d+\b",
+        }
 
-        if self.drop_emoji:
-            if not self.regex_emoji:
-                self.regex_emoji = r":[a-z_]+:"
+        regex = {}
+        for name, default in defaults.items():
+            if getattr(self, f"drop_{name}"):
+                if not getattr(self, f"regex_{name}"):
+                    setattr(self, f"regex_{name}", default)
+                regex[name] = getattr(self, f"regex_{name}")
+
+        # Combine all patterns in one alternation with a group per type
+        pattern = None
+        if regex:
+            pattern = re.compile(
+                "|".join(f"(?P<{name}>{value})" for name, value in regex.items())
+            )
 
-            counts, docs = drop_regex("emoji")
-            self.log(f" --> Dropping {counts} emojis from {docs} documents.", 2)
+        # Clean chunks of documents in parallel
+        chunks = Parallel(n_jobs=self.n_jobs)(
+            delayed(clean_documents)(
+                docs=docs,
+                decode=self.decode,
+                lower_case=self.lower_case,
+                pattern=pattern,
+                drop_punctuation=self.drop_punctuation,
+            ) for docs in split_documents(X[corpus].tolist(), self.n_jobs)
+        )
+
+        docs = []
+        positions = [np.empty(0, dtype=np.int64)]
+        groups = [np.empty(0, dtype=np.int32)]
+        matches = [np.empty(0, dtype="object")]
+        for cleaned, pos, grp, mtc in chunks:
+            positions.append(pos + len(docs))
+            groups.append(grp)
+            matches.append(mtc)
+            docs.extend(cleaned)
+
+        X[corpus] = pd.Series(docs, index=X.index, dtype="object")
 
-        if self.drop_number:
-            if not self.regex_number:
-                self.regex_number = r"\b\d+\b"
+        if self.decode:
+            self.log(" --> Decoding unicode characters to ascii.", 2)
 
-            counts, docs = drop_regex("number")
-            self.log(f" --> Dropping {counts} numbers from {docs} documents.", 2)
+        if self.lower_case:
+            self.log(" --> Converting text to lower case.", 2)
+
+        # Map the number of the matched group to the type of drop
+        types = list(defaults)
+        lookup = np.zeros(pattern.groups + 1 if pattern else 1, dtype=np.int8)
+        for name in regex:
+            lookup[pattern.groupindex[name]] = types.index(name)
+
+        positions = np.concatenate(positions)
+        codes = lookup[np.concatenate(groups)]
+        self._drops = (types, X.index[positions], codes, np.concatenate(matches))
+
+        descriptions = {
+            "email": "emails",
+            "url": "URL links",
+            "html": "HTML tags",
+            "emoji": "emojis",
+            "number": "numbers",
+        }
+        for name, description in descriptions.items():
+            if name in regex:
+                mask = codes == types.index(name)
+                self.log(
+                    f" --> Dropping {mask.sum()} {description} from "
+                    f"{len(np.unique(positions[mask]))} documents.", 2
+                )
 
         if self.drop_punctuation:
-            trans_table = str.maketrans("", "", punctuation)  # Translation table
-            if isinstance(X[corpus][0], str):
-                func = lambda row: row.translate(trans_table)
-            else:
-                func = lambda row: [str(w).translate(trans_table) for w in row]
-            X[corpus] = X[corpus].apply(func)
-            self.log(f" --> Dropping punctuation from the text.", 2)
-
-        # Concatenate all drops to one dataframe attribute
-        self.drops = pd.concat([series for series in drops.values()], axis=1)
-
-        # Drop empty tokens from every row
-        if not isinstance(X[corpus][0], str):
-            X[corpus] = X[corpus].apply(lambda row: [w for w in row if w])
+            self.log(" --> Dropping punctuation from the text.", 2)
 
         return X
 
@@ -310,6 +632,12 @@ class Tokenizer(BaseEstimator, TransformerMixin, BaseTransformer):
             - If int: Minimum number of occurrences to make a quadgram.
             - If float: Minimum frequency fraction to make a quadgram.
 
+    n_jobs: int, optional (default=1)
+        Number of cores to use for parallel processing.
+            - If >0: Number of cores to use.
+            - If -1: Use all available cores.
+            - If <-1: Use number of cores - 1 - value.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -340,10 +668,11 @@ class Tokenizer(BaseEstimator, TransformerMixin, BaseTransformer):
         bigram_freq: Optional[SCALAR] = None,
         trigram_freq: Optional[SCALAR] = None,
         quadgram_freq: Optional[SCALAR] = None,
+        n_jobs: int = 1,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
     ):
-        super().__init__(verbose=verbose, logger=logger)
+        super().__init__(n_jobs=n_jobs, verbose=verbose, logger=logger)
         self.bigram_freq = bigram_freq
         self.trigram_freq = trigram_freq
         self.quadgram_freq = quadgram_freq
@@ -371,59 +700,62 @@ class Tokenizer(BaseEstimator, TransformerMixin, BaseTransformer):
             Transformed corpus.
 
         """
-
-        def replace_ngrams(row, ngram, sep="<&&>"):
-            """Replace a ngram with one word unified by underscores."""
-            row = "&>" + sep.join(row) + "<&"  # Indicate words with separator
-            row = row.replace(  # Replace ngrams' separator with underscore
-                "&>" + sep.join(ngram) + "<&",
-                "&>" + "_".join(ngram) + "<&",
-            )
-            return row[2:-2].split(sep)
-
         X, y = self._prepare_input(X, y)
         corpus = get_corpus(X)
 
         self.log("Tokenizing the corpus...", 1)
 
-        if isinstance(X[corpus][0], str):
+        if isinstance(X[corpus].iloc[0], str):
             try:  # Download tokenizer if not already on machine
                 nltk.data.find("tokenizers/punkt")
             except LookupError:
                 nltk.download("punkt")
-            X[corpus] = X[corpus].apply(lambda row: nltk.word_tokenize(row))
 
-        ngrams = {
-            "bigrams": BigramCollocationFinder,
-            "trigrams": TrigramCollocationFinder,
-            "quadgrams": QuadgramCollocationFinder,
-        }
+            chunks = Parallel(n_jobs=self.n_jobs)(
+                delayed(tokenize_documents)(docs)
+                for docs in split_documents(X[corpus].tolist(), self.n_jobs)
+            )
+            docs = [doc for chunk in chunks for doc in chunk]
+            X[corpus] = pd.Series(docs, index=X.index, dtype="object")
 
-        for attr, finder in ngrams.items():
+        for attr, n in (("bigrams", 2), ("trigrams", 3), ("quadgrams", 4)):
             frequency = getattr(self, f"{attr[:-1]}_freq")
             if frequency:
-                df = pd.DataFrame(columns=[attr[:-1], "frequency"])
-
-                # Search for all n-grams in the documents
-                ngram_fd = finder.from_documents(X[corpus]).ngram_fd
+                # Count the n-grams in chunks of documents in parallel
+                counts = Counter()
+                for chunk in Parallel(n_jobs=self.n_jobs)(
+                    delayed(count_ngrams)(docs, n)
+                    for docs in split_documents(X[corpus].tolist(), self.n_jobs)
+                ):
+                    counts.update(chunk)
 
                 # Fraction to total number
                 if frequency < 1:
-                    frequency = int(frequency * len(ngram_fd))
-
-                occur, counts = 0, 0
-                for ngram, freq in ngram_fd.items():
-                    if freq >= frequency:
-                        occur += 1
-                        counts += freq
-                        X[corpus] = X[corpus].apply(replace_ngrams, args=(ngram,))
-                        df = df.append(
-                            {attr[:-1]: ngram, "frequency": freq}, ignore_index=True
-                        )
-
+                    frequency = int(frequency * len(counts))
+
+                accepted = {k: v for k, v in counts.items() if v >= frequency}
+
+                # Replace all n-grams in one pass over every document
+                if accepted:
+                    chunks = Parallel(n_jobs=self.n_jobs)(
+                        delayed(replace_ngrams)(docs, frozenset(accepted))
+                        for docs in split_documents(X[corpus].tolist(), self.n_jobs)
+                    )
+                    docs = [doc for chunk in chunks for doc in chunk]
+                    X[corpus] = pd.Series(docs, index=X.index, dtype="object")
+
+                df = pd.DataFrame(
+                    {
+                        attr[:-1]: pd.Series(list(accepted), dtype="object"),
+                        "frequency": pd.Series(list(accepted.values()), dtype="int64"),
+                    }
+                )
                 setattr(self, attr, df.sort_values(by="frequency", ascending=False))
 
-                self.log(f" --> Creating {occur} {attr} on {counts} locations.", 2)
+                self.log(
+                    f" --> Creating {len(accepted)} {attr} on "
+                    f"{sum(accepted.values())} locations.", 2
+                )
 
         return X
 
@@ -457,6 +789,19 @@ class Normalizer(BaseEstimator, TransformerMixin, BaseTransformer):
     lemmatize: bool, optional (default=True)
         Whether to apply lemmatization using WordNetLemmatizer.
 
+    cache_size: int or None, optional (default=100000)
+        Maximum number of entries in the stem and lemma caches. The
+        results of stemming and lemmatization are cached per word
+        (and part of speech) and reused in subsequent calls to the
+        transform method. When a cache is full, the oldest entries
+        are dropped first. If None, the caches are unbounded.
+
+    n_jobs: int, optional (default=1)
+        Number of cores to use for parallel processing.
+            - If >0: Number of cores to use.
+            - If -1: Use all available cores.
+            - If <-1: Use number of cores - 1 - value.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -468,6 +813,12 @@ class Normalizer(BaseEstimator, TransformerMixin, BaseTransformer):
         - If str: Name of the log file. Use "auto" for automatic naming.
         - Else: Python `logging.Logger` instance.
 
+    Attributes
+    ----------
+    cache_info: pd.DataFrame
+        Number of hits, misses, size and hit rate of the stem and
+        lemma caches.
+
     """
 
     @typechecked
@@ -477,14 +828,48 @@ class Normalizer(BaseEstimator, TransformerMixin, BaseTransformer):
         custom_stopwords: Optional[SEQUENCE_TYPES] = None,
         stem: Union[bool, str] = False,
         lemmatize: bool = True,
+        cache_size: Optional[int] = 100000,
+        n_jobs: int = 1,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
     ):
-        super().__init__(verbose=verbose, logger=logger)
+        super().__init__(n_jobs=n_jobs, verbose=verbose, logger=logger)
         self.stopwords = stopwords
         self.custom_stopwords = custom_stopwords
         self.stem = stem
         self.lemmatize = lemmatize
+        self.cache_size = cache_size
+
+        self._stems = {}
+        self._lemmas = {}
+        self._stem_language = None
+        self._hits = {"stem": 0, "lemma": 0}
+        self._misses = {"stem": 0, "lemma": 0}
+        self._lock = threading.Lock()  # Guards the caches
+
+    def __getstate__(self):
+        # Locks can't be pickled or deep copied
+        state = dict(super().__getstate__())
+        state.pop("_lock", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+
+    @property
+    def cache_info(self):
+        """Hits, misses, size and hit rate of the caches."""
+        df = pd.DataFrame(
+            {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": {"stem": len(self._stems), "lemma": len(self._lemmas)},
+            }
+        )
+        df["hit_rate"] = (df["hits"] / (df["hits"] + df["misses"])).fillna(0)
+
+        return df
 
     def transform(self, X, y=None):
         """Normalize the text.
@@ -505,28 +890,18 @@ class Normalizer(BaseEstimator, TransformerMixin, BaseTransformer):
             Transformed corpus.
 
         """
-
-        def pos(tag):
-            """Get part of speech from a tag."""
-            if tag in ("JJ", "JJR", "JJS"):
-                return wordnet.ADJ
-            elif tag in ("RB", "RBR", "RBS"):
-                return wordnet.ADV
-            elif tag in ("VB", "VBD", "VBG", "VBN", "VBP", "VBZ"):
-                return wordnet.VERB
-            else:  # "NN", "NNS", "NNP", "NNPS"
-                return wordnet.NOUN
+        if self.cache_size is not None and self.cache_size < 0:
+            raise ValueError(
+                "Invalid value for the cache_size parameter. "
+                f"Value should be >=0, got {self.cache_size}."
+            )
 
         X, y = self._prepare_input(X, y)
         corpus = get_corpus(X)
 
         self.log("Normalizing the corpus...", 1)
 
-        # If the corpus is not tokenized, separate by space
-        if isinstance(X[corpus][0], str):
-            X[corpus] = X[corpus].apply(lambda row: row.split())
-
-        stopwords = []
+        stopwords = set()
         if self.stopwords:
             if self.stopwords is True:
                 self.stopwords = "english"
@@ -536,24 +911,26 @@ class Normalizer(BaseEstimator, TransformerMixin, BaseTransformer):
                 nltk.data.find("corpora/stopwords")
             except LookupError:
                 nltk.download("stopwords")
-            stopwords = list(set(nltk.corpus.stopwords.words(self.stopwords.lower())))
+            stopwords.update(nltk.corpus.stopwords.words(self.stopwords.lower()))
 
         # Join predefined with customs stopwords
         if self.custom_stopwords is not None:
-            stopwords = set(stopwords + list(self.custom_stopwords))
+            stopwords.update(self.custom_stopwords)
 
         if stopwords:
             self.log(" --> Dropping stopwords.", 2)
-            f = lambda row: [word for word in row if word not in stopwords]
-            X[corpus] = X[corpus].apply(f)
 
         if self.stem:
             if self.stem is True:
                 self.stem = "english"
 
+            # The cached stems are only valid for one language
+            with self._lock:
+                if self.stem.lower() != self._stem_language:
+                    self._stems.clear()
+                    self._stem_language = self.stem.lower()
+
             self.log(" --> Applying stemming.", 2)
-            ss = SnowballStemmer(language=self.stem.lower())
-            X[corpus] = X[corpus].apply(lambda row: [ss.stem(word) for word in row])
 
         if self.lemmatize:
             try:  # Download resource if not already on machine
@@ -566,9 +943,43 @@ class Normalizer(BaseEstimator, TransformerMixin, BaseTransformer):
                 nltk.download("averaged_perceptron_tagger")
 
             self.log(" --> Applying lemmatization.", 2)
-            wnl = WordNetLemmatizer()
-            f = lambda row: [wnl.lemmatize(w, pos(tag)) for w, tag in nltk.pos_tag(row)]
-            X[corpus] = X[corpus].apply(f)
+
+        # Every chunk gets a snapshot of the caches, since other
+        # threads (e.g. stream_chunks) can update them concurrently
+        with self._lock:
+            stems, lemmas = dict(self._stems), dict(self._lemmas)
+
+        # Normalize chunks of documents in parallel
+        chunks = Parallel(n_jobs=self.n_jobs)(
+            delayed(normalize_documents)(
+                docs=docs,
+                stopwords=frozenset(stopwords),
+                stem=self.stem.lower() if self.stem else None,
+                lemmatize=self.lemmatize,
+                stems=stems,
+                lemmas=lemmas,
+            ) for docs in split_documents(X[corpus].tolist(), self.n_jobs)
+        )
+
+        docs = []
+        for chunk, new_stems, new_lemmas, hits in chunks:
+            docs.extend(chunk)
+            with self._lock:
+                for name, cache, new in (
+                    ("stem", self._stems, new_stems),
+                    ("lemma", self._lemmas, new_lemmas),
+                ):
+                    self._hits[name] += hits[name]
+                    self._misses[name] += len(new)
+                    cache.update(new)
+
+                    # Drop the oldest entries when the cache is full
+                    if self.cache_size is not None:
+                        n_drop = len(cache) - self.cache_size
+                        for key in list(islice(cache, max(0, n_drop))):
+                            del cache[key]
+
+        X[corpus] = pd.Series(docs, index=X.index, dtype="object")
 
         return X
 
@@ -578,7 +989,12 @@ class Vectorizer(BaseEstimator, TransformerMixin, BaseTransformer):
 
     Transform the corpus into meaningful vectors of numbers. The
     transformation is applied on the column named `Corpus`. If
-    there is no column with that name, an exception is raised.
+    there is no column with that name, an exception is raised. If
+    the documents are sequences of tokens, the tokens are used as
+    the words of the document (unless the analyzer, preprocessor or
+    tokenizer is customized through the kwargs). Use the
+    `partial_fit` method to fit the vectorizer on chunks of a corpus
+    that doesn't fit in memory.
 
     Parameters
     ----------
@@ -588,6 +1004,12 @@ class Vectorizer(BaseEstimator, TransformerMixin, BaseTransformer):
             - "TF-IDF": Uses a TF-IDF algorithm.
             - "Hashing": Uses a hashing algorithm.
 
+    return_sparse: bool, optional (default=False)
+        Whether to return the transformed output with a sparse dtype.
+        Sparse columns are stored in a compressed format and are
+        passed to the models as a sparse matrix (if the model accepts
+        them). Recommended for large vocabularies.
+
     verbose: int, optional (default=0)
         Verbosity level of the class. Possible values are:
             - 0 to not print anything.
@@ -614,17 +1036,107 @@ class Vectorizer(BaseEstimator, TransformerMixin, BaseTransformer):
     def __init__(
         self,
         strategy: str = "BOW",
+        return_sparse: bool = False,
         verbose: int = 0,
         logger: Optional[Union[str, callable]] = None,
         **kwargs,
     ):
         super().__init__(verbose=verbose, logger=logger)
         self.strategy = strategy
+        self.return_sparse = return_sparse
         self.kwargs = kwargs
 
         self._estimator = None
+        self._tokenized = False
+        self._n_docs = None
+        self._df = None
+        self._tf = None
         self._is_fitted = False
 
+    def _get_estimator(self, tokenized):
+        """Create the estimator of the strategy.
+
+        Parameters
+        ----------
+        tokenized: bool
+            Whether the documents are sequences of tokens.
+
+        """
+        if self.strategy.lower() == "bow":
+            self.bow = self._estimator = CountVectorizer(**self.kwargs)
+        elif self.strategy.lower() in ("tfidf", "tf-idf"):
+            self.tfidf = self._estimator = TfidfVectorizer(**self.kwargs)
+        elif self.strategy.lower() == "hashing":
+            self.hashing = self._estimator = HashingVectorizer(**self.kwargs)
+        else:
+            raise ValueError(
+                "Invalid value for the strategy parameter, got "
+                f"{self.strategy}. Choose from: BOW, TF-IDF, Hashing."
+            )
+
+        # Use the tokens as words instead of joining and splitting them again
+        self._tokenized = tokenized and not any(
+            key in self.kwargs for key in ("analyzer", "preprocessor", "tokenizer")
+        )
+        if self._tokenized:
+            self._estimator.set_params(
+                preprocessor=partial(
+                    preprocess_tokens,
+                    preprocessor=self._estimator.build_preprocessor(),
+                ),
+                tokenizer=split_tokens,
+                token_pattern=None,
+            )
+
+    def _documents(self, docs):
+        """Adapt the documents to the input the estimator expects."""
+        # Convert sequence of tokens to space separated string
+        if not self._tokenized and not isinstance(docs.iloc[0], str):
+            return docs.apply(lambda row: " ".join(row))
+        else:
+            return docs
+
+    def _update_vocabulary(self):
+        """Update the estimator with the statistics of partial_fit."""
+        estimator = self._estimator
+
+        if estimator.vocabulary is not None:
+            vocabulary = estimator.vocabulary
+            if not isinstance(vocabulary, dict):
+                vocabulary = {term: i for i, term in enumerate(vocabulary)}
+        else:
+            # Prune the terms in the same way as sklearn's vectorizers
+            high, low = estimator.max_df, estimator.min_df
+            if isinstance(high, float):
+                high *= self._n_docs
+            if isinstance(low, float):
+                low *= self._n_docs
+
+            terms = sorted(t for t, df in self._df.items() if low <= df <= high)
+            if estimator.max_features is not None:
+                terms.sort(key=lambda term: -self._tf[term])
+                terms = sorted(terms[:estimator.max_features])
+
+            vocabulary = {term: i for i, term in enumerate(terms)}
+
+        estimator.vocabulary_ = vocabulary
+        estimator.fixed_vocabulary_ = estimator.vocabulary is not None
+
+        if self.strategy.lower() in ("tfidf", "tf-idf"):
+            df = np.zeros(len(vocabulary))
+            for term, i in vocabulary.items():
+                df[i] = self._df[term]
+
+            if estimator.use_idf:
+                # Same smoothing as sklearn's TfidfTransformer
+                smooth = int(estimator.smooth_idf)
+                estimator.idf_ = np.log((self._n_docs + smooth) / (df + smooth)) + 1
+            else:
+                # Unit weights give the same output as use_idf=False
+                estimator.set_params(use_idf=True)
+                estimator.idf_ = np.ones(len(vocabulary))
+                estimator.set_params(use_idf=False)
+
     @composed(crash, method_to_log, typechecked)
     def fit(self, X: X_TYPES, y: Optional[Y_TYPES] = None):
         """Fit to data.
@@ -648,23 +1160,57 @@ class Vectorizer(BaseEstimator, TransformerMixin, BaseTransformer):
         X, y = self._prepare_input(X, y)
         corpus = get_corpus(X)
 
-        # Convert sequence of tokens to space separated string
-        if not isinstance(X[corpus][0], str):
-            X[corpus] = X[corpus].apply(lambda row: " ".join(row))
+        self._get_estimator(tokenized=not isinstance(X[corpus].iloc[0], str))
+        self._estimator.fit(self._documents(X[corpus]))
 
-        if self.strategy.lower() == "bow":
-            self.bow = self._estimator = CountVectorizer(**self.kwargs)
-        elif self.strategy.lower() in ("tfidf", "tf-idf"):
-            self.tfidf = self._estimator = TfidfVectorizer(**self.kwargs)
-        elif self.strategy.lower() == "hashing":
-            self.hashing = self._estimator = HashingVectorizer(**self.kwargs)
-        else:
-            raise ValueError(
-                "Invalid value for the strategy parameter, got "
-                f"{self.strategy}. Choose from: BOW, TF-IDF, Hashing."
-            )
+        self._n_docs = None  # Reset the statistics of partial_fit
+        self._is_fitted = True
+        return self
+
+    @composed(crash, method_to_log, typechecked)
+    def partial_fit(self, X: X_TYPES, y: Optional[Y_TYPES] = None):
+        """Fit to a chunk of text.
+
+        The document frequencies and word counts are accumulated over
+        calls, and the vocabulary (and idf for TF-IDF) is updated from
+        them, so only one chunk of documents has to be in memory at a
+        time. The first call after instantiation or after `fit`
+        starts with empty statistics. The Hashing strategy is
+        stateless, so every call is equivalent.
+
+        Parameters
+        ----------
+        X: dataframe-like
+            Chunk of the feature set with shape=(n_samples,
+            n_features). If X is not a pd.DataFrame, it should be
+            composed of a single feature containing the text documents.
+
+        y: int, str, sequence or None, optional (default=None)
+            Does nothing. Implemented for continuity of the API.
+
+        Returns
+        -------
+        self: Vectorizer
+            Fitted instance of self.
+
+        """
+        X, y = self._prepare_input(X, y)
+        corpus = get_corpus(X)
+
+        if self._n_docs is None:
+            self._get_estimator(tokenized=not isinstance(X[corpus].iloc[0], str))
+            self._n_docs, self._df, self._tf = 0, Counter(), Counter()
+
+        if self.strategy.lower() != "hashing":
+            analyzer = self._estimator.build_analyzer()
+            for doc in self._documents(X[corpus]):
+                features = analyzer(doc)
+                self._df.update(set(features))
+                self._tf.update(set(features) if self._estimator.binary else features)
+
+            self._n_docs += len(X)
+            self._update_vocabulary()
 
-        self._estimator.fit(X[corpus])
         self._is_fitted = True
         return self
 
@@ -694,17 +1240,23 @@ class Vectorizer(BaseEstimator, TransformerMixin, BaseTransformer):
 
         self.log("Vectorizing the corpus...", 1)
 
-        # Convert sequence of tokens to space separated string
-        if not isinstance(X[corpus][0], str):
-            X[corpus] = X[corpus].apply(lambda row: " ".join(row))
-
-        matrix = self._estimator.transform(X[corpus]).toarray()
+        matrix = self._estimator.transform(self._documents(X[corpus]))
         if self.strategy.lower() != "hashing":
-            for i, word in enumerate(self._estimator.get_feature_names_out()):
-                X[word] = matrix[:, i]
+            columns = list(self._estimator.get_feature_names_out())
         else:
             # Hashing has no words to put as column names
-            for i, word in enumerate(range(matrix.shape[1])):
-                X[f"hash_{i}"] = matrix[:, i]
+            columns = [f"hash_{i}" for i in range(matrix.shape[1])]
+
+        if self.return_sparse:
+            matrix = pd.DataFrame.sparse.from_spmatrix(
+                data=matrix,
+                index=X.index,
+                columns=columns,
+            )
+        else:
+            matrix = pd.DataFrame(matrix.toarray(), index=X.index, columns=columns)
+
+        # Words that are also column names replace the existing column
+        X = X.drop([corpus] + [c for c in columns if c in X], axis=1)
 
-        return X.drop(corpus, axis=1)
+        return pd.concat([X, matrix], axis=1)
@@ -52,7 +52,7 @@ from sklearn.metrics import (
 # Own modules
 from atom.basetransformer import BaseTransformer
 from .utils import (
-    SEQUENCE_TYPES, SCALAR, lst, check_is_fitted, check_dim, check_goal,
+    SEQUENCE_TYPES, SCALAR, lst, arr, check_is_fitted, check_dim, check_goal,
     check_binary_task, check_predict_proba, get_proba_attr, get_corpus,
     get_custom_scorer, get_best_score, partial_dependence, get_feature_importance,
     composed, crash, plot_from_model,
@@ -789,7 +789,7 @@ class BaseModelPlotter(BasePlotter):
         # Not using sns hue parameter because of legend formatting
         lines = defaultdict(pd.DataFrame)
         for m in models:
-            n_models = len(m.branch.idx[0]) // m._train_idx  # Number of models in iter
+            n_models = m._n_models  # Number of models in iter
             if m.metric_bootstrap is None:
                 values = {"x": [n_models], "y": [get_best_score(m, metric)]}
             else:
@@ -807,7 +807,7 @@ class BaseModelPlotter(BasePlotter):
             kwargs = dict(err_style="band" if df["x"].nunique() > 1 else "bars", ax=ax)
             sns.lineplot(data=df, x="x", y="y", marker="o", label=m.acronym, **kwargs)
 
-        n_models = [len(self.train) // m._train_idx for m in models]
+        n_models = [m._n_models for m in models]
         ax.set_xlim(max(n_models) + 0.1, min(n_models) - 0.1)
         ax.set_xticks(range(1, max(n_models) + 1))
 
@@ -825,6 +825,97 @@ class BaseModelPlotter(BasePlotter):
             display=display,
         )
 
+    @composed(crash, plot_from_model, typechecked)
+    def plot_hyperband(
+        self,
+        models: Optional[Union[str, SEQUENCE_TYPES]] = None,
+        metric: Union[int, str] = 0,
+        title: Optional[str] = None,
+        figsize: Tuple[SCALAR, SCALAR] = (10, 6),
+        filename: Optional[str] = None,
+        display: Optional[bool] = True,
+    ):
+        """Plot the best score per budget of every hyperband bracket.
+
+        Only use with models fitted using hyperband. Every line is a
+        bracket of a model, with the best score on the validation set
+        at every rung. Ensemble models are ignored.
+
+        Parameters
+        ----------
+        models: str, sequence or None, optional (default=None)
+            Name of the models to plot. If None, all models in the
+            pipeline that ran hyperband are selected.
+
+        metric: int or str, optional (default=0)
+            Index or name of the metric. Only for multi-metric runs.
+
+        title: str or None, optional (default=None)
+            Plot's title. If None, the title is left empty.
+
+        figsize: tuple, optional (default=(10, 6))
+            Figure's size, format as (x, y).
+
+        filename: str or None, optional (default=None)
+            Name of the file. Use "auto" for automatic naming. If
+            None, the figure is not saved.
+
+        display: bool or None, optional (default=True)
+            Whether to render the plot. If None, it returns the
+            matplotlib figure.
+
+        Returns
+        -------
+        fig: matplotlib.figure.Figure
+            Plot object. Only returned if `display=None`.
+
+        """
+        check_is_fitted(self, attributes="_models")
+        models = self._get_subclass(models, ensembles=False)
+        metric = self._get_metric(metric)
+
+        # Check there is at least one model that ran hyperband
+        models = [m for m in models if "budget" in m._bo]
+        if not models:
+            raise PermissionError(
+                "The plot_hyperband method is only available "
+                "for models that ran the hyperband algorithm!"
+            )
+
+        fig = self._get_figure()
+        ax = fig.add_subplot(BasePlotter._fig.grid)
+
+        n_lines = 0
+        for m in models:
+            df = pd.DataFrame(
+                {
+                    "bracket": m._bo["call"].str.split(",").str[0],
+                    "budget": m._bo["budget"],
+                    "y": m._bo["score"].apply(lambda x: lst(x)[metric]),
+                }
+            )
+            for bracket, group in df.groupby("bracket", sort=False):
+                best = group.groupby("budget")["y"].max()
+                label = bracket if len(models) == 1 else f"{m.name} - {bracket}"
+                ax.plot(best.index, best.values, "-o", label=label)
+                n_lines += 1
+
+        ax.set_xscale("log")
+
+        BasePlotter._fig._used_models.extend(models)
+        return self._plot(
+            fig=fig,
+            ax=ax,
+            title=title,
+            legend=("lower right", n_lines),
+            xlabel="Budget",
+            ylabel=self._metric[metric].name,
+            figsize=figsize,
+            plotname="plot_hyperband",
+            filename=filename,
+            display=display,
+        )
+
     @composed(crash, plot_from_model, typechecked)
     def plot_learning_curve(
             self,
@@ -1042,7 +1133,8 @@ class BaseModelPlotter(BasePlotter):
         same plot as produced by `bo_params={"plot": True}` while
         running the BO. Creates a canvas with two plots: the first
         plot shows the score of every trial and the second shows
-        the distance between the last consecutive steps.
+        the distance between the last consecutive steps. Pruned
+        trials are marked with a cross.
 
         Parameters
         ----------
@@ -1078,7 +1170,7 @@ class BaseModelPlotter(BasePlotter):
         metric = self._get_metric(metric)
 
         # Check there is at least one model that run the BO
-        if all([m.bo.empty for m in models]):
+        if all([m._bo.empty for m in models]):
             raise PermissionError(
                 "The plot_bo method is only available for models that "
                 "ran the bayesian optimization hyperparameter tuning!"
@@ -1090,19 +1182,39 @@ class BaseModelPlotter(BasePlotter):
         ax2 = plt.subplot(gs[3:4, 0], sharex=ax1)
         for m in models:
             if m.metric_bo:  # Only models that did run the BO
-                y = m.bo["score"].apply(lambda value: lst(value)[metric])
+                y = m._bo["score"].apply(lambda value: lst(value)[metric]).values
                 if len(models) == 1:
                     label = f"Score={round(lst(m.metric_bo)[metric], 3)}"
                 else:
                     label = f"{m.name} (Score={round(lst(m.metric_bo)[metric], 3)})"
 
-                # Draw bullets on all markers except the maximum
-                markers = [i for i in range(len(m.bo))]
-                markers.remove(int(np.argmax(y)))
+                # Pruned calls (if any) have an incomplete score
+                pruned = np.zeros(len(y), dtype=bool)
+                if "pruned" in m._bo:
+                    pruned = m._bo["pruned"].fillna(False).astype(bool).values
 
-                ax1.plot(range(1, len(y) + 1), y, "-o", markevery=markers, label=label)
+                # Calls with a partial budget (Hyperband) can't be the best
+                complete = ~pruned
+                if "budget" in m._bo:
+                    complete &= (m._bo["budget"] == 1).values
+                best = int(np.argmax(np.where(complete, y, -np.inf)))
+
+                # Draw bullets on all markers except the maximum and pruned
+                markers = [i for i in range(len(m._bo)) if i != best and not pruned[i]]
+
+                line = ax1.plot(
+                    range(1, len(y) + 1), y, "-o", markevery=markers, label=label
+                )
                 ax2.plot(range(2, len(y) + 1), np.abs(np.diff(y)), "-o")
-                ax1.scatter(np.argmax(y) + 1, max(y), zorder=10, s=100, marker="*")
+                ax1.scatter(best + 1, y[best], zorder=10, s=100, marker="*")
+                if pruned.any():
+                    ax1.scatter(
+                        x=np.flatnonzero(pruned) + 1,
+                        y=y[pruned],
+                        zorder=10,
+                        marker="x",
+                        color=line[0].get_color(),
+                    )
 
         plt.setp(ax1.get_xticklabels(), visible=False)
         ax2.xaxis.set_major_locator(MaxNLocator(integer=True))
@@ -2012,7 +2124,7 @@ class BaseModelPlotter(BasePlotter):
                 # Permutation importances returns Bunch object
                 m.permutations = permutation_importance(
                     estimator=m.estimator,
-                    X=m.X_test,
+                    X=arr(m.X_test),
                     y=m.y_test,
                     scoring=self._metric[0],
                     n_repeats=n_repeats,
@@ -2214,11 +2326,12 @@ class BaseModelPlotter(BasePlotter):
                         f"models use the same features, got {names} and {cols}."
                     )
 
-            # Compute averaged predictions
+            # Compute averaged predictions (sparse columns are densified)
+            X_test = arr(m.X_test)
             pd_results = Parallel(n_jobs=self.n_jobs)(
                 delayed(partial_dependence)(
                     estimator=m.estimator,
-                    X=m.X_test,
+                    X=X_test,
                     features=[m.features.index(c) for c in col],
                 ) for col in cols
             )
@@ -2233,7 +2346,7 @@ class BaseModelPlotter(BasePlotter):
             deciles = {}
             for fx in chain.from_iterable(cols):
                 if fx not in deciles:  # Skip if the feature is repeated
-                    X_col = _safe_indexing(m.X_test, fx, axis=1)
+                    X_col = _safe_indexing(X_test, fx, axis=1)
                     deciles[fx] = mquantiles(X_col, prob=np.arange(0.1, 1.0, 0.1))
 
             for axi, fx, (avg_pred, pred, values) in zip(axes, cols, pd_results):
@@ -2402,7 +2515,7 @@ class BaseModelPlotter(BasePlotter):
 
             parshap = {}
             for set_ in ("train", "test"):
-                X, y = getattr(m, f"X_{set_}"), getattr(m, f"y_{set_}")
+                X, y = arr(getattr(m, f"X_{set_}")), getattr(m, f"y_{set_}")
                 data = pd.concat([X, y], axis=1)
 
                 # Calculating shap values is computationally expensive,
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+"""
+Automated Tool for Optimized Modelling (ATOM)
+Author: Mavs
+Description: Module containing the inference server.
+
+"""
+
+# Standard packages
+import json
+import time
+import asyncio
+import threading
+import numpy as np
+import pandas as pd
+from bisect import bisect_left
+from http import HTTPStatus
+from collections import defaultdict
+from typeguard import typechecked
+from typing import Any, Optional
+
+# Own modules
+from .utils import SCALAR, SEQUENCE_TYPES
+
+
+# Classes ========================================================== >>
+
+class Histogram:
+    """Histogram of observed values.
+
+    Parameters
+    ----------
+    buckets: sequence
+        Upper bounds of the buckets. A last bucket without upper
+        bound is added to catch the remaining values.
+
+    """
+
+    def __init__(self, buckets):
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self):
+        return f"Histogram(count={self.count}, sum={round(self.sum, 4)})"
+
+    def add(self, value):
+        """Add an observation to the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self):
+        """Return the histogram as a json serializable dictionary."""
+        return dict(
+            buckets=self.buckets + ["inf"],
+            counts=self.counts,
+            count=self.count,
+            sum=self.sum,
+        )
+
+
+class InferenceServer:
+    """Local HTTP server that makes predictions in micro-batches.
+
+    Concurrent requests are coalesced into batches, so the prediction
+    method is called once per batch instead of once per request. A
+    batch is sent to the pipeline when it reaches `max_batch_size`
+    rows or when its first request waited for `max_wait` seconds.
+    The server only uses python's standard library and runs on
+    asyncio. The endpoints are:
+        - POST /predict: Body is a json object with key "data", and
+          as value a row (list or object) or a list of rows. Returns
+          a json object with key "predictions". Requests with
+          malformed rows are rejected before they are batched.
+        - GET /metrics: Histograms of the latency per request (in
+          milliseconds) and of the number of rows per batch.
+        - GET /health: Returns the server's status.
+
+    Parameters
+    ----------
+    pipeline: Pipeline or estimator
+        Fitted pipeline, e.g. the output of a model's `export_pipeline`
+        method, or any estimator with the `method` method.
+
+    method: str, optional (default="predict_proba")
+        Prediction method of the pipeline to call on every batch.
+
+    columns: sequence or None, optional (default=None)
+        Names of the features. Rows provided as lists are assigned
+        these names, and rows provided as objects are selected in
+        this order. If None, rows are passed to the pipeline as they
+        come.
+
+    max_batch_size: int, optional (default=32)
+        Maximum number of rows per batch. A request is never split
+        over batches.
+
+    max_wait: int or float, optional (default=0.005)
+        Maximum number of seconds that a request waits for other
+        requests to fill the batch.
+
+    host: str, optional (default="127.0.0.1")
+        Host to bind the server to.
+
+    port: int, optional (default=8000)
+        Port to bind the server to. If 0, a free port is selected.
+
+    buckets: sequence or None, optional (default=None)
+        Upper bounds (in milliseconds) of the buckets of the latency
+        histogram. If None, it uses 0.5, 1, 2.5, 5, 10, 25, 50, 100,
+        250, 500 and 1000.
+
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        pipeline: Any,
+        method: str = "predict_proba",
+        columns: Optional[SEQUENCE_TYPES] = None,
+        max_batch_size: int = 32,
+        max_wait: SCALAR = 0.005,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        buckets: Optional[SEQUENCE_TYPES] = None,
+    ):
+        if not hasattr(pipeline, method):
+            raise AttributeError(
+                f"{pipeline.__class__.__name__} doesn't have a {method} method!"
+            )
+        if max_batch_size <= 0:
+            raise ValueError(
+                "Invalid value for the max_batch_size parameter. "
+                f"Value should be >0, got {max_batch_size}."
+            )
+        if max_wait < 0:
+            raise ValueError(
+                "Invalid value for the max_wait parameter. "
+                f"Value should be >=0, got {max_wait}."
+            )
+
+        self.pipeline = pipeline
+        self.method = method
+        self.columns = columns
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.host = host
+        self.port = port
+
+        if buckets is None:
+            buckets = [0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+        # Powers of 2 up to the maximum batch size
+        sizes = [2 ** i for i in range(max_batch_size.bit_length())]
+
+        self.latency = Histogram(buckets)
+        self.batch_size = Histogram(sizes)
+
+        self._loop = None
+        self._queue = None
+        self._closing = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._exception = None
+
+    def __repr__(self):
+        return f"InferenceServer(host={self.host}, port={self.port})"
+
+    @property
+    def url(self):
+        """Address of the server."""
+        return f"http://{self.host}:{self.port}"
+
+    def _predict(self, rows):
+        """Make predictions on a batch of rows."""
+        X = pd.DataFrame(list(rows), columns=self.columns)
+        return getattr(self.pipeline, self.method)(X)
+
+    def _check_rows(self, rows):
+        """Validate the rows of a request and return the batch key.
+
+        Rows provided as objects are converted to lists if `columns`
+        is provided. Only requests with the same key are predicted
+        together, so that a batch never mixes incompatible rows.
+
+        Parameters
+        ----------
+        rows: list
+            Rows of the request.
+
+        Returns
+        -------
+        rows: list
+            Validated rows.
+
+        key: str or int
+            "dict" for rows provided as objects, else the number of
+            values per row.
+
+        """
+        if all(isinstance(row, dict) for row in rows):
+            if self.columns is None:
+                return rows, "dict"
+            rows = [[row.get(c, np.NaN) for c in self.columns] for row in rows]
+        elif not all(isinstance(row, list) for row in rows):
+            raise ValueError("Rows should be all lists or all objects.")
+
+        widths = set(len(row) for row in rows)
+        if self.columns is not None and widths != {len(self.columns)}:
+            raise ValueError(
+                f"Rows should have {len(self.columns)} values, got {widths}."
+            )
+        elif len(widths) > 1:
+            raise ValueError(f"Rows should have the same length, got {widths}.")
+
+        return rows, widths.pop()
+
+    async def _predict_batch(self, batch):
+        """Predict a batch of requests and set their results.
+
+        If the batch fails, every request is retried on its own, so
+        that only the requests that fail get the exception.
+
+        """
+        loop = asyncio.get_running_loop()
+        rows = [row for rows, _ in batch for row in rows]
+        try:
+            # Predict in a thread to keep accepting requests
+            pred = await loop.run_in_executor(None, self._predict, rows)
+        except Exception as ex:
+            if len(batch) > 1:
+                for item in batch:
+                    await self._predict_batch([item])
+            elif not batch[0][1].done():  # The client could have left
+                batch[0][1].set_exception(ex)
+        else:
+            i = 0
+            for rows, future in batch:
+                if not future.done():
+                    future.set_result(pred[i:i + len(rows)])
+                i += len(rows)
+
+    async def _batcher(self):
+        """Coalesce the queued requests into batches and predict."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            n_rows = len(batch[0][0])
+
+            deadline = loop.time() + self.max_wait
+            while n_rows < self.max_batch_size:
+                try:
+                    timeout = max(0, deadline - loop.time())
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+                batch.append(item)
+                n_rows += len(item[0])
+
+            # Requests with incompatible rows are predicted separately
+            groups = defaultdict(list)
+            for rows, key, future in batch:
+                groups[key].append((rows, future))
+
+            for group in groups.values():
+                await self._predict_batch(group)
+
+            self.batch_size.add(n_rows)
+
+    async def _route(self, method, path, body):
+        """Get the status code and content of the response."""
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        elif method == "GET" and path == "/metrics":
+            return 200, {
+                "latency": self.latency.to_dict(),
+                "batch_size": self.batch_size.to_dict(),
+            }
+        elif method == "POST" and path == "/predict":
+            t_init = time.perf_counter()
+            try:
+                data = json.loads(body)["data"]
+
+                # A single row is a list of values or an object
+                single = isinstance(data, dict) or not isinstance(data[0], (list, dict))
+                rows = [data] if single else data
+            except (ValueError, KeyError, TypeError, IndexError):
+                return 400, {"error": "Body should be a json object with key data."}
+
+            try:
+                rows, key = self._check_rows(rows)
+            except ValueError as ex:
+                return 400, {"error": str(ex)}
+
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put((rows, key, future))
+            try:
+                pred = await future
+            except Exception as ex:
+                return 500, {"error": str(ex)}
+
+            self.latency.add(1000 * (time.perf_counter() - t_init))
+
+            pred = pred.tolist() if hasattr(pred, "tolist") else list(pred)
+            return 200, {"predictions": pred[0] if single else pred}
+        else:
+            return 404, {"error": f"Unknown endpoint: {method} {path}."}
+
+    async def _handle(self, reader, writer):
+        """Read a HTTP request and write the response."""
+        try:
+            request = await reader.readline()
+            method, path, _ = request.decode("latin-1").split(" ", 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                key, value = line.decode("latin-1").split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            status, content = await self._route(method, path, body)
+        except (ValueError, asyncio.IncompleteReadError):
+            status, content = 400, {"error": "Malformed request."}
+
+        payload = json.dumps(content).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+        writer.close()
+
+    async def _serve(self):
+        """Run the server until it's stopped."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._closing = asyncio.Event()
+
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        batcher = asyncio.ensure_future(self._batcher())
+        self._ready.set()
+
+        async with server:
+            await self._closing.wait()
+
+        batcher.cancel()
+
+    def _run(self):
+        """Run the server in the current thread."""
+        try:
+            asyncio.run(self._serve())
+        except Exception as ex:
+            self._exception = ex
+            self._ready.set()
+
+    def serve(self):
+        """Run the server in the current thread until interrupted."""
+        asyncio.run(self._serve())
+
+    def start(self):
+        """Start the server in a background thread.
+
+        Returns
+        -------
+        self: InferenceServer
+            Server instance.
+
+        """
+        self._ready.clear()
+        self._exception = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._exception:
+            raise self._exception
+
+        return self
+
+    def stop(self):
+        """Stop the server running in a background thread."""
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._closing.set)
+            self._thread.join()
+            self._thread = None
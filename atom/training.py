@@ -37,13 +37,13 @@ class Direct(BaseEstimator, BaseTrainer, BaseModelPlotter):
 
     def __init__(
         self, models, metric, greater_is_better, needs_proba, needs_threshold,
-        n_calls, n_initial_points, est_params, bo_params, n_bootstrap, n_jobs,
-        verbose, warnings, logger, experiment, random_state,
+        n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+        parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
     ):
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-            n_jobs, verbose, warnings, logger, experiment, random_state,
+            n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+            parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
         )
 
     @composed(crash, method_to_log)
@@ -76,7 +76,9 @@ class SuccessiveHalving(BaseEstimator, BaseTrainer, BaseModelPlotter):
     complete dataset. Beware that a model's performance can depend
     greatly on the amount of data on which it is trained. For this
     reason, it is recommended to only use this technique with similar
-    models, e.g. only using tree-based models.
+    models, e.g. only using tree-based models. Instead of the fraction
+    of the data, the budget can also be the number of iterations (trees
+    or epochs) the models are trained for, like in Hyperband.
 
     See basetrainer.py for a description of the remaining parameters.
 
@@ -85,18 +87,36 @@ class SuccessiveHalving(BaseEstimator, BaseTrainer, BaseModelPlotter):
     skip_runs: int, optional (default=0)
         Skip last `skip_runs` runs of the successive halving.
 
+    warm_start: bool, optional (default=False)
+        Whether the models continue from the previous run. The BO of
+        every model starts from the calls of its previous run, and
+        estimators with the same hyperparameters as in the previous
+        run continue training from its fitted estimator when their
+        resource increased (only for resource="iterations").
+
+    resource: str, optional (default="samples")
+        Budget that is halved every run.
+            - "samples": Fraction of the training set.
+            - "iterations": Number of iterations of the models. Every
+                            run uses the complete training set. Only
+                            for models with a resource parameter
+                            (e.g. n_estimators or max_iter).
+
     """
 
     def __init__(
         self, models, metric, greater_is_better, needs_proba, needs_threshold,
-        skip_runs, n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-        n_jobs, verbose, warnings, logger, experiment, random_state,
+        skip_runs, warm_start, resource, n_calls, n_initial_points, est_params,
+        bo_params, n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings,
+        logger, experiment, random_state,
     ):
         self.skip_runs = skip_runs
+        self.warm_start = warm_start
+        self.resource = resource
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-            n_jobs, verbose, warnings, logger, experiment, random_state,
+            n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+            parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
         )
 
     @composed(crash, method_to_log)
@@ -128,6 +148,25 @@ class SuccessiveHalving(BaseEstimator, BaseTrainer, BaseModelPlotter):
                 f"and skip_runs={self.skip_runs}."
             )
 
+        if self.resource not in ("samples", "iterations"):
+            raise ValueError(
+                "Invalid value for the resource parameter, got "
+                f"{self.resource}. Choose from: samples, iterations."
+            )
+
+        # Maximum number of iterations per model
+        max_resource = {}
+        if self.resource == "iterations":
+            for m in self._models.values():
+                if not m.resource:
+                    raise ValueError(
+                        "Invalid value for the resource parameter. The "
+                        f"{m.acronym} model has no parameter to budget the "
+                        "number of iterations. Use resource='samples'."
+                    )
+
+                max_resource[m.acronym] = m._get_max_resource()
+
         run = 0
         models = CustomDict()
         og_models = {k: copy(v) for k, v in self._models.items()}
@@ -136,13 +175,27 @@ class SuccessiveHalving(BaseEstimator, BaseTrainer, BaseModelPlotter):
             for m in self._models.values():
                 m.name += str(len(self._models))
                 m._pred = [None] * 15  # Avoid shallow copy
-                m._train_idx = len(self.train) // len(self._models)
+                m._scaled = {}
+                m._n_models = len(self._models)
+                if self.resource == "samples":
+                    m._train_idx = len(self.train) // len(self._models)
+                else:
+                    n_iter = max(1, max_resource[m.acronym] // len(self._models))
+                    m._est_params = {**m._est_params, m.resource: n_iter}
 
             # Print stats for this subset of the data
             p = round(100.0 / len(self._models))
             self.log(f"\n\nRun: {run} {'='*32} >>", 1)
             self.log(f"Models: {', '.join(lst(self.models))}", 1)
-            self.log(f"Size of training set: {len(self.train)} ({p}%)", 1)
+            if self.resource == "samples":
+                self.log(f"Size of training set: {len(self.train)} ({p}%)", 1)
+            else:
+                self.log(f"Size of training set: {len(self.train)}", 1)
+                out = [
+                    f"{m.name}: {m.resource}={m._est_params[m.resource]}"
+                    for m in self._models.values()
+                ]
+                self.log(f"Iterations ({p}%): {', '.join(out)}", 1)
             self.log(f"Size of test set: {len(self.test)}", 1)
 
             self._core_iteration()
@@ -154,9 +207,13 @@ class SuccessiveHalving(BaseEstimator, BaseTrainer, BaseModelPlotter):
                 index=[m.name for m in self._models.values()],
             ).nlargest(n=len(self._models) // 2, keep="first")
             names = [m.acronym for m in self._models.values() if m.name in best.index]
+            previous = {m.acronym: m for m in self._models.values()}
             self._models = CustomDict(
                 {k: copy(v) for k, v in og_models.items() if v.acronym in names}
             )
+            if self.warm_start:
+                for m in self._models.values():
+                    m._warm_start = previous[m.acronym]
 
             run += 1
 
@@ -184,18 +241,28 @@ class TrainSizing(BaseEstimator, BaseTrainer, BaseModelPlotter):
             - If sequence: Fraction of the training set when <=1, else
                            total number of samples.
 
+    warm_start: bool, optional (default=False)
+        Whether the models continue from the previous run. The BO of
+        every model starts from the calls of its previous run, and
+        estimators with a `partial_fit` method and the same
+        hyperparameters as in the previous run continue training from
+        its fitted estimator on the rows that were added to the
+        training set.
+
     """
 
     def __init__(
         self, models, metric, greater_is_better, needs_proba, needs_threshold,
-        train_sizes, n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-        n_jobs, verbose, warnings, logger, experiment, random_state
+        train_sizes, warm_start, n_calls, n_initial_points, est_params, bo_params,
+        n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings, logger,
+        experiment, random_state,
     ):
         self.train_sizes = train_sizes
+        self.warm_start = warm_start
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-            n_jobs, verbose, warnings, logger, experiment, random_state,
+            n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+            parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
         )
 
     @composed(crash, method_to_log)
@@ -220,29 +287,34 @@ class TrainSizing(BaseEstimator, BaseTrainer, BaseModelPlotter):
             self.train_sizes = np.linspace(1 / self.train_sizes, 1.0, self.train_sizes)
 
         models = CustomDict()
+        previous = {}  # Model of the previous run per acronym
         og_models = {k: copy(v) for k, v in self._models.items()}
         for run, size in enumerate(self.train_sizes):
             # Select fraction of data to use in this run
             if size <= 1:
                 frac = round(size, 2)
-                train_idx = int(size * len(self.branch.train))
+                train_idx = int(size * len(self.branch._train))
             else:
-                frac = round(size / len(self.branch.train), 2)
+                frac = round(size / len(self.branch._train), 2)
                 train_idx = size
 
             for m in self._models.values():
                 m.name += str(frac).replace(".", "")  # Add frac to the name
                 m._pred = [None] * 15  # Avoid shallow copy
+                m._scaled = {}
                 m._train_idx = train_idx
+                if self.warm_start:
+                    m._warm_start = previous.get(m.acronym)
 
             # Print stats for this subset of the data
-            p = round(train_idx * 100.0 / len(self.branch.train))
+            p = round(train_idx * 100.0 / len(self.branch._train))
             self.log(f"\n\nRun: {run} {'='*32} >>", 1)
             self.log(f"Size of training set: {train_idx} ({p}%)", 1)
             self.log(f"Size of test set: {len(self.test)}", 1)
 
             self._core_iteration()
             models.update({m.name.lower(): m for m in self._models.values()})
+            previous = {m.acronym: m for m in self._models.values()}
 
             # Create next models for sizing
             self._models = CustomDict({k: copy(v) for k, v in og_models.items()})
@@ -250,6 +322,118 @@ class TrainSizing(BaseEstimator, BaseTrainer, BaseModelPlotter):
         self._models = models  # Restore original models
 
 
+class Hyperband(BaseEstimator, BaseTrainer, BaseModelPlotter):
+    """Hyperband training approach.
+
+    Hyperband tunes the hyperparameters of every model running several
+    brackets of successive halving over configurations sampled from
+    the model's hyperparameter space. Brackets trade off the number of
+    configurations against the budget they start with, so that both
+    many configurations on a small budget and few on a large budget
+    are explored. Optionally (BOHB), the configurations are sampled
+    from a density model of the best configurations found so far
+    instead of at random. After tuning, every model is fitted on the
+    complete training set with the best configuration found. Of the
+    `bo_params`, only dimensions, early_stopping, fixed_splits and
+    cache_size are used.
+
+    See basetrainer.py for a description of the remaining parameters.
+
+    Parameters
+    ----------
+    eta: int, optional (default=3)
+        Factor by which the number of configurations is divided and
+        the budget is multiplied every rung of a bracket.
+
+    min_resource: float, optional (default=0.1)
+        Minimum budget of a call, as fraction of the complete budget.
+        Determines the number of brackets, which is equal to
+        floor(log_eta(1 / min_resource)) + 1.
+
+    resource: str, optional (default="samples")
+        Budget of the calls.
+            - "samples": Fraction of the training set.
+            - "iterations": Number of iterations of the models. Every
+                            call uses the complete training set. Only
+                            for models with a resource parameter
+                            (e.g. n_estimators or max_iter).
+
+    sampler: str, optional (default="random")
+        Strategy to sample the configurations.
+            - "random": Sample uniformly from the hyperparameter space.
+            - "bohb": Sample two thirds of the configurations from a
+                      kernel density model of the best configurations
+                      (as in BOHB) and the rest at random.
+
+    """
+
+    def __init__(
+        self, models, metric, greater_is_better, needs_proba, needs_threshold,
+        eta, min_resource, resource, sampler, est_params, bo_params, n_bootstrap,
+        oob_score, parallel, n_jobs, verbose, warnings, logger, experiment,
+        random_state,
+    ):
+        self.eta = eta
+        self.min_resource = min_resource
+        self.resource = resource
+        self.sampler = sampler
+
+        # Hyperband replaces the BO (n_calls=0)
+        super().__init__(
+            models, metric, greater_is_better, needs_proba, needs_threshold,
+            0, 5, est_params, bo_params, n_bootstrap, oob_score, parallel, n_jobs,
+            verbose, warnings, logger, experiment, random_state,
+        )
+
+    @composed(crash, method_to_log)
+    def run(self, *arrays):
+        """Run the trainer.
+
+        Parameters
+        ----------
+        *arrays: sequence of indexables
+            Training set and test set. Allowed formats are:
+                - train, test
+                - X_train, X_test, y_train, y_test
+                - (X_train, y_train), (X_test, y_test)
+
+        """
+        self.branch.data, self.branch.idx, self.holdout = self._get_data(arrays)
+        self.task = infer_task(self.y_train, goal=self.goal)
+        self._check_parameters()
+
+        if self.eta < 2:
+            raise ValueError(
+                "Invalid value for the eta parameter. "
+                f"Value should be >=2, got {self.eta}."
+            )
+        if not 0 < self.min_resource < 1:
+            raise ValueError(
+                "Invalid value for the min_resource parameter. "
+                f"Value should be >0 and <1, got {self.min_resource}."
+            )
+        if self.resource not in ("samples", "iterations"):
+            raise ValueError(
+                "Invalid value for the resource parameter, got "
+                f"{self.resource}. Choose from: samples, iterations."
+            )
+        elif self.resource == "iterations":
+            for m in self._models.values():
+                if not m.resource:
+                    raise ValueError(
+                        "Invalid value for the resource parameter. The "
+                        f"{m.acronym} model has no parameter to budget the "
+                        "number of iterations. Use resource='samples'."
+                    )
+        if self.sampler not in ("random", "bohb"):
+            raise ValueError(
+                "Invalid value for the sampler parameter, got "
+                f"{self.sampler}. Choose from: random, bohb."
+            )
+
+        self._core_iteration()
+
+
 class DirectClassifier(Direct):
     """Direct trainer for classification tasks."""
 
@@ -266,6 +450,8 @@ class DirectClassifier(Direct):
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         n_jobs: int = 1,
         verbose: int = 0,
         warnings: Union[bool, str] = True,
@@ -276,8 +462,8 @@ class DirectClassifier(Direct):
         self.goal = "class"
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-            n_jobs, verbose, warnings, logger, experiment, random_state,
+            n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+            parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
         )
 
 
@@ -297,6 +483,8 @@ class DirectRegressor(Direct):
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         n_jobs: int = 1,
         verbose: int = 0,
         warnings: Union[bool, str] = True,
@@ -307,8 +495,8 @@ class DirectRegressor(Direct):
         self.goal = "reg"
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            n_calls, n_initial_points, est_params, bo_params, n_bootstrap,
-            n_jobs, verbose, warnings, logger, experiment, random_state,
+            n_calls, n_initial_points, est_params, bo_params, n_bootstrap, oob_score,
+            parallel, n_jobs, verbose, warnings, logger, experiment, random_state,
         )
 
 
@@ -324,11 +512,15 @@ class SuccessiveHalvingClassifier(SuccessiveHalving):
         needs_proba: Union[bool, SEQUENCE_TYPES] = False,
         needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
         skip_runs: int = 0,
+        warm_start: bool = False,
+        resource: str = "samples",
         n_calls: Union[int, SEQUENCE_TYPES] = 0,
         n_initial_points: Union[int, SEQUENCE_TYPES] = 5,
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         n_jobs: int = 1,
         verbose: int = 0,
         warnings: Union[bool, str] = True,
@@ -339,9 +531,9 @@ class SuccessiveHalvingClassifier(SuccessiveHalving):
         self.goal = "class"
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            skip_runs, n_calls, n_initial_points, est_params, bo_params,
-            n_bootstrap, n_jobs, verbose, warnings, logger, experiment,
-            random_state,
+            skip_runs, warm_start, resource, n_calls, n_initial_points, est_params,
+            bo_params, n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings,
+            logger, experiment, random_state,
         )
 
 
@@ -357,11 +549,15 @@ class SuccessiveHalvingRegressor(SuccessiveHalving):
         needs_proba: Union[bool, SEQUENCE_TYPES] = False,
         needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
         skip_runs: int = 0,
+        warm_start: bool = False,
+        resource: str = "samples",
         n_calls: Union[int, SEQUENCE_TYPES] = 0,
         n_initial_points: Union[int, SEQUENCE_TYPES] = 5,
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         n_jobs: int = 1,
         verbose: int = 0,
         warnings: Union[bool, str] = True,
@@ -372,9 +568,9 @@ class SuccessiveHalvingRegressor(SuccessiveHalving):
         self.goal = "reg"
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            skip_runs, n_calls, n_initial_points, est_params, bo_params,
-            n_bootstrap, n_jobs, verbose, warnings, logger, experiment,
-            random_state,
+            skip_runs, warm_start, resource, n_calls, n_initial_points, est_params,
+            bo_params, n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings,
+            logger, experiment, random_state,
         )
 
 
@@ -390,11 +586,14 @@ class TrainSizingClassifier(TrainSizing):
         needs_proba: Union[bool, SEQUENCE_TYPES] = False,
         needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
         train_sizes: Union[int, SEQUENCE_TYPES] = 5,
+        warm_start: bool = False,
         n_calls: Union[int, SEQUENCE_TYPES] = 0,
         n_initial_points: Union[int, SEQUENCE_TYPES] = 5,
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         n_jobs: int = 1,
         verbose: int = 0,
         warnings: Union[bool, str] = True,
@@ -405,9 +604,9 @@ class TrainSizingClassifier(TrainSizing):
         self.goal = "class"
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            train_sizes, n_calls, n_initial_points, est_params, bo_params,
-            n_bootstrap, n_jobs, verbose, warnings, logger, experiment,
-            random_state,
+            train_sizes, warm_start, n_calls, n_initial_points, est_params,
+            bo_params, n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings,
+            logger, experiment, random_state,
         )
 
 
@@ -423,11 +622,86 @@ class TrainSizingRegressor(TrainSizing):
         needs_proba: Union[bool, SEQUENCE_TYPES] = False,
         needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
         train_sizes: Union[int, SEQUENCE_TYPES] = 5,
+        warm_start: bool = False,
         n_calls: Union[int, SEQUENCE_TYPES] = 0,
         n_initial_points: Union[int, SEQUENCE_TYPES] = 5,
         est_params: Optional[dict] = None,
         bo_params: Optional[dict] = None,
         n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
+        n_jobs: int = 1,
+        verbose: int = 0,
+        warnings: Union[bool, str] = True,
+        logger: Optional[Union[str, callable]] = None,
+        experiment: Optional[str] = None,
+        random_state: Optional[int] = None,
+    ):
+        self.goal = "reg"
+        super().__init__(
+            models, metric, greater_is_better, needs_proba, needs_threshold,
+            train_sizes, warm_start, n_calls, n_initial_points, est_params,
+            bo_params, n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings,
+            logger, experiment, random_state,
+        )
+
+
+class HyperbandClassifier(Hyperband):
+    """Hyperband trainer for classification tasks."""
+
+    @typechecked
+    def __init__(
+        self,
+        models: Optional[Union[str, callable, SEQUENCE_TYPES]] = None,
+        metric: Optional[Union[str, callable, SEQUENCE_TYPES]] = None,
+        greater_is_better: Union[bool, SEQUENCE_TYPES] = True,
+        needs_proba: Union[bool, SEQUENCE_TYPES] = False,
+        needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
+        eta: int = 3,
+        min_resource: float = 0.1,
+        resource: str = "samples",
+        sampler: str = "random",
+        est_params: Optional[dict] = None,
+        bo_params: Optional[dict] = None,
+        n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
+        n_jobs: int = 1,
+        verbose: int = 0,
+        warnings: Union[bool, str] = True,
+        logger: Optional[Union[str, callable]] = None,
+        experiment: Optional[str] = None,
+        random_state: Optional[int] = None,
+    ):
+        self.goal = "class"
+        super().__init__(
+            models, metric, greater_is_better, needs_proba, needs_threshold,
+            eta, min_resource, resource, sampler, est_params, bo_params,
+            n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings, logger,
+            experiment, random_state,
+        )
+
+
+class HyperbandRegressor(Hyperband):
+    """Hyperband trainer for regression tasks."""
+
+    @typechecked
+    def __init__(
+        self,
+        models: Optional[Union[str, callable, SEQUENCE_TYPES]] = None,
+        metric: Optional[Union[str, callable, SEQUENCE_TYPES]] = None,
+        greater_is_better: Union[bool, SEQUENCE_TYPES] = True,
+        needs_proba: Union[bool, SEQUENCE_TYPES] = False,
+        needs_threshold: Union[bool, SEQUENCE_TYPES] = False,
+        eta: int = 3,
+        min_resource: float = 0.1,
+        resource: str = "samples",
+        sampler: str = "random",
+        est_params: Optional[dict] = None,
+        bo_params: Optional[dict] = None,
+        n_bootstrap: Union[int, SEQUENCE_TYPES] = 0,
+        oob_score: bool = False,
+        parallel: bool = False,
         n_jobs: int = 1,
         verbose: int = 0,
         warnings: Union[bool, str] = True,
@@ -438,7 +712,7 @@ class TrainSizingRegressor(TrainSizing):
         self.goal = "reg"
         super().__init__(
             models, metric, greater_is_better, needs_proba, needs_threshold,
-            train_sizes, n_calls, n_initial_points, est_params, bo_params,
-            n_bootstrap, n_jobs, verbose, warnings, logger, experiment,
-            random_state,
+            eta, min_resource, resource, sampler, est_params, bo_params,
+            n_bootstrap, oob_score, parallel, n_jobs, verbose, warnings, logger,
+            experiment, random_state,
         )
@@ -9,17 +9,24 @@ Description: Module containing utility constants, functions and classes.
 
 # Standard packages
 import math
+import json
+import sqlite3
+import hashlib
 import logging
 import numpy as np
 import pandas as pd
-from copy import copy
+from copy import copy, deepcopy
 from typing import Union
 from scipy import sparse
+from numpy.lib.recfunctions import structured_to_unstructured
 from shap import Explainer
 from functools import wraps
+from itertools import islice
+from joblib import Parallel, delayed
 from collections import deque
+from collections.abc import Iterator
 from datetime import datetime
-from inspect import signature
+from inspect import signature, unwrap
 from collections.abc import MutableMapping
 from sklearn.preprocessing import (
     StandardScaler,
@@ -32,6 +39,7 @@ from sklearn.covariance import EllipticEnvelope
 from sklearn.neighbors import LocalOutlierFactor
 from sklearn.svm import OneClassSVM
 from sklearn.cluster import DBSCAN, OPTICS
+from sklearn.base import is_regressor
 from sklearn.utils import _print_elapsed_time
 
 # Encoders
@@ -82,6 +90,7 @@ from sklearn.metrics import (
     matthews_corrcoef,
 )
 from sklearn.utils import _safe_indexing
+from sklearn.utils.multiclass import type_of_target
 from sklearn.inspection._partial_dependence import (
     _grid_from_X,
     _partial_dependence_brute,
@@ -283,6 +292,11 @@ def is_multidim(df):
     return df.columns[0] == "Multidimensional feature" and len(df.columns) <= 2
 
 
+def is_sparse(df):
+    """Check if the dataframe contains any sparse column."""
+    return any(isinstance(dtype, pd.SparseDtype) for dtype in df.dtypes)
+
+
 def check_dim(cls, method):
     """Raise an error if the dataset has more than two dimensions."""
     if is_multidim(cls.X):
@@ -327,6 +341,9 @@ def get_proba_attr(model):
 
 def check_scaling(X):
     """Check if the data is scaled to mean=0 and std=1."""
+    if is_sparse(X):
+        return False  # Sparse data is never centered
+
     mean = X.mean(numeric_only=True).mean()
     std = X.std(numeric_only=True).mean()
     return True if mean < 0.05 and 0.93 < std < 1.07 else False
@@ -465,27 +482,53 @@ def to_series(data, index=None, name="target", dtype=None):
     return data
 
 
-def arr(df):
-    """From dataframe to multidimensional array.
+def arr(df, accept_sparse=False):
+    """From dataframe to the input format of an estimator.
 
     When the data consist of more than 2 dimensions, ATOM stores
     it in a df with a single column, "Multidimensional feature".
     This function extracts the arrays from every row and returns
-    them stacked.
+    them stacked. Dataframes with sparse columns are converted to
+    a sparse matrix or to dense columns.
 
     Parameters
     ----------
     df: pd.DataFrame
         Dataset to check.
 
+    accept_sparse: bool, optional (default=False)
+        Whether the estimator accepts sparse matrices. If True,
+        dataframes with sparse columns are returned as a CSR
+        matrix. If False, the sparse columns are converted to
+        dense ones.
+
     Returns
     -------
-    df: pd.DataFrame
-        Stacked dataframe.
+    df: pd.DataFrame, np.array or sparse.csr_matrix
+        Stacked or converted dataframe.
 
     """
     if is_multidim(df):
         return np.stack(df["Multidimensional feature"].values)
+    elif is_sparse(df):
+        if accept_sparse:
+            dtypes = {
+                col: pd.SparseDtype(dtype, 0) for col, dtype in df.dtypes.items()
+                if not isinstance(dtype, pd.SparseDtype)
+            }
+            matrix = df.astype(dtypes).sparse.to_coo().tocsr()
+
+            # Some estimators only accept sparse matrices of floats
+            return matrix if matrix.dtype.kind == "f" else matrix.astype(float)
+        else:
+            return pd.concat(
+                objs=[
+                    df[c].sparse.to_dense()
+                    if isinstance(df[c].dtype, pd.SparseDtype) else df[c]
+                    for c in df
+                ],
+                axis=1,
+            )
     else:
         return df
 
@@ -730,6 +773,88 @@ def get_custom_scorer(metric, gib=True, needs_proba=False, needs_threshold=False
     return scorer
 
 
+def get_scores(estimator, X, y, scorers):
+    """Score an estimator on multiple metrics with one prediction pass.
+
+    Every prediction method (predict, predict_proba or
+    decision_function) required by the scorers is called at most once
+    and all scores are calculated from the stored predictions.
+    Scorers of an unknown type are called directly on the estimator.
+
+    Parameters
+    ----------
+    estimator: estimator
+        Fitted estimator instance.
+
+    X: np.array or pd.DataFrame
+        Feature set.
+
+    y: np.array or pd.Series
+        Target column corresponding to X.
+
+    scorers: list
+        Scorers to evaluate the estimator with.
+
+    Returns
+    -------
+    scores: list
+        Score of the estimator per scorer.
+
+    """
+    predictions = {}
+    binary = type_of_target(y) == "binary"
+
+    def get_predictions(method):
+        """Get the (stored) predictions of a method."""
+        if method not in predictions:
+            predictions[method] = getattr(estimator, method)(X)
+
+        return predictions[method]
+
+    def get_pos_label(scorer):
+        """Get the positive class of a scorer (like sklearn does)."""
+        pos_label = scorer._kwargs.get("pos_label", estimator.classes_[1])
+        if pos_label not in list(estimator.classes_):
+            raise ValueError(
+                f"pos_label={pos_label} is not a valid label. It "
+                f"should be one of {list(estimator.classes_)}."
+            )
+
+        return pos_label
+
+    scores = []
+    for scorer in scorers:
+        scorer_type = scorer.__class__.__name__
+        if scorer_type == "_PredictScorer":
+            method = "predict"
+        elif scorer_type == "_ProbaScorer":
+            method = "predict_proba"
+        elif scorer_type == "_ThresholdScorer":
+            if is_regressor(estimator):
+                method = "predict"
+            elif hasattr(estimator, "decision_function"):
+                method = "decision_function"
+            else:
+                method = "predict_proba"
+        else:
+            scores.append(scorer(estimator, X, y))
+            continue
+
+        y_pred = get_predictions(method)
+        if binary and method == "predict_proba" and y_pred.shape[1] == 2:
+            # Probability of the positive class
+            idx = list(estimator.classes_).index(get_pos_label(scorer))
+            y_pred = y_pred[:, idx]
+        elif binary and method == "decision_function" and y_pred.ndim == 1:
+            # The decision function points towards the second class
+            if get_pos_label(scorer) == estimator.classes_[0]:
+                y_pred = -y_pred
+
+        scores.append(scorer._sign * scorer._score_func(y, y_pred, **scorer._kwargs))
+
+    return scores
+
+
 def infer_task(y, goal="class"):
     """Infer the task corresponding to a target column.
 
@@ -1008,6 +1133,158 @@ def fit_transform_one(transformer, X=None, y=None, message=None, **fit_params):
 
 # Functions shared by classes ======================================= >>
 
+def get_chunks(data, chunksize=None):
+    """Read the rows of a dataset in chunks.
+
+    Parameters
+    ----------
+    data: str, dataframe-like or iterator
+        Data to read.
+            - If str: Path to a csv or parquet file. The file is read
+                      chunk by chunk, so it's never completely loaded
+                      in memory.
+            - If dataframe-like: Dataset in memory.
+            - If iterator: Dataframe-like chunks.
+
+    chunksize: int or None, optional (default=None)
+        Maximum number of rows per chunk. If None, the chunks of an
+        iterator are yielded unchanged, and files and datasets in
+        memory are read in one chunk.
+
+    Yields
+    ------
+    chunk: pd.DataFrame
+        Rows of the dataset.
+
+    """
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError(
+            "Invalid value for the chunksize parameter. "
+            f"Value should be >0, got {chunksize}."
+        )
+
+    if isinstance(data, str):
+        if data.lower().endswith(".parquet"):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise ValueError(
+                    "Unable to import the pyarrow package. "
+                    "Make sure it is installed to read parquet files."
+                )
+
+            for batch in pq.ParquetFile(data).iter_batches(chunksize or 65536):
+                yield batch.to_pandas()
+        elif chunksize is None:
+            yield pd.read_csv(data)
+        else:
+            yield from pd.read_csv(data, chunksize=chunksize)
+    elif isinstance(data, Iterator):
+        for chunk in data:
+            yield from get_chunks(to_df(chunk), chunksize)
+    else:
+        data = to_df(data)
+        step = chunksize or max(1, len(data))
+        for i in range(0, len(data), step):
+            yield data.iloc[i:i + step]
+
+
+def write_chunks(chunks, filename):
+    """Write chunks of rows to a csv or parquet file.
+
+    The file is written chunk by chunk, so the complete dataset is
+    never held in memory. Parquet files are written when the filename
+    ends with `.parquet`, else the chunks are written to a csv file.
+
+    Parameters
+    ----------
+    chunks: iterable
+        Chunks (as pd.DataFrame) to write.
+
+    filename: str
+        Name of the file.
+
+    """
+    if filename.lower().endswith(".parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError(
+                "Unable to import the pyarrow package. "
+                "Make sure it is installed to write parquet files."
+            )
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk)
+                if writer is None:
+                    writer = pq.ParquetWriter(filename, table.schema)
+                else:  # Inferred types can differ per chunk
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        header = True  # Only the first chunk writes the header
+        for chunk in chunks:
+            chunk.to_csv(filename, mode="w" if header else "a", header=header)
+            header = False
+
+
+def stream_chunks(func, data, chunksize=None, filename=None, n_jobs=1):
+    """Apply a function on a dataset chunk by chunk.
+
+    Only `n_jobs` chunks are in memory at the same time. They are
+    processed in parallel threads, and the results keep the order
+    of the chunks.
+
+    Parameters
+    ----------
+    func: callable
+        Function to apply on every chunk. Should return a dataframe
+        if the results are written to a file.
+
+    data: str, dataframe-like or iterator
+        Data to read. See the get_chunks function.
+
+    chunksize: int or None, optional (default=None)
+        Maximum number of rows per chunk.
+
+    filename: str or None, optional (default=None)
+        Name of the csv or parquet file to write the results to. If
+        None, the results are yielded per chunk.
+
+    n_jobs: int, optional (default=1)
+        Number of chunks to process in parallel.
+
+    Returns
+    -------
+    results: generator or None
+        Result per chunk. None if the results are written to a file.
+
+    """
+
+    def apply():
+        """Yield the results per chunk."""
+        chunks = get_chunks(data, chunksize)
+        while True:
+            batch = list(islice(chunks, n_jobs))
+            if not batch:
+                break
+
+            yield from Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(func)(chunk) for chunk in batch
+            )
+
+    if filename is None:
+        return apply()
+
+    write_chunks(apply(), filename)
+
+
 def custom_transform(transformer, branch, data=None, verbose=None):
     """Applies a transformer on a branch.
 
@@ -1037,9 +1314,9 @@ def custom_transform(transformer, branch, data=None, verbose=None):
         X_og, y_og = to_df(data[0]), to_series(data[1])
     else:
         if transformer._train_only:
-            X_og, y_og = branch.X_train, branch.y_train
+            X_og, y_og = branch._X_train, branch._y_train
         else:
-            X_og, y_og = branch.X, branch.y
+            X_og, y_og = branch._X, branch.y
 
     # Adapt the estimator's verbosity
     if verbose is not None:
@@ -1066,12 +1343,17 @@ def custom_transform(transformer, branch, data=None, verbose=None):
                 f"Applying {transformer.__class__.__name__} to the dataset...", 1
             )
 
+            # The data sets are views of the branch's data. ATOM's
+            # transformers copy their input, but external ones could
+            # change it in place
+            X_og = X_og.copy()
+
         X, y = transform_one(transformer, X_og, y_og)
 
     # Apply changes to the branch
     if not data:
         if transformer._train_only:
-            branch.train = merge(X, branch.y_train if y is None else y)
+            branch.train = merge(X, branch._y_train if y is None else y)
         else:
             branch.data = merge(X, branch.y if y is None else y)
 
@@ -1468,6 +1750,540 @@ class PlotCallback:
         plt.pause(0.05)
 
 
+class MedianPruner:
+    """Prune a BO call if it's worse than the median of previous calls.
+
+    The call is pruned when its intermediate score (mean score over
+    the folds evaluated so far) is lower than the median of the
+    intermediate scores of the previous calls at the same fold.
+
+    Parameters
+    ----------
+    n_startup_trials: int, optional (default=5)
+        Number of calls that must reach a fold before pruning at that
+        fold is possible.
+
+    n_warmup_steps: int, optional (default=1)
+        Number of folds that every call evaluates before it can be
+        pruned.
+
+    """
+
+    def __init__(self, n_startup_trials=5, n_warmup_steps=1):
+        self.n_startup_trials = n_startup_trials
+        self.n_warmup_steps = n_warmup_steps
+
+    def __call__(self, step, score, history):
+        if step < self.n_warmup_steps or len(history) < self.n_startup_trials:
+            return False
+
+        return score < np.median(history)
+
+
+class SuccessiveHalvingPruner:
+    """Prune a BO call using asynchronous successive halving (ASHA).
+
+    Calls are only compared at rungs, i.e. after `min_resource *
+    reduction_factor**k` folds. At a rung, the call continues only
+    if its intermediate score is in the top 1/`reduction_factor` of
+    all the calls that reached that rung. Since the BO evaluates the
+    calls one after another, the synchronous and asynchronous
+    variants of the algorithm make the same decisions.
+
+    Parameters
+    ----------
+    min_resource: int, optional (default=1)
+        Number of folds evaluated before the first rung.
+
+    reduction_factor: int, optional (default=3)
+        Fraction of calls promoted to the next rung.
+
+    """
+
+    def __init__(self, min_resource=1, reduction_factor=3):
+        self.min_resource = min_resource
+        self.reduction_factor = reduction_factor
+
+    def __call__(self, step, score, history):
+        # Check whether this step is a rung
+        resource = step + 1
+        rung = self.min_resource
+        while rung < resource:
+            rung *= self.reduction_factor
+        if rung != resource or len(history) + 1 < self.reduction_factor:
+            return False
+
+        scores = sorted(history + [score], reverse=True)
+        return score < scores[len(scores) // self.reduction_factor - 1]
+
+
+class TrialRecord:
+    """Record of the calls of a BO.
+
+    The calls are stored column-wise, so adding a call doesn't copy
+    the previous ones. Keeps an index of the evaluated hyperparameters
+    to detect duplicate calls, and the best and worst score so far
+    per metric. Pruned calls and calls with a partial budget (from
+    Hyperband) don't count towards these scores, since their score
+    is incomplete.
+    The `bo` dataframe is only created when requested. The points in
+    the hyperparameter space are kept apart to warm-start other BOs.
+
+    Parameters
+    ----------
+    columns: sequence or None, optional (default=None)
+        Name of the columns of the record. If None, use the columns
+        of the BO.
+
+    """
+
+    columns = ["call", "params", "estimator", "score", "pruned", "time", "total_time"]
+
+    def __init__(self, columns=None):
+        if columns is not None:
+            self.columns = list(columns)
+
+        self._data = {col: [] for col in self.columns}
+        self._x = []  # Point in the hyperparameter space per call
+        self._index = {}  # Canonical params -> position of first call
+        self._best = None  # Best score of the completed calls
+        self._worst = None  # Worst score of the completed calls
+        self._best_incomplete = None  # Best score of the incomplete calls
+        self._df = None
+
+    def __len__(self):
+        return len(self._data["call"])
+
+    def __contains__(self, params):
+        return self._key(params) in self._index
+
+    @staticmethod
+    def _key(params):
+        """Return a hashable representation of the hyperparameters."""
+        return json.dumps(
+            params,
+            sort_keys=True,
+            default=lambda x: x.tolist() if hasattr(x, "tolist") else repr(x),
+        )
+
+    @property
+    def best(self):
+        """Best score per metric over the completed calls.
+
+        Falls back to the incomplete calls if no call is completed yet.
+
+        """
+        return self._best_incomplete if self._best is None else self._best
+
+    @property
+    def worst(self):
+        """Worst score per metric over the completed calls (or None)."""
+        return self._worst
+
+    @property
+    def points(self):
+        """Point in the hyperparameter space and score per completed call."""
+        return [
+            (x, score)
+            for x, score, pruned, budget in zip(
+                self._x,
+                self._data["score"],
+                self._data["pruned"],
+                self._data.get("budget") or [1] * len(self),
+            )
+            if x is not None and not self._is_incomplete(pruned, budget)
+        ]
+
+    @staticmethod
+    def _is_incomplete(pruned, budget):
+        """Return whether a call was pruned or had a partial budget."""
+        if pd.notna(budget) and budget < 1:
+            return True
+
+        return bool(pd.notna(pruned) and pruned)
+
+    def append(self, **row):
+        """Add a call to the record.
+
+        Parameters
+        ----------
+        **row
+            Value per column of the call.
+
+        """
+        key = self._key(row["params"])
+        if key not in self._index:
+            self._index[key] = len(self)
+
+        for col in self.columns:
+            self._data[col].append(row.get(col))
+        self._x.append(row.get("x"))
+
+        score = np.array(lst(row["score"]), dtype=float)
+        if self._is_incomplete(row.get("pruned"), row.get("budget")):
+            if self._best_incomplete is None:
+                self._best_incomplete = score
+            else:
+                self._best_incomplete = np.maximum(self._best_incomplete, score)
+        elif self._best is None:
+            self._best, self._worst = score, score
+        else:
+            self._best = np.maximum(self._best, score)
+            self._worst = np.minimum(self._worst, score)
+
+        self._df = None  # Invalidate the dataframe
+
+    def get(self, params):
+        """Get the first call with the provided hyperparameters.
+
+        Parameters
+        ----------
+        params: dict
+            Hyperparameters of the call.
+
+        Returns
+        -------
+        call: dict
+            Value per column of the call.
+
+        """
+        idx = self._index[self._key(params)]
+        return {col: self._data[col][idx] for col in self.columns}
+
+    @classmethod
+    def from_df(cls, df):
+        """Create a record from a dataframe.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Calls of a BO, with one call per row. Should at least
+            have the `params` and `score` columns.
+
+        Returns
+        -------
+        record: TrialRecord
+            Record with the calls in the dataframe.
+
+        """
+        record = cls(df.columns)
+        for row in df.to_dict("records"):
+            record.append(**row)
+
+        return record
+
+    def to_df(self):
+        """Return the record as a dataframe.
+
+        The dataframe is cached until the next call is added, and is
+        returned without copying it. Callers must not modify it.
+
+        """
+        if self._df is None:
+            self._df = pd.DataFrame(self._data, columns=self.columns)
+
+        return self._df
+
+
+class TrialStorage:
+    """Persist the calls of the BO to a SQLite database.
+
+    Every call is stored as soon as it's evaluated, so no results
+    are lost when a run is interrupted. The calls are identified by
+    the model's name, the branch and a fingerprint of the data the
+    BO was run on, and can be reloaded to resume or warm-start the
+    optimizer. Connections are only opened while reading or writing,
+    so the instance can be sent to other processes.
+
+    Parameters
+    ----------
+    path: str
+        Location of the database file. The file and its table are
+        created if they don't exist yet.
+
+    """
+
+    columns = [
+        "model", "branch", "fingerprint", "call", "x", "params",
+        "score", "pruned", "time", "total_time",
+    ]
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS trials ({', '.join(self.columns)})"
+            )
+
+    def __repr__(self):
+        return f"TrialStorage(path={self.path})"
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _dumps(item):
+        """Serialize an object to json, converting numpy types."""
+        return json.dumps(
+            item, default=lambda x: x.tolist() if hasattr(x, "tolist") else str(x)
+        )
+
+    @staticmethod
+    def fingerprint(*args):
+        """Return a hash of the data and settings of a BO.
+
+        Parameters
+        ----------
+        *args
+            Dataframes, series or (json serializable) settings
+            that determine the outcome of a call.
+
+        Returns
+        -------
+        fingerprint: str
+            Hexadecimal digest of the arguments.
+
+        """
+        hasher = hashlib.sha256()
+        for arg in args:
+            if isinstance(arg, (pd.DataFrame, pd.Series)):
+                hasher.update(pd.util.hash_pandas_object(arg).values.tobytes())
+            else:
+                hasher.update(TrialStorage._dumps(arg).encode())
+
+        return hasher.hexdigest()
+
+    def save(self, model, branch, fingerprint, call, x, params, score, pruned, time,
+             total_time):
+        """Store a call of the BO."""
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO trials VALUES ({', '.join('?' * len(self.columns))})",
+                (
+                    model,
+                    branch,
+                    fingerprint,
+                    call,
+                    self._dumps(x),
+                    self._dumps(params),
+                    self._dumps(lst(score)),
+                    int(pruned),
+                    time,
+                    total_time,
+                ),
+            )
+
+    def load(self, model, branch, fingerprint):
+        """Load the stored calls of a BO.
+
+        Parameters
+        ----------
+        model: str
+            Name of the model.
+
+        branch: str
+            Name of the branch.
+
+        fingerprint: str
+            Fingerprint of the data and settings of the BO.
+
+        Returns
+        -------
+        trials: list of dict
+            Stored calls in the order they were evaluated.
+
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM trials WHERE model=? AND branch=? AND fingerprint=? "
+                "ORDER BY rowid",
+                (model, branch, fingerprint),
+            ).fetchall()
+
+        trials = []
+        for row in rows:
+            trial = dict(zip(self.columns, row))
+            for key in ("x", "params", "score"):
+                trial[key] = json.loads(trial[key])
+            trial["pruned"] = bool(trial["pruned"])
+            trials.append(trial)
+
+        return trials
+
+
+class CompiledPredictor:
+    """Low-latency predictor for single rows of new data.
+
+    The transformers and the estimator are frozen on creation, and
+    the columns every transformer uses and returns are resolved
+    beforehand on a sample of the data. Calling the predictor skips
+    the input validation, logging and introspection of the model's
+    prediction methods. Without transformers (and only numerical
+    features), the data never leaves numpy.
+
+    Parameters
+    ----------
+    transformers: sequence
+        Fitted transformers to apply on the data, in order.
+
+    scaler: Scaler or None
+        Fitted scaler applied before the estimator.
+
+    estimator: estimator
+        Fitted estimator that makes the predictions.
+
+    X: pd.DataFrame
+        Sample of the data in its original format, used to resolve
+        the column names and types.
+
+    method: str, optional (default="predict")
+        Prediction method to be applied to the estimator.
+
+    """
+
+    def __init__(self, transformers, scaler, estimator, X, method="predict"):
+        self.columns = list(X.columns)
+        self.dtypes = X.dtypes
+        self.method = method
+        self.estimator = self._freeze(estimator)
+        self._predict = getattr(self.estimator, method)
+
+        self._steps = []
+        for transformer in transformers:
+            X = self._add_step(transformer, X)
+
+        self._scale = None
+        if scaler is not None:
+            if all(pd.api.types.is_numeric_dtype(dtype) for dtype in X.dtypes):
+                # The scaler's estimator is applied directly on the array
+                self._scale = self._freeze(scaler._estimator).transform
+            else:
+                self._add_step(scaler, X)
+
+        self._numpy = not self._steps and all(
+            pd.api.types.is_numeric_dtype(dtype) for dtype in self.dtypes
+        )
+
+    def __call__(self, X):
+        """Make predictions on new data.
+
+        Parameters
+        ----------
+        X: dict, sequence, np.array or pd.DataFrame
+            Single row, record (array) or feature set with the columns
+            in their original order.
+
+        Returns
+        -------
+        pred: np.array
+            Predictions of the estimator.
+
+        """
+        if self._numpy:
+            X = self._to_array(X)
+        else:
+            X = self._to_frame(X)
+            for transform, cols, passthrough, out_cols, columns in self._steps:
+                out = transform(X[cols])
+                if isinstance(out, tuple):
+                    out = out[0]
+
+                if not isinstance(out, pd.DataFrame):
+                    if sparse.issparse(out):
+                        out = out.toarray()
+                    out = pd.DataFrame(out, index=X.index, columns=out_cols)
+
+                if passthrough:
+                    out = pd.concat([out, X[passthrough]], axis=1)
+
+                X = out if columns is None else out[columns]
+
+            X = np.asarray(arr(X))
+
+        if self._scale:
+            X = self._scale(X)
+
+        return self._predict(X)
+
+    @staticmethod
+    def _freeze(estimator):
+        """Copy a fitted estimator to make predictions on arrays."""
+        estimator = deepcopy(estimator)
+        try:  # Avoid the check on feature names for every call
+            del estimator.feature_names_in_
+        except AttributeError:
+            pass
+
+        return estimator
+
+    def _add_step(self, transformer, X):
+        """Freeze a transformer and resolve its columns on the sample."""
+        est = deepcopy(transformer)  # Not clone to keep fitted
+        if "X" not in signature(est.transform).parameters:
+            return X  # Skip transformers that only transform y
+
+        if hasattr(est, "verbose"):
+            est.verbose = 0
+
+        transform = est.transform
+        if est.__module__.startswith("atom"):
+            # Bypass the decorators that validate and log the call
+            est.logger = None
+            transform = unwrap(type(est).transform).__get__(est)
+
+        inc, exc = getattr(est, "_cols", (None, None))
+        cols = inc or [c for c in X.columns if c not in (exc or [])]
+        passthrough = [c for c in X.columns if c not in cols]
+
+        out = transform(X[cols])
+        if isinstance(out, tuple):
+            out = out[0]
+
+        out_cols = None
+        if not isinstance(out, pd.DataFrame):
+            if sparse.issparse(out):
+                out = out.toarray()
+            out_cols = name_cols(out, X, cols)
+            out = pd.DataFrame(out, index=X.index, columns=out_cols)
+
+        new_X = reorder_cols(out, X, cols)
+        columns = list(new_X.columns)
+        if list(out.columns) + passthrough == columns:
+            columns = None  # No need to reorder the columns
+
+        self._steps.append((transform, cols, passthrough, out_cols, columns))
+
+        return new_X
+
+    def _to_array(self, X):
+        """Convert the input to a 2-dimensional numerical array."""
+        if isinstance(X, pd.DataFrame):
+            return X.to_numpy()
+        elif isinstance(X, dict):
+            X = [X[col] for col in self.columns]
+
+        X = np.asarray(X)
+        if X.dtype.names:  # Record (array)
+            X = structured_to_unstructured(np.atleast_1d(X)[self.columns])
+
+        return X.reshape(1, -1) if X.ndim < 2 else X
+
+    def _to_frame(self, X):
+        """Convert the input to a dataframe with the original types."""
+        if not isinstance(X, pd.DataFrame):
+            if getattr(getattr(X, "dtype", None), "names", None):
+                X = pd.DataFrame(np.atleast_1d(X))[self.columns]
+            elif isinstance(X, dict) or np.ndim(X) < 2:
+                X = pd.DataFrame([X], columns=self.columns)
+            else:
+                X = pd.DataFrame(X, columns=self.columns)
+
+        if not X.dtypes.equals(self.dtypes):
+            X = X.astype(self.dtypes)
+
+        return X
+
+
 class ShapExplanation:
     """SHAP Explanation wrapper to avoid recalculating shap values.
 
@@ -1495,11 +2311,11 @@ class ShapExplanation:
         """Get shap's explainer."""
         if self._explainer is None:
             try:  # Fails when model does not fit standard explainers (e.g. ensembles)
-                self._explainer = Explainer(self.T.estimator, self.T.X_train)
+                self._explainer = Explainer(self.T.estimator, arr(self.T.X_train))
             except Exception:
                 # Prediction attr to use (predict_proba > decision_function > predict)
                 attr = getattr(self.T.estimator, get_proba_attr(self.T))
-                self._explainer = Explainer(attr, self.T.X_train)
+                self._explainer = Explainer(attr, arr(self.T.X_train))
 
         return self._explainer
 
@@ -1533,7 +2349,7 @@ class ShapExplanation:
                 kwargs["check_additivity"] = False
 
             # Calculate the new shap values
-            self._explanation = self.explainer(calculate, **kwargs)
+            self._explanation = self.explainer(arr(calculate), **kwargs)
 
             # Remember shap values in the _shap_values attribute
             for i, idx in enumerate(calculate.index):
@@ -1543,7 +2359,7 @@ class ShapExplanation:
         self._explanation.values = np.stack(self._shap_values.loc[df.index].values)
         if isinstance(self._explanation.base_values, SEQUENCE):
             self._explanation.base_values = self._explanation.base_values[0]
-        self._explanation.data = self.T.X.loc[df.index, :].to_numpy()
+        self._explanation.data = arr(self.T.X.loc[df.index, :]).to_numpy()
 
         # Select the target values from the array
         if self._explanation.values.ndim > 2:
@@ -1567,7 +2383,7 @@ class ShapExplanation:
 
     def get_interaction_values(self, df):
         """Get shap interaction values from the Explanation object."""
-        return self.explainer.shap_interaction_values(df)
+        return self.explainer.shap_interaction_values(arr(df))
 
     def get_expected_value(self, target=1, return_int=True):
         """Get the expected value of the training set."""
@@ -1653,7 +2469,8 @@ class CustomDict(MutableMapping):
                 raise e
 
     def __setitem__(self, key, value):
-        self.__keys.append(key)
+        if key not in self:
+            self.__keys.append(key)
         self.__data[self._conv(key)] = value
 
     def __delitem__(self, key):
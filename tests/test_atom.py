@@ -32,7 +32,7 @@ from sklearn.preprocessing import (
 # Own modules
 from atom import ATOMClassifier, ATOMRegressor
 from atom.data_cleaning import Scaler, Pruner
-from atom.utils import check_scaling
+from atom.utils import check_scaling, merge
 from .utils import (
     FILE_DIR, X_bin, y_bin, X_class, y_class, X_reg, y_reg, X_text,
     y_text, X10, X10_nan, X10_str, X10_str2, X10_dt, y10, y10_str,
@@ -473,6 +473,21 @@ def test_transform_skip_y():
     assert isinstance(atom.transform(X10_str), pd.DataFrame)
 
 
+def test_transform_in_chunks():
+    """Assert that the data can be streamed through the branch."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.scale()
+    atom.transform(
+        X=merge(X_bin, y_bin),
+        y="target",
+        chunksize=200,
+        filename=FILE_DIR + "transformed.parquet",
+    )
+    df = pd.read_parquet(FILE_DIR + "transformed.parquet")
+    assert df.shape == (len(X_bin), X_bin.shape[1] + 1)
+    assert check_scaling(df.iloc[:, :-1])
+
+
 # Test base transformers =========================================== >>
 
 def test_custom_params_to_method():
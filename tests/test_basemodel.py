@@ -12,17 +12,21 @@ import glob
 import pytest
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from unittest.mock import patch
+from skopt import Optimizer
 from skopt.learning import GaussianProcessRegressor
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.metrics import accuracy_score, r2_score, recall_score
 
 # Own modules
 from atom import ATOMClassifier, ATOMRegressor
+from atom.data_cleaning import Scaler
+from atom.training import DirectClassifier
 from atom.utils import check_scaling
 from .utils import (
     FILE_DIR, X_bin, y_bin, X_class, y_class, X_reg, y_reg,
-    X_idx, y_idx, X10_str, y10,
+    X_idx, y_idx, X10_str, y10, bin_train, bin_test,
 )
 
 
@@ -35,6 +39,17 @@ def test_scaler():
     assert atom.lgb.scaler and not atom.lda.scaler
 
 
+def test_sparse_data():
+    """Assert that sparse data is only passed to models that accept it."""
+    X = X_bin.astype(pd.SparseDtype(float, 0))
+    atom = ATOMClassifier(X, y_bin, random_state=1)
+    atom.run(["LR", "LDA"])
+    assert not atom.lr.scaler  # Sparse data isn't scaled
+    assert sparse.issparse(atom.lr._arr(atom.lr.X_train))
+    assert isinstance(atom.lda._arr(atom.lda.X_train), pd.DataFrame)
+    assert len(atom.lr.predict(X.iloc[:10])) == 10
+
+
 def test_repr():
     """Assert that the __repr__ method works as intended."""
     atom = ATOMClassifier(X_bin, y_bin, random_state=1)
@@ -94,6 +109,25 @@ def test_no_hyperparameters_left():
     assert atom.bnb.bo.empty
 
 
+def test_bo_is_a_copy():
+    """Assert that changing the bo attribute doesn't change the record."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("Tree", n_calls=5, n_initial_points=2)
+    atom.tree.bo.sort_values("score", inplace=True)
+    atom.tree.bo["score"] = 0
+    assert atom.tree.bo["call"].iloc[0] == "Initial point 1"
+    assert (atom.tree.bo["score"] != 0).any()
+
+
+def test_bo_setter():
+    """Assert that the bo attribute can be assigned."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("Tree", n_calls=5, n_initial_points=2)
+    atom.tree.bo = atom.tree.bo.iloc[:3]
+    assert len(atom.tree.bo) == 3
+    assert atom.tree.bo["params"].iloc[0] in atom.tree._trials
+
+
 def test_est_params_unknown_param():
     """Assert that unknown parameters in est_params are caught."""
     atom = ATOMClassifier(X_bin, y_bin, random_state=1)
@@ -148,6 +182,154 @@ def test_est_params_for_fit(model):
     assert getattr(atom, model)._stopped != ("---", "---")
 
 
+@pytest.mark.parametrize("cv", [1, 3])
+def test_batch_bo(cv):
+    """Assert that the BO can evaluate batches of points."""
+    atom = ATOMClassifier(X_bin, y_bin, n_jobs=2, random_state=1)
+    atom.run("Tree", n_calls=7, bo_params={"batch_size": 3, "cv": cv})
+    assert len(atom.tree.bo) == 7
+    assert atom.tree.best_params
+
+
+def test_batch_bo_is_asynchronous():
+    """Assert that every point is told to the optimizer when it finishes."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    with patch.object(Optimizer, "tell", autospec=True, side_effect=Optimizer.tell):
+        atom.run("Tree", n_calls=6, bo_params={"batch_size": 3, "cv": 1})
+        tell = Optimizer.tell
+
+    # Lies for the running points are told in a list to a copy of the optimizer
+    assert sum(not isinstance(c.args[2], list) for c in tell.call_args_list) == 6
+    assert len(atom.tree.bo) == 6
+
+
+@pytest.mark.parametrize("est", ["GP", "ET", GaussianProcessRegressor()])
+def test_batch_bo_base_estimators(est):
+    """Assert that batches work for all base estimators."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run(
+        models="LR",
+        n_calls=6,
+        n_initial_points=2,
+        bo_params={"batch_size": 2, "base_estimator": est, "strategy": "cl_mean"},
+    )
+    assert len(atom.lr.bo) == 6
+
+
+def test_fixed_splits_fold_cache():
+    """Assert that the transformed folds are reused across calls and models."""
+    trainer = DirectClassifier(
+        models=["LR", "KNN"],  # Both need scaling, so every fold is transformed
+        n_calls=5,
+        bo_params={"cv": 3, "fixed_splits": True},
+        random_state=1,
+    )
+    with patch.object(Scaler, "fit", autospec=True, side_effect=Scaler.fit) as fit:
+        trainer.run(bin_train, bin_test)
+
+    # One fit per fold, plus the scaler of every model on the training set
+    assert fit.call_count == 3 + 2
+    assert len(trainer._fold_cache) == 3
+
+
+def test_fold_cache_is_bounded():
+    """Assert that the fold cache doesn't exceed cache_size."""
+    trainer = DirectClassifier(
+        models="LR",
+        n_calls=5,
+        bo_params={"cv": 3, "fixed_splits": True, "cache_size": 2},
+        random_state=1,
+    )
+    with patch.object(Scaler, "fit", autospec=True, side_effect=Scaler.fit) as fit:
+        trainer.run(bin_train, bin_test)
+
+    # The folds are used in a cycle, so they're evicted before they're reused
+    assert fit.call_count == 5 * 3 + 1
+    assert len(trainer._fold_cache) == 2
+
+
+@pytest.mark.parametrize("pruner", ["median", "sh", "asha"])
+def test_pruner(pruner):
+    """Assert that the pruned calls are flagged in the bo attribute."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("Tree", n_calls=10, bo_params={"cv": 3, "pruner": pruner})
+    assert "pruned" in atom.tree.bo
+    assert not atom.tree.bo["pruned"].iloc[0]  # First call has no history
+
+
+def test_custom_pruner():
+    """Assert that a custom pruner can be used."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run(
+        models="Tree",
+        n_calls=5,
+        bo_params={"cv": 3, "pruner": lambda step, score, history: bool(history)},
+    )
+    assert atom.tree.bo["pruned"].sum() == 4
+    assert atom.tree.metric_bo == atom.tree.bo["score"].iloc[0]
+
+
+def test_pruned_calls_get_worst_score():
+    """Assert that the optimizer is told the worst score for pruned calls."""
+    results = []
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run(
+        models="Tree",
+        n_calls=5,
+        bo_params={
+            "cv": 3,
+            "pruner": lambda step, score, history: bool(history) and step == 0,
+            "callback": lambda result: results.append(result),
+        },
+    )
+    assert atom.tree.bo["pruned"].sum() == 4
+    assert all(results[-1].func_vals == -atom.tree.bo["score"].iloc[0])
+
+
+def test_storage_resumes_bo(tmp_path):
+    """Assert that the stored calls are loaded instead of evaluated."""
+    bo_params = {"storage": str(tmp_path / "trials.db")}
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR", n_calls=5, bo_params=bo_params)
+
+    atom2 = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom2.run("LR", n_calls=8, bo_params=bo_params)
+    assert len(atom2.lr.bo) == 8
+    assert list(atom2.lr.bo["params"][:5]) == list(atom.lr.bo["params"])
+
+
+def test_storage_resumes_less_calls(tmp_path):
+    """Assert that no more calls than n_calls are loaded from storage."""
+    bo_params = {"storage": str(tmp_path / "trials.db")}
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR", n_calls=8, bo_params=bo_params)
+
+    atom2 = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom2.run("LR", n_calls=6, bo_params=bo_params)
+    assert len(atom2.lr.bo) == 6
+    assert list(atom2.lr.bo["params"]) == list(atom.lr.bo["params"][:6])
+
+
+def test_storage_all_calls_stored(tmp_path):
+    """Assert that the BO is skipped when all calls are stored."""
+    bo_params = {"storage": str(tmp_path / "trials.db")}
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("Tree", n_calls=5, bo_params=bo_params)
+    atom.run("Tree", n_calls=5, bo_params=bo_params)
+    assert len(atom.tree.bo) == 5
+
+
+def test_storage_different_data(tmp_path):
+    """Assert that calls on different data are not loaded."""
+    bo_params = {"storage": str(tmp_path / "trials.db")}
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR", n_calls=5, bo_params=bo_params)
+
+    atom2 = ATOMClassifier(X_bin, y_bin, test_size=0.3, random_state=1)
+    atom2.run("LR", n_calls=5, bo_params=bo_params)
+    assert len(atom2.lr.bo) == 5
+
+
 def test_skip_duplicate_calls():
     """Assert that calls with the same parameters skip the calculation."""
     atom = ATOMClassifier(X_bin, y_bin, random_state=1)
@@ -238,6 +420,39 @@ def test_bootstrap_attribute_types():
     assert isinstance(atom.lgb.mean_bootstrap, list)
 
 
+def test_bootstrap_parallel():
+    """Assert that the bootstrap results don't depend on n_jobs."""
+    atom_1 = ATOMClassifier(X_bin, y_bin, n_jobs=1, random_state=1)
+    atom_1.run(["Tree", "LGB"], n_bootstrap=4)
+    atom_2 = ATOMClassifier(X_bin, y_bin, n_jobs=2, random_state=1)
+    atom_2.run(["Tree", "LGB"], n_bootstrap=4)
+    assert atom_1.tree.metric_bootstrap.shape == (4,)
+    np.testing.assert_array_equal(
+        atom_1.tree.metric_bootstrap, atom_2.tree.metric_bootstrap
+    )
+    assert len(atom_2.lgb.metric_bootstrap) == 4
+
+
+def test_bootstrap_oob_score():
+    """Assert that the out-of-bag scores are calculated."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("Tree", n_bootstrap=3, oob_score=True)
+    assert atom.tree.metric_oob.shape == (3,)
+    assert isinstance(atom.tree.mean_oob, float)
+
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR", metric=("f1", "auc"), n_bootstrap=3, oob_score=True)
+    assert atom.lr.metric_oob.shape == (2, 3)
+    assert isinstance(atom.lr.std_oob, list)
+
+
+def test_bootstrap_no_oob_score():
+    """Assert that the out-of-bag scores are skipped by default."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("Tree", n_bootstrap=3)
+    assert atom.tree.metric_oob is None
+
+
 # Test utility properties ========================================== >>
 
 def test_results_property():
@@ -281,6 +496,25 @@ def test_predictions_from_index():
     assert isinstance(atom.tree.predict_log_proba(atom.holdout.index[0]), np.ndarray)
 
 
+def test_predictions_from_positions():
+    """Assert that the predictions are taken from the right rows."""
+    atom = ATOMClassifier(X_bin, y_bin, holdout_size=0.1, random_state=1)
+    atom.run("Tree")
+    n_train = len(atom.train)
+    test = range(n_train, n_train + len(atom.test))
+    np.testing.assert_array_equal(atom.tree.predict(test), atom.tree.predict_test)
+    assert atom.tree.predict(-1) == atom.tree.predict_holdout[-1]
+
+
+def test_predictions_from_index_subset_of_train():
+    """Assert that the positions are shifted for sh and ts models."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.train_sizing("Tree", train_sizes=[0.5])
+    np.testing.assert_array_equal(
+        atom.tree05.predict(list(atom.test.index)), atom.tree05.predict_test
+    )
+
+
 def test_transformations_first():
     """Assert that the transformations are applied before predicting."""
     atom = ATOMClassifier(X10_str, y10, verbose=2, random_state=1)
@@ -289,6 +523,35 @@ def test_transformations_first():
     assert isinstance(atom.tree.predict(X10_str), np.ndarray)
 
 
+def test_predictions_in_chunks():
+    """Assert that new data can be predicted chunk by chunk."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR")
+    pred = list(atom.lr.predict(X_bin, chunksize=100))
+    assert len(pred) == 6
+    np.testing.assert_array_equal(np.concatenate(pred), atom.lr.predict(X_bin))
+
+    # Iterators of chunks are always streamed
+    chunks = (X_bin.iloc[i:i + 200] for i in range(0, len(X_bin), 200))
+    pred = list(atom.lr.predict_proba(chunks))
+    assert len(pred) == 3 and pred[0].shape == (200, 2)
+
+
+def test_predictions_in_chunks_to_file():
+    """Assert that the streamed predictions can be written to a file."""
+    atom = ATOMClassifier(X_bin, y_bin, n_jobs=2, random_state=1)
+    atom.run("LR")
+    X_bin.to_csv(FILE_DIR + "X_bin.csv", index=False)
+    atom.lr.predict_proba(
+        X=FILE_DIR + "X_bin.csv",
+        chunksize=100,
+        filename=FILE_DIR + "pred.csv",
+    )
+    pred = pd.read_csv(FILE_DIR + "pred.csv", index_col=0)
+    assert list(pred.columns) == ["predict_proba_0", "predict_proba_1"]
+    np.testing.assert_array_almost_equal(pred, atom.lr.predict_proba(X_bin))
+
+
 def test_data_is_scaled():
     """Assert that the data is scaled for models that need it."""
     atom = ATOMClassifier(X_bin, y_bin, random_state=1)
@@ -296,6 +559,37 @@ def test_data_is_scaled():
     assert sum(atom.sgd.predict(X_bin)) > 0  # Always 0 if not scaled
 
 
+def test_scaled_data_is_cached():
+    """Assert that the scaled data sets are cached."""
+    atom = ATOMClassifier(X_bin, y_bin, holdout_size=0.1, random_state=1)
+    atom.run("LR")
+    assert atom.lr._X_train is atom.lr._X_train
+    assert atom.lr._X_holdout is atom.lr._X_holdout
+    assert atom.lr.scaled_nbytes > 0
+    atom.lr.clear()
+    assert atom.lr.scaled_nbytes == 0
+
+
+def test_scaled_data_not_cached():
+    """Assert that the scaled data sets are not cached if cache_scaled=False."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR")
+    atom.lr.clear()
+    atom.lr.cache_scaled = False
+    assert atom.lr._X_test is not atom.lr._X_test
+    assert atom.lr.scaled_nbytes == 0
+
+
+def test_scaled_data_cache_is_not_exposed():
+    """Assert that modifying the scaled data doesn't change the cache."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR")
+    X_train = atom.lr.X_train
+    X_train.iloc[0, 0] = 1e6
+    assert atom.lr.X_train.iloc[0, 0] != 1e6
+    assert atom.lr._X_train.iloc[0, 0] != 1e6
+
+
 def test_score_metric_is_None():
     """Assert that the score returns accuracy for classification tasks."""
     atom = ATOMClassifier(X_bin, y_bin, random_state=1)
@@ -487,6 +781,41 @@ def test_clear():
     assert atom.lr._shap._shap_values.empty
 
 
+def test_compile_predictor_invalid_method():
+    """Assert that an error is raised when the method is invalid."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR")
+    pytest.raises(ValueError, atom.lr.compile_predictor, method="invalid")
+    atom.run("Ridge")
+    pytest.raises(AttributeError, atom.ridge.compile_predictor, "predict_proba")
+
+
+def test_compile_predictor_numpy():
+    """Assert that the compiled predictor works on arrays and records."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.run("LR")
+    predictor = atom.lr.compile_predictor("predict_proba")
+    assert predictor._numpy
+    expected = atom.lr.predict_proba(X_bin.iloc[:5])
+    records = X_bin.iloc[:5].to_records(index=False)
+    np.testing.assert_array_almost_equal(predictor(records), expected)
+    np.testing.assert_array_almost_equal(predictor(records[0]), expected[:1])
+    np.testing.assert_array_almost_equal(predictor(X_bin.values[0]), expected[:1])
+
+
+def test_compile_predictor_pipeline():
+    """Assert that the compiled predictor applies the transformers."""
+    atom = ATOMClassifier(X10_str, y10, random_state=1)
+    atom.encode(max_onehot=None)
+    atom.run("Tree")
+    predictor = atom.tree.compile_predictor()
+    assert not predictor._numpy
+    assert predictor(X10_str[0]) == atom.tree.predict([X10_str[0]])
+    X = pd.DataFrame(X10_str, columns=atom.og.features)
+    assert predictor(X.iloc[0].to_dict()) == atom.tree.predict(X.iloc[[0]])
+    np.testing.assert_array_equal(predictor(X), atom.tree.predict(X))
+
+
 def test_cross_validate():
     """Assert that the cross_validate method works as intended."""
     atom = ATOMClassifier(X_bin, y_bin, random_state=1)
@@ -679,6 +1008,17 @@ def test_save_estimator():
     assert glob.glob(FILE_DIR + "MultinomialNB")
 
 
+def test_transform_in_chunks():
+    """Assert that new data can be transformed chunk by chunk."""
+    atom = ATOMClassifier(X10_str, y10, random_state=1)
+    atom.encode()
+    atom.run("LR")
+    pytest.raises(ValueError, atom.lr.transform, X10_str, y10, chunksize=2)
+    X = list(atom.lr.transform(X10_str, chunksize=4))
+    assert len(X) == 3
+    assert check_scaling(pd.concat(X))
+
+
 def test_transform():
     """Assert that new data can be transformed by the model's pipeline."""
     atom = ATOMClassifier(X10_str, y10, random_state=1)
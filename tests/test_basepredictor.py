@@ -305,6 +305,13 @@ def test_get_rows_by_position():
     assert atom._get_rows(index=100) == [atom.X.index[100]]
 
 
+def test_get_rows_is_range():
+    """Assert that a range of positions can be used to retrieve rows."""
+    atom = ATOMClassifier(X_idx, y_idx, index=True, random_state=1)
+    assert atom._get_rows(index=range(3)) == list(atom.X.index[:3])
+    assert atom._get_rows(index=-1) == [atom.X.index[-1]]
+
+
 def test_get_rows_none_selected():
     """Assert that an error is raised when no rows are selected."""
     atom = ATOMClassifier(X_idx, y_idx, index=True, random_state=1)
@@ -229,6 +229,58 @@ def test_plot():
     trainer.run(bin_train, bin_test)
 
 
+def test_plot_with_parallel():
+    """Assert that an error is raised when plotting in parallel."""
+    trainer = DirectClassifier(
+        models=["LR", "Tree"],
+        n_calls=5,
+        bo_params={"plot": True},
+        parallel=True,
+        random_state=1,
+    )
+    with pytest.raises(ValueError, match=r".*plot parameter.*"):
+        trainer.run(bin_train, bin_test)
+
+
+def test_invalid_batch_size():
+    """Assert than an error is raised when batch_size<=0."""
+    trainer = DirectClassifier("LR", bo_params={"batch_size": 0}, random_state=1)
+    with pytest.raises(ValueError, match=r".*batch_size parameter.*"):
+        trainer.run(bin_train, bin_test)
+
+
+def test_invalid_strategy():
+    """Assert than an error is raised when strategy is invalid."""
+    trainer = DirectClassifier("LR", bo_params={"strategy": "test"}, random_state=1)
+    with pytest.raises(ValueError, match=r".*strategy parameter.*"):
+        trainer.run(bin_train, bin_test)
+
+
+def test_invalid_cache_size():
+    """Assert than an error is raised when cache_size<=0."""
+    trainer = DirectClassifier("LR", bo_params={"cache_size": 0}, random_state=1)
+    with pytest.raises(ValueError, match=r".*cache_size parameter.*"):
+        trainer.run(bin_train, bin_test)
+
+
+def test_invalid_pruner():
+    """Assert than an error is raised when pruner is invalid."""
+    trainer = DirectClassifier("LR", bo_params={"pruner": "test"}, random_state=1)
+    with pytest.raises(ValueError, match=r".*pruner parameter.*"):
+        trainer.run(bin_train, bin_test)
+
+
+def test_pruner_with_batch_size():
+    """Assert than an error is raised when pruning with batch_size>1."""
+    trainer = DirectClassifier(
+        models="LR",
+        bo_params={"pruner": "median", "batch_size": 2},
+        random_state=1,
+    )
+    with pytest.raises(ValueError, match=r".*pruner parameter.*"):
+        trainer.run(bin_train, bin_test)
+
+
 def test_invalid_cv():
     """Assert than an error is raised when cv<=0."""
     trainer = DirectClassifier("LR", bo_params={"cv": 0}, random_state=1)
@@ -405,6 +457,37 @@ def test_custom_dimensions_for_bo():
     assert not trainer.ols.bo.empty
 
 
+def test_parallel_training():
+    """Assert that models can be trained in parallel."""
+    trainer = DirectClassifier(
+        models=["LR", "Tree"],
+        n_calls=4,
+        n_initial_points=2,
+        n_bootstrap=2,
+        parallel=True,
+        n_jobs=2,
+        random_state=1,
+    )
+    trainer.run(bin_train, bin_test)
+    assert trainer.lr.T is trainer and trainer.tree.branch is trainer.branch
+    assert trainer.lr.estimator.get_params()["n_jobs"] == 1
+    assert len(trainer.tree.bo) == 4
+
+
+def test_parallel_error_handling():
+    """Assert that models with errors are removed in parallel training."""
+    trainer = DirectClassifier(
+        models=["LR", "LDA"],
+        n_calls=4,
+        n_initial_points=[2, 5],
+        parallel=True,
+        random_state=1,
+    )
+    trainer.run(bin_train, bin_test)
+    assert trainer.errors.get("LDA")
+    assert "LDA" not in trainer.models
+
+
 def test_error_handling():
     """Assert that models with errors are removed from the pipeline."""
     trainer = DirectClassifier(
@@ -9,6 +9,7 @@ Description: Unit tests for branch.py
 
 # Standard packages
 import pytest
+import numpy as np
 import pandas as pd
 
 # Own modules
@@ -154,6 +155,34 @@ def test_test_property():
     assert atom.branch.test.shape == (int(0.3 * len(X_bin)), X_bin.shape[1] + 1)
 
 
+def test_data_sets_are_views():
+    """Assert that the private data sets are slices of the branch's data."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    assert atom.branch._get_split() == len(atom.branch.idx[0])
+    y_train, data = atom.branch._y_train, atom.branch.data
+    assert np.shares_memory(y_train.values, data.iloc[:, -1].values)
+    assert atom.branch.test.equals(atom.branch.data.loc[atom.branch.idx[1]])
+
+
+def test_data_sets_are_copies():
+    """Assert that changing the public data sets doesn't change the branch."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    dataset = atom.dataset.copy()
+    atom.y_train.iloc[0] = 2
+    atom.X_test.iloc[0, 0] = 1e6
+    train = atom.train
+    train[atom.features[0]] = 0
+    assert atom.dataset.equals(dataset)
+
+
+def test_data_sets_not_ordered():
+    """Assert that the data sets are selected by index when not ordered."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.branch.idx = [atom.branch.idx[1], atom.branch.idx[0]]
+    assert atom.branch._get_split() is None
+    assert atom.branch.train.index.equals(atom.branch.idx[0])
+
+
 def test_holdout_property():
     """Assert that the holdout property returns a transformed holdout set."""
     atom = ATOMClassifier(X_bin, y_bin, holdout_size=0.1, random_state=1)
@@ -14,6 +14,7 @@ import pandas as pd
 from imblearn.combine import SMOTETomek
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier
+from category_encoders.hashing import HashingEncoder
 from category_encoders.leave_one_out import LeaveOneOutEncoder
 
 # Own modules
@@ -244,6 +245,16 @@ def test_target_mapping():
     assert cleaner.mapping == {"0": 0, "1": 1, "2": 2}
 
 
+def test_cleaner_n_jobs():
+    """Assert that the columns are cleaned the same in parallel."""
+    X = pd.DataFrame(X10_str)
+    X["const"] = 1
+    X_1 = Cleaner(n_jobs=1).transform(X)
+    X_2 = Cleaner(n_jobs=2).transform(X)
+    assert "const" not in X_2
+    pd.testing.assert_frame_equal(X_1, X_2)
+
+
 # Test Imputer ===================================================== >>
 
 def test_strat_num_parameter():
@@ -395,6 +406,17 @@ def test_imputing_non_numeric_most_frequent():
     assert X.isna().sum().sum() == 0
 
 
+@pytest.mark.parametrize("strat_num", ["drop", "knn", "mean", 2])
+def test_imputer_n_jobs(strat_num):
+    """Assert that the columns are imputed the same in parallel."""
+    imputer_1 = Imputer(strat_num=strat_num, strat_cat="most_frequent", n_jobs=1)
+    imputer_2 = Imputer(strat_num=strat_num, strat_cat="most_frequent", n_jobs=2)
+    X_1, y_1 = imputer_1.fit_transform(X10_sn, y10)
+    X_2, y_2 = imputer_2.fit_transform(X10_sn, y10)
+    pd.testing.assert_frame_equal(X_1, X_2)
+    pd.testing.assert_series_equal(y_1, y_2)
+
+
 # Test Encoder ===================================================== >>
 
 def test_strategy_parameter_encoder():
@@ -501,6 +523,65 @@ def test_kwargs_parameters():
     assert encoder._encoders["Feature 3"].get_params()["sigma"] == 0.5
 
 
+def test_encoder_n_jobs():
+    """Assert that the columns are encoded the same in parallel."""
+    X = pd.DataFrame(X10_str)
+    X.insert(0, "bin", ["a", "b"] * 5)
+    X_1 = Encoder(max_onehot=4, n_jobs=1).fit_transform(X, y10)
+    X_2 = Encoder(max_onehot=4, n_jobs=2).fit_transform(X, y10)
+    assert list(X_2.columns[:2]) == ["bin", 0]
+    pd.testing.assert_frame_equal(X_1, X_2)
+
+
+def test_encoder_return_sparse():
+    """Assert that the one-hot encoded columns can be sparse."""
+    X = Encoder(max_onehot=4, return_sparse=True).fit_transform(X10_str, y10)
+    assert isinstance(X["Feature 3_c"].dtype, pd.SparseDtype)
+    assert not isinstance(X["Feature 1"].dtype, pd.SparseDtype)
+
+    X_dense = Encoder(max_onehot=4).fit_transform(X10_str, y10)
+    assert X.equals(X_dense.astype(X.dtypes))
+
+
+@pytest.mark.parametrize("max_onehot", [None, 4])
+@pytest.mark.parametrize("strategy", ENCODING_STRATS)
+def test_encoder_lookup_table(strategy, max_onehot):
+    """Assert that the lookup table gives the same as the encoder."""
+    X = pd.DataFrame({
+        "Feature 1": range(30),
+        "Feature 2": ["a", "b", "c", "c", np.NaN, "d"] * 5,
+    })
+    encoder = Encoder(strategy=strategy, max_onehot=max_onehot)
+    encoder.fit(X, [0, 1] * 15)
+    assert encoder._layouts["Feature 2"] is not None
+
+    X_new = pd.DataFrame({
+        "Feature 1": range(5),
+        "Feature 2": ["d", "x", np.NaN, "a", "y"],
+    })
+    expected = encoder._encoders["Feature 2"].transform(X_new[["Feature 2"]])
+    expected = expected[[c for c in expected if not c.endswith("_nan")]]
+    pd.testing.assert_frame_equal(encoder.transform(X_new).iloc[:, 1:], expected)
+
+
+def test_encoder_lookup_table_value_dependent_unknown():
+    """Assert that unknown classes use the encoder if their encoding varies."""
+    X = pd.DataFrame({
+        "Feature 1": range(30),
+        "Feature 2": [f"class_{i}" for i in range(15)] * 2,
+    })
+    encoder = Encoder(strategy=HashingEncoder(n_components=8, max_process=1))
+    encoder.fit(X, [0, 1] * 15)
+    assert not encoder._layouts["Feature 2"]["fixed_unknown"]
+
+    X_new = pd.DataFrame({
+        "Feature 1": range(5),
+        "Feature 2": ["zz", "class_1", "qq", "ww", "class_3"],
+    })
+    expected = encoder._encoders["Feature 2"].transform(X_new[["Feature 2"]])
+    pd.testing.assert_frame_equal(encoder.transform(X_new).iloc[:, 1:], expected)
+
+
 # Test Pruner ====================================================== >>
 
 def test_invalid_strategy_parameter():
@@ -8,8 +8,12 @@ Description: Unit tests for nlp.py
 """
 
 # Standard packages
+import pickle
 import pytest
 import pandas as pd
+from copy import deepcopy
+from joblib import Parallel, delayed
+from sklearn.base import clone
 
 # Own modules
 from atom.nlp import TextCleaner, Tokenizer, Normalizer, Vectorizer
@@ -85,6 +89,22 @@ def test_drop_empty_tokens():
     assert TextCleaner().transform([[[",;", "hi"]]])["Corpus"][0] == ["hi"]
 
 
+def test_drops_leftmost_match():
+    """Assert that the text is scanned once from left to right."""
+    cleaner = TextCleaner()
+    assert cleaner.transform([["<a href=http://x.org>"]])["Corpus"][0] == ""
+    assert cleaner.drops["html"][0] == ["<a href=http://x.org>"]
+    assert cleaner.drops["url"].dropna().empty
+
+
+def test_cleaner_n_jobs():
+    """Assert that the documents are cleaned in parallel."""
+    X = X_text + [["<p>test@webmail.com</p> 😊"]]
+    cleaner_1, cleaner_2 = TextCleaner(n_jobs=1), TextCleaner(n_jobs=2)
+    assert cleaner_1.transform(X).equals(cleaner_2.transform(X))
+    assert cleaner_1.drops.equals(cleaner_2.drops)
+
+
 # Test Tokenizer =================================================== >>
 
 def test_tokenization():
@@ -117,6 +137,22 @@ def test_quadgrams():
     assert isinstance(tokenizer.quadgrams, pd.DataFrame)
 
 
+def test_ngrams_leftmost_match():
+    """Assert that overlapping n-grams are replaced from left to right."""
+    X = pd.DataFrame({"Corpus": [["a", "b", "c"], ["b", "c", "a", "b"], []]})
+    X = Tokenizer(bigram_freq=2).transform(X)
+    assert X["Corpus"].tolist() == [["a_b", "c"], ["b_c", "a_b"], []]
+
+
+def test_tokenizer_n_jobs():
+    """Assert that the n-grams are replaced in parallel."""
+    X = pd.DataFrame({"Corpus": [["a", "b", "c"], ["a", "b"], ["c", "a", "b"]]})
+    X_1 = Tokenizer(bigram_freq=2, n_jobs=1).transform(X)
+    X_2 = Tokenizer(bigram_freq=2, n_jobs=2).transform(X)
+    assert X_1.equals(X_2)
+    assert X_2["Corpus"].tolist() == [["a_b", "c"], ["a_b"], ["c", "a_b"]]
+
+
 # Test Normalizer ================================================== >>
 
 def test_normalizer_space_separation():
@@ -146,6 +182,75 @@ def test_lemmatization():
     assert Normalizer().transform([["better"]])["Corpus"][0] == ["well"]
 
 
+def test_invalid_cache_size():
+    """Assert that an error is raised when cache_size is invalid."""
+    pytest.raises(ValueError, Normalizer(cache_size=-1).transform, X_text)
+
+
+def test_cache_is_reused():
+    """Assert that the stems are cached over calls to transform."""
+    normalizer = Normalizer(stopwords=False, stem=True, lemmatize=False)
+    normalizer.transform([["running runs running"]])
+    assert normalizer.cache_info.loc["stem", "hits"] == 1
+    assert normalizer.cache_info.loc["stem", "misses"] == 2
+    X = normalizer.transform([["running runs"]])
+    assert X["Corpus"][0] == ["run", "run"]
+    assert normalizer.cache_info.loc["stem", "hits"] == 3
+    assert normalizer.cache_info.loc["stem", "hit_rate"] == 0.6
+
+
+def test_cache_size():
+    """Assert that the oldest entries are dropped when the cache is full."""
+    normalizer = Normalizer(stopwords=False, stem=True, lemmatize=False, cache_size=2)
+    normalizer.transform([["a b c"]])
+    assert list(normalizer._stems) == [("b",), ("c",)]
+
+
+def test_cache_is_thread_safe():
+    """Assert that the caches can be used by multiple threads at once."""
+    normalizer = Normalizer(stopwords=False, stem=True, lemmatize=False, cache_size=10)
+    corpus = [[[" ".join(f"word{i % 300}s" for i in range(2000))]]] * 32
+    expected = normalizer.transform(corpus[0])["Corpus"][0]
+
+    for _ in range(5):  # Repeat to make a race condition more likely
+        results = Parallel(n_jobs=8, prefer="threads")(
+            delayed(normalizer.transform)(X) for X in corpus
+        )
+        assert all(X["Corpus"][0] == expected for X in results)
+    assert normalizer.cache_info.loc["stem", "size"] == 10
+
+
+def test_lock_per_instance():
+    """Assert that every instance has its own lock and can be copied."""
+    normalizer = Normalizer(stopwords=False, stem=True, lemmatize=False)
+    normalizer.transform([["running"]])
+    assert normalizer._lock is not Normalizer()._lock
+    for copied in (deepcopy(normalizer), pickle.loads(pickle.dumps(normalizer))):
+        assert copied._lock is not normalizer._lock
+        assert copied.cache_info.loc["stem", "size"] == 1
+        assert copied.transform([["walking"]])["Corpus"][0] == ["walk"]
+    assert clone(normalizer).get_params() == normalizer.get_params()
+
+
+def test_cache_is_cleared_for_new_language():
+    """Assert that the cached stems are dropped when the language changes."""
+    normalizer = Normalizer(stopwords=False, stem="english", lemmatize=False)
+    normalizer.transform([["running"]])
+    normalizer.set_params(stem="dutch")
+    assert normalizer.transform([["lopen"]])["Corpus"][0] == ["lop"]
+    assert normalizer.cache_info.loc["stem", "size"] == 1
+
+
+def test_normalizer_n_jobs():
+    """Assert that the documents are normalized in parallel."""
+    X = [["a running b"], ["c walking"], ["b"]]
+    kwargs = dict(stopwords=False, custom_stopwords=["b"], stem=True, lemmatize=False)
+    X_1 = Normalizer(n_jobs=1, **kwargs).transform(X)
+    X_2 = Normalizer(n_jobs=2, **kwargs).transform(X)
+    assert X_1.equals(X_2)
+    assert X_2["Corpus"].tolist() == [["a", "run"], ["c", "walk"], []]
+
+
 # Test Vectorizer ================================================== >>
 
 def test_vectorizer_space_separation():
@@ -153,6 +258,12 @@ def test_vectorizer_space_separation():
     assert "hi" in Vectorizer().fit_transform({"corpus": [["hi", "there"], ["hi"]]})
 
 
+def test_vectorizer_tokens_as_words():
+    """Assert that the tokens are used as words when tokenized."""
+    X = Vectorizer().fit_transform({"corpus": [["a", "B"], ["a"]]})
+    assert list(X.columns) == ["a", "b"]
+
+
 def test_invalid_strategy():
     """Assert that an error is raised when the strategy is invalid."""
     vectorizer = Vectorizer(strategy="invalid")
@@ -172,3 +283,33 @@ def test_hashing():
     X = Vectorizer(strategy="Hashing", n_features=10).fit_transform(X_text)
     assert X.shape == (4, 10)
     assert "hash_1" in X
+
+
+def test_vectorizer_return_sparse():
+    """Assert that the output is sparse when return_sparse=True."""
+    X = Vectorizer(strategy="bow", return_sparse=True).fit_transform(X_text)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes)
+    assert X.equals(Vectorizer(strategy="bow").fit_transform(X_text).astype(X.dtypes))
+
+
+@pytest.mark.parametrize("strategy", ["bow", "tfidf"])
+def test_partial_fit(strategy):
+    """Assert that fitting on chunks equals fitting on the whole corpus."""
+    vectorizer = Vectorizer(strategy=strategy)
+    vectorizer.partial_fit(X_text[:2]).partial_fit(X_text[2:])
+    X = Vectorizer(strategy=strategy).fit_transform(X_text)
+    assert vectorizer.transform(X_text).equals(X)
+
+
+def test_partial_fit_pruning():
+    """Assert that the vocabulary is pruned on the accumulated counts."""
+    vectorizer = Vectorizer(min_df=2)
+    vectorizer.partial_fit(X_text[:1]).partial_fit(X_text[1:])
+    assert list(vectorizer.bow.vocabulary_) == ["new", "york"]
+
+
+def test_partial_fit_hashing():
+    """Assert that the Hashing strategy works with partial_fit."""
+    vectorizer = Vectorizer(strategy="hashing", n_features=10)
+    X = vectorizer.partial_fit(X_text[:2]).transform(X_text)
+    assert X.shape == (4, 10)
@@ -259,6 +259,19 @@ def test_plot_successive_halving(metric):
     atom.plot_successive_halving(display=False)
     atom.successive_halving(["Tree", "Bag", "RF", "LGB"], metric=metric)
     atom.plot_successive_halving(display=False)
+    atom.successive_halving(["RF", "LGB"], metric=metric, resource="iterations")
+    atom.plot_successive_halving(display=False)
+
+
+@pytest.mark.parametrize("metric", ["f1", ["f1", "recall"]])
+def test_plot_hyperband(metric):
+    """Assert that the plot_hyperband method work as intended."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    pytest.raises(NotFittedError, atom.plot_hyperband)
+    atom.run("Tree", metric=metric)
+    pytest.raises(PermissionError, atom.plot_hyperband)
+    atom.hyperband(["Tree", "LGB"], metric=metric)
+    atom.plot_hyperband(display=False)
 
 
 @pytest.mark.parametrize("metric", ["r2", ["r2", "max_error"]])
@@ -441,6 +454,14 @@ def test_plot_permutation_importance():
     atom.lgb.plot_permutation_importance(display=False)
 
 
+def test_plot_permutation_importance_sparse():
+    """Assert that the plot_permutation_importance method works for sparse data."""
+    atom = ATOMClassifier(X10_str, y10, random_state=1)
+    atom.encode(max_onehot=4, return_sparse=True)
+    atom.run("LR")
+    atom.plot_permutation_importance(display=False)
+
+
 @pytest.mark.parametrize("columns", [(("ash", "alcohol"), 2, "ash"), ("ash", 2), 2])
 def test_plot_partial_dependence(columns):
     """Assert that the plot_partial_dependence method work as intended."""
@@ -0,0 +1,180 @@
+# coding: utf-8
+
+"""
+Automated Tool for Optimized Modelling (ATOM)
+Author: Mavs
+Description: Unit tests for serving.py
+
+"""
+
+# Standard packages
+import json
+import pytest
+import numpy as np
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+# Own modules
+from atom import ATOMClassifier
+from atom.serving import Histogram, InferenceServer
+from .utils import X_bin, y_bin
+
+
+@pytest.fixture
+def pipeline():
+    """Get a fitted pipeline from atom."""
+    atom = ATOMClassifier(X_bin, y_bin, random_state=1)
+    atom.scale()
+    atom.run("LR")
+    return atom.lr.export_pipeline()
+
+
+def post(server, body):
+    """Send a prediction request to the server."""
+    request = Request(server.url + "/predict", data=body, method="POST")
+    return json.loads(urlopen(request).read())
+
+
+# Test Histogram =================================================== >>
+
+def test_histogram():
+    """Assert that the observations are added to the correct bucket."""
+    histogram = Histogram([1, 5, 10])
+    for value in (0.5, 1, 3, 20):
+        histogram.add(value)
+    assert histogram.to_dict() == dict(
+        buckets=[1, 5, 10, "inf"], counts=[2, 1, 0, 1], count=4, sum=24.5
+    )
+
+
+# Test InferenceServer ============================================= >>
+
+def test_method_not_available(pipeline):
+    """Assert that an error is raised when the pipeline has no method."""
+    pytest.raises(AttributeError, InferenceServer, pipeline, method="invalid")
+
+
+def test_invalid_max_batch_size(pipeline):
+    """Assert that an error is raised when max_batch_size is invalid."""
+    pytest.raises(ValueError, InferenceServer, pipeline, max_batch_size=0)
+
+
+def test_invalid_max_wait(pipeline):
+    """Assert that an error is raised when max_wait is invalid."""
+    pytest.raises(ValueError, InferenceServer, pipeline, max_wait=-1)
+
+
+def test_start_port_in_use(pipeline):
+    """Assert that an error is raised when the port is already in use."""
+    server = InferenceServer(pipeline, port=0).start()
+    pytest.raises(OSError, InferenceServer(pipeline, port=server.port).start)
+    server.stop()
+
+
+def test_micro_batches(pipeline):
+    """Assert that concurrent requests are coalesced in batches."""
+    server = InferenceServer(
+        pipeline=pipeline,
+        columns=list(X_bin.columns),
+        max_batch_size=16,
+        max_wait=0.1,
+        port=0,
+    ).start()
+
+    pred = {}
+
+    def predict(i):
+        body = json.dumps({"data": X_bin.iloc[i].tolist()}).encode()
+        pred[i] = post(server, body)["predictions"]
+
+    threads = [Thread(target=predict, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.stop()
+
+    expected = pipeline.predict_proba(X_bin.iloc[:20])
+    np.testing.assert_array_almost_equal([pred[i] for i in range(20)], expected)
+    assert server.latency.count == 20
+    assert server.batch_size.sum == 20
+    assert server.batch_size.count < 20
+
+
+def test_predict_records(pipeline):
+    """Assert that rows can be provided as json objects."""
+    server = InferenceServer(pipeline, method="predict", port=0).start()
+    records = X_bin.iloc[:3].to_dict(orient="records")
+    pred = post(server, json.dumps({"data": records}).encode())["predictions"]
+    server.stop()
+    assert pred == list(pipeline.predict(X_bin.iloc[:3]))
+
+
+def test_metrics_and_health(pipeline):
+    """Assert that the metrics and health endpoints work."""
+    server = InferenceServer(pipeline, columns=list(X_bin.columns), port=0).start()
+    post(server, json.dumps({"data": X_bin.iloc[0].tolist()}).encode())
+    metrics = json.loads(urlopen(server.url + "/metrics").read())
+    health = json.loads(urlopen(server.url + "/health").read())
+    server.stop()
+    assert metrics["latency"]["count"] == 1
+    assert metrics["batch_size"]["sum"] == 1
+    assert health == {"status": "ok"}
+
+
+def test_invalid_requests(pipeline):
+    """Assert that invalid requests return the right status codes."""
+    server = InferenceServer(pipeline, port=0).start()
+    with pytest.raises(HTTPError, match="404"):
+        urlopen(server.url + "/invalid")
+    with pytest.raises(HTTPError, match="400"):
+        post(server, b"not json")
+    with pytest.raises(HTTPError, match="500"):
+        post(server, json.dumps({"data": [1, 2]}).encode())
+    server.stop()
+
+
+def test_malformed_rows_are_rejected(pipeline):
+    """Assert that requests with malformed rows return status 400."""
+    server = InferenceServer(pipeline, columns=list(X_bin.columns), port=0).start()
+    with pytest.raises(HTTPError, match="400"):
+        post(server, json.dumps({"data": [1, 2]}).encode())
+    with pytest.raises(HTTPError, match="400"):
+        rows = [X_bin.iloc[0].tolist(), X_bin.iloc[:1].to_dict(orient="records")[0]]
+        post(server, json.dumps({"data": rows}).encode())
+    server.stop()
+
+
+def test_failed_request_in_batch(pipeline):
+    """Assert that a failing request doesn't fail the rest of its batch."""
+    server = InferenceServer(
+        pipeline=pipeline,
+        columns=list(X_bin.columns),
+        max_batch_size=16,
+        max_wait=0.2,
+        port=0,
+    ).start()
+
+    status = {}
+
+    def predict(i, row):
+        try:
+            status[i] = post(server, json.dumps({"data": row}).encode())
+        except HTTPError as ex:
+            status[i] = ex.code
+
+    # The second row has the right length, but fails in the pipeline
+    rows = [X_bin.iloc[0].tolist(), ["a"] * X_bin.shape[1], X_bin.iloc[1].tolist()]
+    threads = [Thread(target=predict, args=(i, r)) for i, r in enumerate(rows)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.stop()
+
+    assert server.batch_size.count == 1  # All requests were coalesced
+    assert status[1] == 500
+    expected = pipeline.predict_proba(X_bin.iloc[:2])
+    np.testing.assert_array_almost_equal(status[0]["predictions"], expected[0])
+    np.testing.assert_array_almost_equal(status[2]["predictions"], expected[1])
@@ -14,6 +14,8 @@ import pytest
 from atom.training import (
     DirectClassifier,
     DirectRegressor,
+    HyperbandClassifier,
+    HyperbandRegressor,
     SuccessiveHalvingClassifier,
     SuccessiveHalvingRegressor,
     TrainSizingClassifier,
@@ -59,6 +61,106 @@ def test_models_are_restored():
     assert all(m in sh.models for m in ("Tree4", "RF2", "AdaB1"))
 
 
+def test_invalid_resource():
+    """Assert that an error is raised when resource is invalid."""
+    sh = SuccessiveHalvingRegressor(["OLS", "BR"], resource="invalid")
+    pytest.raises(ValueError, sh.run, reg_train, reg_test)
+
+
+def test_resource_iterations_without_resource_parameter():
+    """Assert that an error is raised for models without a resource."""
+    sh = SuccessiveHalvingRegressor(["OLS", "RF"], resource="iterations")
+    pytest.raises(ValueError, sh.run, reg_train, reg_test)
+
+
+def test_resource_iterations():
+    """Assert that the iterations are budgeted instead of the samples."""
+    sh = SuccessiveHalvingRegressor(["RF", "ET"], resource="iterations")
+    sh.run(reg_train, reg_test)
+    assert sh.rf2.estimator.n_estimators == 50
+    assert sh.et2.estimator.n_estimators == 50
+    assert len(sh.rf2.train) == len(sh.train)
+    model = next(m for m in sh._models.values() if m.name.endswith("1"))
+    assert model.estimator.n_estimators == 100
+
+
+def test_warm_start_estimator():
+    """Assert that the estimators continue from the previous run."""
+    sh = SuccessiveHalvingRegressor(
+        models=["RF", "ET"],
+        warm_start=True,
+        resource="iterations",
+        random_state=1,
+    )
+    sh.run(reg_train, reg_test)
+    model = next(m for m in sh._models.values() if m.name.endswith("1"))
+    assert model._warm_start.name == model.acronym + "2"
+    assert len(model.estimator.estimators_) == 100
+    assert not model.estimator.warm_start
+    assert len(model._warm_start.estimator.estimators_) == 50
+
+
+def test_warm_start_bo():
+    """Assert that the BO starts from the calls of the previous run."""
+    sh = SuccessiveHalvingRegressor(
+        models=["Tree", "RF"],
+        n_calls=3,
+        n_initial_points=1,
+        warm_start=True,
+        random_state=1,
+    )
+    sh.run(reg_train, reg_test)
+    model = next(m for m in sh._models.values() if m.name.endswith("1"))
+    assert len(model._warm_start._trials.points) == 3
+    assert len(model.bo) == 3
+
+
+def test_hb_invalid_eta():
+    """Assert that an error is raised when eta < 2."""
+    hb = HyperbandRegressor("Tree", eta=1)
+    pytest.raises(ValueError, hb.run, reg_train, reg_test)
+
+
+@pytest.mark.parametrize("min_resource", [0, 1])
+def test_hb_invalid_min_resource(min_resource):
+    """Assert that an error is raised when min_resource is not in (0, 1)."""
+    hb = HyperbandRegressor("Tree", min_resource=min_resource)
+    pytest.raises(ValueError, hb.run, reg_train, reg_test)
+
+
+def test_hb_invalid_sampler():
+    """Assert that an error is raised when sampler is invalid."""
+    hb = HyperbandRegressor("Tree", sampler="invalid")
+    pytest.raises(ValueError, hb.run, reg_train, reg_test)
+
+
+def test_hb_brackets():
+    """Assert that all brackets and rungs are evaluated."""
+    hb = HyperbandRegressor("Tree", eta=3, min_resource=0.1, random_state=1)
+    hb.run(reg_train, reg_test)
+    assert len(hb.tree.bo) == 9 + 3 + 1 + 5 + 1 + 3  # Configs per rung
+    assert sorted(hb.tree.bo["budget"].unique()) == [1 / 9, 1 / 3, 1]
+    assert not hb.tree.bo["pruned"].any()  # Lower rungs aren't pruned
+    completed = hb.tree.bo[hb.tree.bo["budget"] == 1]
+    assert hb.tree.best_params in list(completed["params"])
+
+
+def test_hb_resource_iterations():
+    """Assert that the iterations are budgeted instead of the samples."""
+    hb = HyperbandRegressor("RF", resource="iterations", random_state=1)
+    hb.run(reg_train, reg_test)
+    n_estimators = [p["n_estimators"] for p in hb.rf.bo["params"]]
+    assert min(n_estimators) == 11 and max(n_estimators) == 100
+
+
+def test_hb_bohb_sampler():
+    """Assert that the configurations can be sampled with BOHB."""
+    hb = HyperbandClassifier("Tree", min_resource=0.03, sampler="bohb", random_state=1)
+    hb.run(bin_train, bin_test)
+    assert hb.tree.best_params
+    assert len(hb.tree.bo) > 27
+
+
 def test_ts_int_train_sizes():
     """Assert that train sizing accepts different types as sizes."""
     sh = TrainSizingClassifier("Tree", train_sizes=5, random_state=1)
@@ -75,6 +177,31 @@ def test_ts_different_train_sizes_types():
     assert len(sh.tree065.train) == 200
 
 
+def test_ts_warm_start_estimator():
+    """Assert that estimators with partial_fit continue on the new rows."""
+    ts = TrainSizingClassifier(["GNB", "Tree"], warm_start=True, random_state=1)
+    ts.run(bin_train, bin_test)
+    assert ts.gnb10._warm_start is ts.gnb08
+    assert ts.gnb10.estimator.class_count_.sum() == len(ts.gnb10.train)
+    assert ts.gnb10.estimator is not ts.gnb08.estimator
+    assert ts.gnb08.estimator.class_count_.sum() == len(ts.gnb08.train)
+
+
+def test_ts_warm_start_bo():
+    """Assert that the BO starts from the calls of the previous run."""
+    ts = TrainSizingClassifier(
+        models="Tree",
+        train_sizes=[0.5, 1.0],
+        warm_start=True,
+        n_calls=3,
+        n_initial_points=1,
+        random_state=1,
+    )
+    ts.run(bin_train, bin_test)
+    assert len(ts.tree10._warm_start._trials.points) == 3
+    assert len(ts.tree10.bo) == 3
+
+
 # Test goals ======================================================= >>
 
 def test_goals_trainers():
@@ -95,6 +222,15 @@ def test_goals_successive_halving():
     assert sh.goal == "reg"
 
 
+def test_goals_hyperband():
+    """Assert that the goal of every Hyperband class is set correctly."""
+    hb = HyperbandClassifier("LR")
+    assert hb.goal == "class"
+
+    hb = HyperbandRegressor("OLS")
+    assert hb.goal == "reg"
+
+
 def test_goals_train_sizing():
     """Assert that the goal of every TrainSizing class is set correctly."""
     ts = TrainSizingClassifier("LR")
@@ -10,13 +10,21 @@ Description: Unit tests for utils.py
 # Standard packages
 import pytest
 import pandas as pd
+from scipy import sparse
 from datetime import datetime, timedelta
 from sklearn.base import BaseEstimator
+from sklearn.metrics import (
+    get_scorer, make_scorer, average_precision_score, brier_score_loss,
+)
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
 
 # Own modules
 from atom.utils import (
-    time_to_str, check_is_fitted, create_acronym, NotFittedError, CustomDict,
+    time_to_str, check_is_fitted, create_acronym, arr, get_scores,
+    get_chunks, write_chunks, NotFittedError, TrialRecord, CustomDict,
 )
+from .utils import FILE_DIR, X_bin, y_bin
 
 
 def test_time_to_string():
@@ -42,6 +50,102 @@ def test_create_acronym():
     assert create_acronym("Customclass") == "Customclass"
 
 
+def test_arr_sparse():
+    """Assert that sparse columns are converted to the right format."""
+    X = X_bin.iloc[:, :3].copy()
+    X["sparse"] = pd.arrays.SparseArray([0, 1] * 284 + [0])
+    assert sparse.isspmatrix_csr(arr(X, accept_sparse=True))
+    assert arr(X, accept_sparse=True).shape == X.shape
+    assert not any(isinstance(dtype, pd.SparseDtype) for dtype in arr(X).dtypes)
+    assert arr(X_bin, accept_sparse=True) is X_bin
+
+
+def test_get_scores():
+    """Assert that the scores equal those of the scorers."""
+    tree = DecisionTreeClassifier(random_state=1).fit(X_bin, y_bin)
+    scorers = [get_scorer(m) for m in ("f1", "roc_auc", "neg_log_loss")]
+    scores = get_scores(tree, X_bin, y_bin, scorers)
+    assert scores == [scorer(tree, X_bin, y_bin) for scorer in scorers]
+
+
+@pytest.mark.parametrize("est", [DecisionTreeClassifier(), LogisticRegression()])
+def test_get_scores_pos_label(est):
+    """Assert that the positive class of the scorers is used."""
+    est = est.fit(X_bin, y_bin)
+    scorers = [
+        make_scorer(brier_score_loss, needs_proba=True, pos_label=0),
+        make_scorer(average_precision_score, needs_threshold=True, pos_label=0),
+        make_scorer(average_precision_score, needs_threshold=True, pos_label=1),
+    ]
+    scores = get_scores(est, X_bin, y_bin, scorers)
+    assert scores == [scorer(est, X_bin, y_bin) for scorer in scorers]
+
+
+def test_get_chunks():
+    """Assert that the data is read in chunks."""
+    pytest.raises(ValueError, next, get_chunks(X_bin, chunksize=0))
+    assert [len(c) for c in get_chunks(X_bin, 200)] == [200, 200, 169]
+    assert len(list(get_chunks(iter([X_bin, X_bin]), None))) == 2
+    assert len(list(get_chunks(iter([X_bin.values]), 300))) == 2
+
+
+@pytest.mark.parametrize("file", ["chunks.csv", "chunks.parquet"])
+def test_write_chunks(file):
+    """Assert that the chunks are written and read back."""
+    write_chunks(get_chunks(X_bin, 200), FILE_DIR + file)
+    chunks = list(get_chunks(FILE_DIR + file, 250))
+    assert [len(c) for c in chunks] == [250, 250, 69]
+
+
+def test_trial_record():
+    """Assert that the record keeps track of the calls."""
+    record = TrialRecord()
+    assert record.to_df().empty
+    record.append(call="1", params={"a": 1, "b": "x"}, score=0.5, pruned=False)
+    record.append(call="2", params={"b": "x", "a": 1}, score=0.7, pruned=False)
+    record.append(call="3", params={"a": 2, "b": "y"}, score=0.6, pruned=False)
+    assert len(record) == 3
+    assert {"a": 2, "b": "y"} in record
+    assert {"a": 3, "b": "y"} not in record
+    assert record.get({"a": 1, "b": "x"})["call"] == "1"
+    assert record.best[0] == 0.7
+    assert record.to_df() is record.to_df()  # Dataframe is cached
+    assert list(record.to_df()["score"]) == [0.5, 0.7, 0.6]
+
+
+def test_trial_record_pruned():
+    """Assert that pruned calls don't count towards the best score."""
+    record = TrialRecord()
+    record.append(call="1", params={"a": 1}, score=0.8, pruned=True)
+    assert record.best[0] == 0.8  # Falls back to the pruned calls
+    assert record.worst is None
+    record.append(call="2", params={"a": 2}, score=0.5, pruned=False)
+    record.append(call="3", params={"a": 3}, score=0.6, pruned=False)
+    record.append(call="4", params={"a": 4}, score=0.9, pruned=True)
+    assert record.best[0] == 0.6
+    assert record.worst[0] == 0.5
+
+
+def test_trial_record_points():
+    """Assert that only completed calls with a point are returned."""
+    record = TrialRecord()
+    record.append(call="1", x=[1], params={"a": 1}, score=0.5, pruned=False)
+    record.append(call="2", x=[2], params={"a": 2}, score=0.3, pruned=True)
+    record.append(call="3", params={"a": 3}, score=0.6, pruned=False)
+    assert record.points == [([1], 0.5)]
+    assert "x" not in record.to_df()
+
+
+def test_trial_record_budget():
+    """Assert that calls with a partial budget don't count as completed."""
+    record = TrialRecord(["call", "budget", *TrialRecord.columns[1:]])
+    record.append(call="1", x=[1], budget=1 / 3, params={"a": 1}, score=0.9)
+    assert record.best[0] == 0.9  # Falls back to the incomplete calls
+    record.append(call="2", x=[2], budget=1, params={"a": 2}, score=0.5)
+    assert record.best[0] == 0.5
+    assert record.points == [([2], 0.5)]
+
+
 def test_custom_dict_initialization():
     """Assert that the custom dictionary can be initialized like any dict."""
     assert str(CustomDict({"a": 0, "b": 1})) == "{'a': 0, 'b': 1}"